@@ -0,0 +1,60 @@
+"""Startup benchmark for the on-disk AST cache.
+
+Generates a large library of functions in a temporary directory and times
+how long it takes to get a runnable program from it: parsing from scratch
+(cold), and reusing the entry written to __kozakcache__ (warm).
+
+Usage:
+    python benchmarks/ast_cache_bench.py
+    python benchmarks/ast_cache_bench.py --functions 2000 --repeat 5
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import bench_utils  # noqa: F401  (puts the repository on sys.path)
+from core.ast_cache import load_program, parse_program, cache_path
+
+
+LIBRARY_FUNCTION = '''Function helper_{index}(a, b) {{
+    total := 0;
+    For (i := 0; i < a; i++) {{
+        If (i % 2 == 0) {{ total := total + i * b; }} Else {{ total := total - b; }}
+    }}
+    Return [total, "helper_{index}", a + b];
+}}
+'''
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure parse time with and without the AST cache')
+    arg_parser.add_argument('--functions', type=int, default=1000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    code = 'Chief\n' + ''.join(LIBRARY_FUNCTION.format(index=i) for i in range(args.functions))
+
+    with tempfile.TemporaryDirectory() as directory:
+        source_path = os.path.join(directory, 'library.kozak')
+        with open(source_path, 'w', encoding='utf-8') as f:
+            f.write(code)
+
+        cold = min(timed(lambda: parse_program(code)) for _ in range(args.repeat))
+        load_program(source_path, code)  # write the entry
+        warm = min(timed(lambda: load_program(source_path, code)) for _ in range(args.repeat))
+        size = os.path.getsize(cache_path(source_path))
+
+    print(f"{args.functions} functions, {len(code)} chars of source")
+    print(f"parse (cold)   {cold * 1000:8.1f} ms")
+    print(f"cache (warm)   {warm * 1000:8.1f} ms  ({cold / warm:.1f}x faster, {size // 1024} KiB entry)")
+
+
+if __name__ == '__main__':
+    main()
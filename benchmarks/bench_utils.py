@@ -0,0 +1,46 @@
+"""Shared helpers for the KozakScript benchmarks."""
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from core.lexer import lex
+from core.parser import Parser
+from core.optimizer import optimize
+from core.resolver import resolve
+from core.interpreter import Interpreter
+from core.compiler import ClosureInterpreter
+from core.vm import VirtualMachine
+
+ENGINES = {
+    'tree': Interpreter,
+    'closure': ClosureInterpreter,
+    'vm': VirtualMachine,
+}
+
+
+def parse_source(code):
+    """Lex and parse KozakScript source, failing loudly on parser errors."""
+    parser = Parser(list(lex(code)))
+    ast = parser.parse()
+    if parser.errors:
+        raise SyntaxError('\n'.join(parser.errors))
+    resolve(optimize(ast))
+    return ast, parser.detected_dialect
+
+
+def run_source(code, interpreter_class=Interpreter):
+    """Parse and execute source; returns the interpreter and elapsed execution time."""
+    ast, dialect = parse_source(code)
+    interpreter = interpreter_class(parent_dialect=dialect)
+    start = time.perf_counter()
+    interpreter.eval(ast)
+    return interpreter, time.perf_counter() - start
+
+
+def best_of(repeat, func):
+    """Run func() `repeat` times and return the fastest elapsed time it reports."""
+    return min(func() for _ in range(repeat))
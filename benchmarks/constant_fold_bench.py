@@ -0,0 +1,67 @@
+"""Benchmark for the constant folding pass.
+
+Runs a loop full of constant sub-expressions, a constant If and a
+Doki (Nepravda) loop, once on the tree as parsed and once after
+core.optimizer has folded it.
+
+Usage:
+    python benchmarks/constant_fold_bench.py
+    python benchmarks/constant_fold_bench.py --iterations 100000 --engine vm
+"""
+import argparse
+import time
+
+from bench_utils import best_of, ENGINES
+from core.lexer import lex
+from core.parser import Parser
+from core.optimizer import optimize
+from core.resolver import resolve
+
+
+PROGRAM = '''Hetman
+total := 0.0;
+Dlya (i := 0; i < {iterations}; i++) {{
+    r := i % 10;
+    total := total + 2 * 3.14 * r + 60 * 60 * 24 - Chyslo("86400");
+    Yakscho (Pravda) {{
+        total := total + (1 + 2) * 3;
+    }} Inakshe {{
+        total := total - 1;
+    }}
+    Doki (Nepravda) {{
+        total := 0;
+    }}
+}}
+'''
+
+
+def run(code, engine, fold):
+    parser = Parser(list(lex(code)))
+    ast = parser.parse()
+    if fold:
+        optimize(ast)
+    resolve(ast)
+    interpreter = engine(parent_dialect=parser.detected_dialect)
+    start = time.perf_counter()
+    interpreter.eval(ast)
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure the effect of constant folding')
+    arg_parser.add_argument('--iterations', type=int, default=50_000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--engine', choices=sorted(ENGINES), default='tree')
+    args = arg_parser.parse_args()
+
+    code = PROGRAM.format(iterations=args.iterations)
+    engine = ENGINES[args.engine]
+    for fold in (False, True):
+        elapsed = best_of(args.repeat, lambda: run(code, engine, fold))
+        label = 'folded' if fold else 'as parsed'
+        print(f"[{args.engine}] {label:<10} {elapsed:.3f} s "
+              f"({elapsed / args.iterations * 1e6:.2f} us/iteration)")
+
+
+if __name__ == '__main__':
+    main()
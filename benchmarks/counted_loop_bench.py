@@ -0,0 +1,68 @@
+"""Benchmark for range-driven counted Dlya loops.
+
+Runs nested `Dlya (i := 0; i < n; i++)` loops with a small arithmetic
+body, once as the optimizer marks them (driven by range()) and once with
+the marks removed, so every iteration evaluates the condition and step.
+
+Usage:
+    python benchmarks/counted_loop_bench.py
+    python benchmarks/counted_loop_bench.py --size 500 --engine closure
+"""
+import argparse
+import dataclasses
+import time
+
+from bench_utils import parse_source, best_of, ENGINES
+from core.ast import KozakFor
+
+
+PROGRAM = '''Hetman
+total := 0;
+Dlya (i := 0; i < {size}; i++) {{
+    Dlya (j := {size}; j > 0; j--) {{
+        total := total + i * j % 7;
+    }}
+}}
+'''
+
+
+def clear_counters(node):
+    if isinstance(node, (list, tuple)):
+        for item in node:
+            clear_counters(item)
+    elif dataclasses.is_dataclass(node):
+        if isinstance(node, KozakFor):
+            node.counter = None
+        for field in dataclasses.fields(node):
+            clear_counters(getattr(node, field.name))
+
+
+def run(code, engine, counted):
+    ast, dialect = parse_source(code)
+    if not counted:
+        clear_counters(ast)
+    interpreter = engine(parent_dialect=dialect)
+    start = time.perf_counter()
+    interpreter.eval(ast)
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure counted Dlya loop throughput')
+    arg_parser.add_argument('--size', type=int, default=300)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--engine', choices=sorted(ENGINES), default='tree')
+    args = arg_parser.parse_args()
+
+    code = PROGRAM.format(size=args.size)
+    iterations = args.size * args.size
+    engine = ENGINES[args.engine]
+    for counted in (False, True):
+        elapsed = best_of(args.repeat, lambda: run(code, engine, counted))
+        label = 'range()' if counted else 'stepping'
+        print(f"[{args.engine}] {label:<9} {iterations} iterations: {elapsed:.3f} s "
+              f"({elapsed / iterations * 1e6:.2f} us/iteration)")
+
+
+if __name__ == '__main__':
+    main()
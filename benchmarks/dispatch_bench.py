@@ -0,0 +1,42 @@
+"""Microbenchmark for Interpreter.eval node dispatch.
+
+Runs a Doki (while) loop doing integer arithmetic and reports the time per
+iteration. Every iteration evaluates a comparison, several binary operations,
+numbers and variables, so the cost of resolving each node's handler shows up
+directly in the result.
+
+Usage:
+    python benchmarks/dispatch_bench.py
+    python benchmarks/dispatch_bench.py --iterations 500000
+    python benchmarks/dispatch_bench.py --engine closure
+"""
+import argparse
+
+from bench_utils import run_source, best_of, ENGINES
+
+
+PROGRAM = '''Hetman
+i := 0;
+suma := 0;
+Doki (i < {iterations}) {{
+    suma := suma + i * 3 - (i % 7) + 2;
+    i := i + 1;
+}}
+'''
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure Doki loop throughput')
+    arg_parser.add_argument('--iterations', type=int, default=200_000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--engine', choices=sorted(ENGINES), default='tree')
+    args = arg_parser.parse_args()
+
+    code = PROGRAM.format(iterations=args.iterations)
+    elapsed = best_of(args.repeat, lambda: run_source(code, ENGINES[args.engine])[1])
+    print(f"[{args.engine}] Doki loop, {args.iterations} iterations: {elapsed:.3f} s "
+          f"({elapsed / args.iterations * 1e6:.2f} us/iteration)")
+
+
+if __name__ == '__main__':
+    main()
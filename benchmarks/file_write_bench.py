@@ -0,0 +1,63 @@
+"""Benchmark for writing a log file line by line.
+
+Appends lines to a file in a temporary directory, once with one-shot
+Write(path, text, Pravda) calls and once through a handle from Open,
+then closes the interpreter's files the way main.run_code does.
+
+Usage:
+    python benchmarks/file_write_bench.py
+    python benchmarks/file_write_bench.py --lines 100000 --engine closure
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from bench_utils import parse_source, best_of, ENGINES
+
+
+ONE_SHOT = '''Chief
+For (i := 0; i < {lines}; i++) {{
+    Write("{path}", "request " + i + " handled;", True);
+}}
+'''
+
+HANDLE = '''Chief
+log := Open("{path}", "a", 65536);
+For (i := 0; i < {lines}; i++) {{
+    Write(log, "request " + i + " handled;");
+}}
+Close(log);
+'''
+
+
+def run(code, engine, path):
+    if os.path.exists(path):
+        os.remove(path)
+    ast, dialect = parse_source(code)
+    interpreter = engine(parent_dialect=dialect)
+    start = time.perf_counter()
+    interpreter.eval(ast)
+    interpreter.close_files()
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure line-by-line file writing')
+    arg_parser.add_argument('--lines', type=int, default=20_000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--engine', choices=sorted(ENGINES), default='tree')
+    args = arg_parser.parse_args()
+
+    engine = ENGINES[args.engine]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'server.log').replace('\\', '/')
+        for label, program in (('Write(path)', ONE_SHOT), ('Open handle', HANDLE)):
+            code = program.format(lines=args.lines, path=path)
+            elapsed = best_of(args.repeat, lambda: run(code, engine, path))
+            print(f"[{args.engine}] {label:<12} {args.lines} lines: {elapsed * 1000:.1f} ms "
+                  f"({elapsed / args.lines * 1e6:.2f} us/line)")
+
+
+if __name__ == '__main__':
+    main()
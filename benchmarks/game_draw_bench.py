@@ -0,0 +1,95 @@
+"""Benchmark for game module draw calls.
+
+Draws a grid of rectangles every frame into an off-screen window (SDL's
+dummy video driver) and reports the time per frame, which is dominated by
+the cost of getting from a KozakScript call to the pygame function. The
+same grid is then drawn with one draw_rects call per frame, and a last
+scene draws HUD-style text: labels that never change and a score that
+changes every few frames.
+
+Usage:
+    python benchmarks/game_draw_bench.py
+    python benchmarks/game_draw_bench.py --shapes 1000 --frames 60 --engine vm
+    KOZAK_GAME_TEXT_CACHE=0 python benchmarks/game_draw_bench.py   # text without the surface cache
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from bench_utils import parse_source, best_of, ENGINES
+import core.modules.game_module  # built-in modules load lazily; keep the pygame import out of the timings
+
+
+RECTS = '''Chief
+Import("game");
+game.create_window(640, 480, "bench");
+For (frame := 0; frame < {frames}; frame++) {{
+    game.fill(game.BLACK);
+    For (i := 0; i < {shapes}; i++) {{
+        game.draw_rect(game.GREEN, i % 32 * 20, i / 32 * 20, 18, 18);
+    }}
+    game.update();
+}}
+game.close();
+'''
+
+BATCHED = '''Chief
+Import("game");
+game.create_window(640, 480, "bench");
+rects := [];
+For (i := 0; i < {shapes}; i++) {{
+    append(rects, [game.GREEN, i % 32 * 20, i / 32 * 20, 18, 18]);
+}}
+For (frame := 0; frame < {frames}; frame++) {{
+    game.fill(game.BLACK);
+    game.draw_rects(rects);
+    game.update();
+}}
+game.close();
+'''
+
+TEXT = '''Chief
+Import("game");
+game.create_window(640, 480, "bench");
+For (frame := 0; frame < {frames}; frame++) {{
+    game.fill(game.BLACK);
+    For (i := 0; i < {shapes}; i++) {{
+        game.draw_text("Label " + i % 20, i % 8 * 80, i / 8 * 10, game.WHITE, 18);
+    }}
+    game.draw_text("Score: " + frame / 5, 10, 450, game.YELLOW, 32);
+    game.update();
+}}
+game.close();
+'''
+
+
+def run(code, engine):
+    ast, _ = parse_source(code)
+    # main.py hands the interpreter the dialect DialectChecker found; the game module enforces it
+    interpreter = engine(parent_dialect='english')
+    start = time.perf_counter()
+    interpreter.eval(ast)
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure game draw calls per frame')
+    arg_parser.add_argument('--shapes', type=int, default=500)
+    arg_parser.add_argument('--frames', type=int, default=30)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--engine', choices=sorted(ENGINES), default='tree')
+    args = arg_parser.parse_args()
+
+    engine = ENGINES[args.engine]
+    for label, program in (('rects', RECTS), ('batch', BATCHED), ('text', TEXT)):
+        code = program.format(shapes=args.shapes, frames=args.frames)
+        elapsed = best_of(args.repeat, lambda: run(code, engine))
+        print(f"[{args.engine}] {label:<6} {args.shapes} x {args.frames} frames: "
+              f"{elapsed / args.frames * 1000:.2f} ms/frame "
+              f"({elapsed / (args.shapes * args.frames) * 1e6:.2f} us/shape)")
+
+if __name__ == '__main__':
+    main()
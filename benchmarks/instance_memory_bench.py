@@ -0,0 +1,69 @@
+"""Memory-per-instance benchmark for KozakScript objects.
+
+Allocates N instances of a class with three constructor fields (plus one
+field added later, outside the constructor) and keeps them alive in an
+array. The field values are small shared integers, so the reported bytes
+per instance are the object itself, its field storage and its array slot.
+
+Usage:
+    python benchmarks/instance_memory_bench.py
+    python benchmarks/instance_memory_bench.py --instances 200000
+"""
+import argparse
+import gc
+import tracemalloc
+
+from bench_utils import run_source
+
+
+PARTICLE_PROGRAM = '''Chief
+Class Particle {{
+    Constructor(x, y, speed) {{
+        this.x := x;
+        this.y := y;
+        this.speed := speed;
+    }}
+}}
+particles := [];
+For (i := 0; i < {instances}; i++) {{
+    p := new Particle(1, 2, 3);
+    append(particles, p);
+}}
+{extra}
+'''
+
+EXTRA_FIELD = '''For (i := 0; i < {instances}; i++) {{
+    p := particles[i];
+    p.tag := 4;
+}}
+'''
+
+
+def measure(instances, extra_field):
+    extra = EXTRA_FIELD.format(instances=instances) if extra_field else ''
+    code = PARTICLE_PROGRAM.format(instances=instances, extra=extra)
+    gc.collect()
+    tracemalloc.start()
+    interpreter, elapsed = run_source(code)
+    gc.collect()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del interpreter
+    return allocated, elapsed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure memory used per object instance')
+    arg_parser.add_argument('--instances', type=int, default=100_000)
+    args = arg_parser.parse_args()
+
+    for extra_field in (False, True):
+        baseline, _ = measure(0, extra_field)
+        allocated, elapsed = measure(args.instances, extra_field)
+        per_instance = (allocated - baseline) / args.instances
+        label = 'constructor fields + 1 dynamic' if extra_field else 'constructor fields only'
+        print(f"{label:<32} {per_instance:>8.1f} bytes/instance  ({elapsed:.2f} s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Lexer scaling benchmark for KozakScript.
+
+Lexes generated programs of 1k, 10k, 100k and 1M lines and prints the time
+per line. The time per line should stay roughly flat as the file grows.
+
+Usage:
+    python benchmarks/lexer_bench.py
+    python benchmarks/lexer_bench.py --max-lines 100000
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.lexer import lex
+
+
+SNIPPET_LINES = [
+    'x := 10 + y * 2;',
+    'Spivaty("Row", x, "done");',
+    '/* block',
+    '   comment */',
+    'Yakscho (x > 5) { x := x - 1; } // trailing comment',
+    'dani := {"imya": "Bohdan", "vik": 30};',
+]
+
+
+def generate_program(line_count):
+    lines = ['Hetman']
+    while len(lines) < line_count:
+        lines.extend(SNIPPET_LINES)
+    return '\n'.join(lines[:line_count])
+
+
+def time_lex(code):
+    start = time.perf_counter()
+    token_count = sum(1 for _ in lex(code))
+    return time.perf_counter() - start, token_count
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure lexer scaling')
+    arg_parser.add_argument('--max-lines', type=int, default=1_000_000,
+                            help='Largest program size to lex (default: 1000000)')
+    args = arg_parser.parse_args()
+
+    sizes = [size for size in (1_000, 10_000, 100_000, 1_000_000) if size <= args.max_lines]
+
+    print(f"{'lines':>10} {'tokens':>10} {'seconds':>10} {'us/line':>10}")
+    for size in sizes:
+        code = generate_program(size)
+        elapsed, token_count = time_lex(code)
+        print(f"{size:>10} {token_count:>10} {elapsed:>10.3f} {elapsed / size * 1e6:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
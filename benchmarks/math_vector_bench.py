@@ -0,0 +1,46 @@
+"""Benchmark for array arguments to the math module.
+
+Takes the square root of every element of an array and sums the result,
+once with a KozakScript loop calling math.sqrt per element and once by
+passing the whole array to math.sqrt and math.sum.
+
+Usage:
+    python benchmarks/math_vector_bench.py
+    python benchmarks/math_vector_bench.py --size 200000 --engine vm
+"""
+import argparse
+
+from bench_utils import run_source, best_of, ENGINES
+
+
+SETUP = '''Chief
+Import("math");
+values := create_matrix(1, {size}, 2.25)[0];
+'''
+
+LOOP = SETUP + '''total := 0;
+For (i := 0; i < {size}; i++) {{
+    total := total + math.sqrt(values[i]);
+}}
+'''
+
+WHOLE_ARRAY = SETUP + '''total := math.sum(math.sqrt(values));
+'''
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure math functions over whole arrays')
+    arg_parser.add_argument('--size', type=int, default=50_000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--engine', choices=sorted(ENGINES), default='tree')
+    args = arg_parser.parse_args()
+
+    engine = ENGINES[args.engine]
+    for label, program in (('loop', LOOP), ('whole array', WHOLE_ARRAY)):
+        code = program.format(size=args.size)
+        elapsed = best_of(args.repeat, lambda: run_source(code, engine)[1])
+        print(f"[{args.engine}] {label:<12} {args.size} elements: {elapsed * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
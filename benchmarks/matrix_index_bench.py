@@ -0,0 +1,42 @@
+"""Benchmark for nested array indexing.
+
+Fills a matrix from create_matrix and then sums it with `m[i][j]` reads,
+so most of the time goes to two-dimensional indexing.
+
+Usage:
+    python benchmarks/matrix_index_bench.py
+    python benchmarks/matrix_index_bench.py --size 300 --engine vm
+"""
+import argparse
+
+from bench_utils import run_source, best_of, ENGINES
+
+
+PROGRAM = '''Chief
+m := create_matrix({size}, {size}, 1);
+total := 0;
+For (i := 0; i < {size}; i++) {{
+    For (j := 0; j < {size}; j++) {{
+        total := total + m[i][j] * m[j][i];
+    }}
+}}
+'''
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure m[i][j] read throughput')
+    arg_parser.add_argument('--size', type=int, default=200)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--engine', choices=sorted(ENGINES), default='tree')
+    args = arg_parser.parse_args()
+
+    code = PROGRAM.format(size=args.size)
+    engine = ENGINES[args.engine]
+    reads = 2 * args.size * args.size
+    elapsed = best_of(args.repeat, lambda: run_source(code, engine)[1])
+    print(f"[{args.engine}] {reads} nested reads: {elapsed:.3f} s "
+          f"({elapsed / reads * 1e6:.3f} us/read)")
+
+
+if __name__ == '__main__':
+    main()
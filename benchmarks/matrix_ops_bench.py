@@ -0,0 +1,48 @@
+"""Benchmark for elementwise matrix arithmetic.
+
+Adds two matrices and scales the result, once with the nested loops
+programs had to write before (see matrix_add in test_EN.kozak) and once
+with the elementwise matrix operators.
+
+Usage:
+    python benchmarks/matrix_ops_bench.py
+    python benchmarks/matrix_ops_bench.py --size 400 --engine closure
+"""
+import argparse
+
+from bench_utils import run_source, best_of, ENGINES
+
+
+SETUP = '''Chief
+a := create_matrix({size}, {size}, 2);
+b := transpose(create_matrix({size}, {size}, 3.5));
+'''
+
+LOOPS = SETUP + '''result := create_matrix({size}, {size}, 0);
+For (i := 0; i < {size}; i++) {{
+    For (j := 0; j < {size}; j++) {{
+        result[i][j] := (a[i][j] + b[i][j]) * 2;
+    }}
+}}
+'''
+
+ELEMENTWISE = SETUP + '''result := (a + b) * 2;
+'''
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure elementwise matrix arithmetic')
+    arg_parser.add_argument('--size', type=int, default=200)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--engine', choices=sorted(ENGINES), default='tree')
+    args = arg_parser.parse_args()
+
+    engine = ENGINES[args.engine]
+    for label, program in (('loops', LOOPS), ('elementwise', ELEMENTWISE)):
+        code = program.format(size=args.size)
+        elapsed = best_of(args.repeat, lambda: run_source(code, engine)[1])
+        print(f"[{args.engine}] {label:<12} {args.size}x{args.size}: {elapsed * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
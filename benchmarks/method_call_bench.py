@@ -0,0 +1,80 @@
+"""Method call benchmark modelled on Examples/KozakBank.kozak.
+
+A few accounts (a base class and a subclass with protected fields and a
+private helper) take a long series of deposits and withdrawals, so nearly
+all of the time goes into `instance.method(...)` dispatch.
+
+Usage:
+    python benchmarks/method_call_bench.py
+    python benchmarks/method_call_bench.py --operations 50000 --engine closure
+"""
+import argparse
+
+from bench_utils import run_source, best_of, ENGINES
+
+
+BANK_PROGRAM = '''Chief
+Class Account {{
+    Protected Float balance;
+    Constructor(balance) {{
+        this.balance := balance;
+    }}
+    Function Deposit(amount) {{
+        this.balance := this.balance + amount;
+        this.Check();
+    }}
+    Function Withdraw(amount) {{
+        this.balance := this.balance - amount - this.Fee(amount);
+        this.Check();
+    }}
+    Protected Function Fee(amount) {{
+        Return 1;
+    }}
+    Private Function Check() {{
+        If (this.balance < 0) {{ this.balance := 0; }}
+    }}
+    Function GetBalance() {{
+        Return this.balance;
+    }}
+}}
+Class Savings : Account {{
+    Constructor(balance) {{
+        this.balance := balance;
+    }}
+    Protected Function Fee(amount) {{
+        Return 0;
+    }}
+}}
+checking := new Account(100);
+savings := new Savings(100);
+For (i := 0; i < {operations}; i++) {{
+    checking.Deposit(3);
+    checking.Withdraw(2);
+    savings.Deposit(3);
+    savings.Withdraw(2);
+}}
+total := checking.GetBalance() + savings.GetBalance();
+'''
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure instance method call overhead')
+    arg_parser.add_argument('--operations', type=int, default=20_000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--engine', choices=sorted(ENGINES), default='tree')
+    args = arg_parser.parse_args()
+
+    code = BANK_PROGRAM.format(operations=args.operations)
+    calls = args.operations * 4
+
+    def run():
+        interpreter, elapsed = run_source(code, ENGINES[args.engine])
+        return elapsed
+
+    elapsed = best_of(args.repeat, run)
+    print(f"[{args.engine}] {calls} method calls: {elapsed:.3f} s "
+          f"({elapsed / calls * 1e6:.2f} us/call)")
+
+
+if __name__ == '__main__':
+    main()
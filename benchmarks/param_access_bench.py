@@ -0,0 +1,64 @@
+"""Benchmark for reading function parameters.
+
+Calls a function whose body reads its parameters many times, once with the
+program annotated by core.resolver (parameters get depth 0 and are read
+straight from the current frame) and once without the annotation, so every
+read takes the generic lookup path.
+
+Usage:
+    python benchmarks/param_access_bench.py
+    python benchmarks/param_access_bench.py --calls 20000 --engine closure
+"""
+import argparse
+import time
+
+from bench_utils import parse_source, best_of, ENGINES
+from core.lexer import lex
+from core.parser import Parser
+from core.optimizer import optimize
+
+
+PROGRAM = '''Chief
+Function mix(a, b, c, d) {{
+    Return a * b + c * d - a + b - c + d + a * d - b * c;
+}}
+total := 0;
+For (i := 0; i < {calls}; i++) {{
+    total := total + mix(i, 2, 3, 4);
+}}
+'''
+
+
+def parse_unresolved(code):
+    """Parse and optimize like parse_source, but leave every depth unset."""
+    parser = Parser(list(lex(code)))
+    ast = parser.parse()
+    if parser.errors:
+        raise SyntaxError('\n'.join(parser.errors))
+    return optimize(ast), parser.detected_dialect
+
+
+def run(ast, dialect, engine):
+    interpreter = engine(parent_dialect=dialect)
+    start = time.perf_counter()
+    interpreter.eval(ast)
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure parameter reads with and without the resolver')
+    arg_parser.add_argument('--calls', type=int, default=50000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--engine', choices=sorted(ENGINES), default='tree')
+    args = arg_parser.parse_args()
+
+    code = PROGRAM.format(calls=args.calls)
+    engine = ENGINES[args.engine]
+    for label, (ast, dialect) in (('unresolved', parse_unresolved(code)), ('resolved', parse_source(code))):
+        elapsed = best_of(args.repeat, lambda: run(ast, dialect, engine))
+        print(f"[{args.engine}] {label:<10} {args.calls} calls: {elapsed:.3f} s "
+              f"({elapsed / args.calls * 1e6:.2f} us/call)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Recursion benchmark: fib(n) written in every KozakScript dialect.
+
+Each program also defines a number of unrelated globals, because the cost
+of a function call used to grow with the number of visible variables.
+
+Usage:
+    python benchmarks/recursion_bench.py
+    python benchmarks/recursion_bench.py --n 20 --globals 500 --dialect english
+    python benchmarks/recursion_bench.py --engine closure
+"""
+import argparse
+
+from bench_utils import run_source, ENGINES
+
+
+FIB_PROGRAMS = {
+    'ukrainian_latin': '''Hetman
+{globals}
+Zavdannya fib(n) {{
+    Yakscho (n < 2) {{ Povernuty n; }}
+    Povernuty fib(n - 1) + fib(n - 2);
+}}
+rezultat := fib({n});
+''',
+    'english': '''Chief
+{globals}
+Function fib(n) {{
+    If (n < 2) {{ Return n; }}
+    Return fib(n - 1) + fib(n - 2);
+}}
+rezultat := fib({n});
+''',
+    'russian_latin': '''Ataman
+{globals}
+Zadanie fib(n) {{
+    Yesli (n < 2) {{ Vernut n; }}
+    Vernut fib(n - 1) + fib(n - 2);
+}}
+rezultat := fib({n});
+''',
+    'ukrainian_cyrillic': '''Гетьман
+{globals}
+Завдання fib(n) {{
+    Якщо (n < 2) {{ Повернути n; }}
+    Повернути fib(n - 1) + fib(n - 2);
+}}
+rezultat := fib({n});
+''',
+    'russian_cyrillic': '''Атаман
+{globals}
+Задание fib(n) {{
+    Если (n < 2) {{ Вернуть n; }}
+    Вернуть fib(n - 1) + fib(n - 2);
+}}
+rezultat := fib({n});
+''',
+    'symbolic': '''>>>
+{globals}
+$ fib(n) {{
+    ?? (n < 2) {{ <! n; }}
+    <! fib(n - 1) + fib(n - 2);
+}}
+rezultat := fib({n});
+''',
+}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure recursive call overhead')
+    arg_parser.add_argument('--n', type=int, default=25)
+    arg_parser.add_argument('--globals', type=int, default=1000,
+                            help='Number of extra global variables defined before the call')
+    arg_parser.add_argument('--dialect', choices=sorted(FIB_PROGRAMS), action='append',
+                            help='Dialect(s) to run (default: all)')
+    arg_parser.add_argument('--engine', choices=sorted(ENGINES), default='tree')
+    args = arg_parser.parse_args()
+
+    global_lines = '\n'.join(f'g{i} := {i};' for i in range(args.globals))
+    for dialect in args.dialect or FIB_PROGRAMS:
+        code = FIB_PROGRAMS[dialect].format(globals=global_lines, n=args.n)
+        interpreter, elapsed = run_source(code, ENGINES[args.engine])
+        result = interpreter.env['rezultat']
+        print(f"[{args.engine}] {dialect:<20} fib({args.n}) = {result}  {elapsed:.3f} s")
+
+
+if __name__ == '__main__':
+    main()
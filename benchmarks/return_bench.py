@@ -0,0 +1,74 @@
+"""Call-heavy recursion benchmark focused on return statements.
+
+Every call returns from inside nested control flow (If, While, Try with a
+Finally block), which is where a return used to unwind through Python
+exception handling.
+
+Usage:
+    python benchmarks/return_bench.py
+    python benchmarks/return_bench.py --engine closure --repeat 5
+"""
+import argparse
+
+from bench_utils import run_source, best_of, ENGINES
+
+
+PROGRAMS = {
+    'ackermann(2, n)': ('''Chief
+Function ack(m, n) {{
+    If (m == 0) {{ Return n + 1; }}
+    If (n == 0) {{ Return ack(m - 1, 1); }}
+    Return ack(m - 1, ack(m, n - 1));
+}}
+result := ack(2, {size});
+''', 40),
+    'search in while': ('''Chief
+Function first_multiple(start, k) {{
+    i := start;
+    While (True) {{
+        If (i % k == 0) {{ Return i; }}
+        i++;
+    }}
+}}
+Function walk(n) {{
+    If (n == 0) {{ Return 0; }}
+    Return first_multiple(n, 3) + walk(n - 1);
+}}
+For (r := 0; r < 20; r++) {{ result := walk({size}); }}
+''', 60),
+    'return through finally': ('''Chief
+hits := 0;
+Function guarded(n) {{
+    Try {{
+        If (n < 2) {{ Return n; }}
+        Return guarded(n - 1) + guarded(n - 2);
+    }} Finally {{
+        hits := hits + 1;
+    }}
+}}
+result := guarded({size});
+''', 16),
+}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure the cost of returning from recursive calls')
+    arg_parser.add_argument('--engine', choices=sorted(ENGINES), default='tree')
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--scale', type=float, default=1.0,
+                            help='Multiply the default problem sizes')
+    args = arg_parser.parse_args()
+
+    for name, (template, size) in PROGRAMS.items():
+        size = max(1, int(size * args.scale))
+        code = template.format(size=size)
+
+        def run():
+            interpreter, elapsed = run_source(code, ENGINES[args.engine])
+            return elapsed
+
+        print(f"[{args.engine}] {name:<24} size={size:<6} {best_of(args.repeat, run):.3f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark for interpreter startup.
+
+Starts main.py in a fresh Python process on a one-line program and times
+how long it takes for the program's first Print to come out, then times a
+bare `import core.interpreter` the same way. Every run is a new process,
+so nothing is warm except the operating system's file cache.
+
+Usage:
+    python benchmarks/startup_bench.py
+    python benchmarks/startup_bench.py --repeat 20 --engine vm
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_utils import REPO_ROOT, ENGINES
+
+
+MARKER = 'first statement'
+
+PROGRAM = f'''Chief
+Print("{MARKER}");
+'''
+
+IMPORT_ONLY = 'import core.interpreter, sys; print("pygame loaded:", "pygame" in sys.modules)'
+
+
+def time_to_marker(command):
+    """Seconds from spawning the command until it prints a line containing MARKER."""
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=REPO_ROOT, stdin=subprocess.DEVNULL,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                               text=True, encoding='utf-8')
+    try:
+        for line in process.stdout:
+            if MARKER in line:
+                return time.perf_counter() - start
+        raise RuntimeError(f"{command[1:]} never printed {MARKER!r}")
+    finally:
+        process.kill()
+        process.wait()
+
+
+def time_to_exit(command):
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=REPO_ROOT, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    return elapsed, result.stdout.strip()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure cold start of main.py')
+    arg_parser.add_argument('--repeat', type=int, default=10)
+    arg_parser.add_argument('--engine', choices=sorted(ENGINES), default='tree')
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'hello.kozak')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(PROGRAM)
+        command = [sys.executable, 'main.py', f'--engine={args.engine}', path]
+        elapsed = min(time_to_marker(command) for _ in range(args.repeat))
+        print(f"[{args.engine}] main.py to first statement: {elapsed * 1000:.1f} ms")
+
+    runs = [time_to_exit([sys.executable, '-c', IMPORT_ONLY]) for _ in range(args.repeat)]
+    elapsed = min(elapsed for elapsed, _ in runs)
+    print(f"import core.interpreter: {elapsed * 1000:.1f} ms ({runs[0][1]})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark for streaming file reads.
+
+Writes a log file to a temporary directory and counts its lines, once by
+reading the whole file with Read and splitting it, and once by iterating
+Read_lines. Reports time and the peak memory tracemalloc sees.
+
+Usage:
+    python benchmarks/stream_read_bench.py
+    python benchmarks/stream_read_bench.py --lines 500000 --engine vm
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from bench_utils import parse_source, ENGINES
+
+
+WHOLE_FILE = '''Chief
+count := 0;
+For line each Split(Read("{path}"), "{newline}") {{
+    count++;
+}}
+'''
+
+STREAMED = '''Chief
+count := 0;
+For line each Read_lines("{path}") {{
+    count++;
+}}
+'''
+
+LOG_LINE = '2024-05-01 12:00:{second:02d} INFO worker-{worker} handled request {index} in 12ms\n'
+
+
+def run(code, engine):
+    ast, dialect = parse_source(code)
+    interpreter = engine(parent_dialect=dialect)
+    start = time.perf_counter()
+    interpreter.eval(ast)
+    return time.perf_counter() - start
+
+
+def measure(code, engine):
+    """Elapsed time of a plain run, and peak memory of a second, traced run."""
+    elapsed = run(code, engine)
+    tracemalloc.start()
+    run(code, engine)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Compare Read with Read_lines on a large file')
+    arg_parser.add_argument('--lines', type=int, default=200_000)
+    arg_parser.add_argument('--engine', choices=sorted(ENGINES), default='tree')
+    args = arg_parser.parse_args()
+
+    engine = ENGINES[args.engine]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'server.log')
+        with open(path, 'w', encoding='utf-8') as f:
+            for index in range(args.lines):
+                f.write(LOG_LINE.format(second=index % 60, worker=index % 8, index=index))
+        size = os.path.getsize(path)
+        path = path.replace('\\', '/')
+
+        print(f"{args.lines} lines, {size / 2**20:.1f} MiB")
+        for label, program in (('Read + Split', WHOLE_FILE), ('Read_lines', STREAMED)):
+            # KozakScript strings have no escapes, so the newline is substituted in
+            elapsed, peak = measure(program.format(path=path, newline='\n'), engine)
+            print(f"[{args.engine}] {label:<13} {elapsed:.3f} s, peak {peak / 2**20:7.2f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -18,6 +18,7 @@ class KozakWhile:
 class KozakUnaryOp:
     op: str
     target: object
+    depth: int = None  # set by core.resolver
 
 @dataclasses.dataclass (slots=True)
 class KozakFor:
@@ -25,6 +26,7 @@ class KozakFor:
     condition: object
     step: object
     body: list
+    counter: object = None  # core.optimizer.CountedLoop for range-driven loops
 
 @dataclasses.dataclass (slots=True)
 class KozakFunctionDef:
@@ -40,6 +42,7 @@ class KozakFunctionDef:
 class KozakFunctionCall:
     name: str
     arguments: list
+    call_cache: object = None  # oop.MethodCallCache for instance.method(...) calls
 
 @dataclasses.dataclass (slots=True)
 class KozakReturn:
@@ -66,12 +69,14 @@ class KozakString:
 @dataclasses.dataclass (slots=True)
 class KozakVariable:
     name: str
+    depth: int = None  # set by core.resolver
 
 @dataclasses.dataclass (slots=True)
 class KozakAssign:
     name: str
     expr: object
     type_hint: str = None
+    depth: int = None  # set by core.resolver
 
 @dataclasses.dataclass (slots=True)
 class KozakProgram:
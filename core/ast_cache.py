@@ -0,0 +1,146 @@
+"""On-disk cache of parsed KozakScript programs.
+
+Works like __pycache__: parsing a file stores the resolved AST, the
+detected dialect, parser errors, dialect violations and dialect-check
+results in a __kozakcache__ directory next to the source. An entry is
+only reused when both the source hash and the interpreter version match;
+stale or unreadable entries are parsed again and overwritten.
+"""
+import os
+import sys
+import pickle
+import hashlib
+
+from core.lexer import lex
+from core.parser import Parser
+from core.optimizer import optimize
+from core.resolver import resolve
+
+
+CACHE_DIR = '__kozakcache__'
+
+_interpreter_version = None
+
+
+def interpreter_version():
+    """
+    Fingerprint of the Python version and the core sources. Any change to
+    the lexer, parser, AST or checker invalidates every cached program.
+    """
+    global _interpreter_version
+    if _interpreter_version is None:
+        digest = hashlib.sha256(sys.version.encode('utf-8'))
+        core_dir = os.path.dirname(os.path.abspath(__file__))
+        try:
+            for file_name in sorted(os.listdir(core_dir)):
+                if file_name.endswith('.py'):
+                    with open(os.path.join(core_dir, file_name), 'rb') as f:
+                        digest.update(f.read())
+        except OSError:
+            # Frozen builds may not ship the sources; fall back to the executable
+            digest.update(os.path.abspath(sys.executable).encode('utf-8'))
+        _interpreter_version = digest.hexdigest()
+    return _interpreter_version
+
+
+class ParsedProgram:
+    """Result of lexing, parsing and (optionally) dialect-checking a source."""
+
+    def __init__(self, ast, detected_dialect, errors, dialect_violations, dialect_errors):
+        self.ast = ast
+        self.detected_dialect = detected_dialect
+        self.errors = errors
+        self.dialect_violations = dialect_violations
+        self.dialect_errors = dialect_errors  # DialectChecker errors, empty if not checked
+
+
+def parse_program(code, strict_dialect=False, preset_dialect=None, check_dialect=False):
+    """Lex, parse, optimize and resolve source code without touching the cache."""
+    tokens = list(lex(code))
+    parser = Parser(tokens, strict_dialect=strict_dialect)
+    if preset_dialect:
+        parser.detected_dialect = preset_dialect
+    try:
+        ast = parser.parse()
+    except Exception as error:
+        # Callers still report the failure in the dialect detected so far
+        error.detected_dialect = parser.detected_dialect
+        raise
+
+    dialect_errors = []
+    if check_dialect and not parser.errors and parser.detected_dialect:
+        from core.interpreter import DialectChecker
+        checker = DialectChecker(parser.detected_dialect)
+        checker.check(ast)
+        dialect_errors = checker.errors
+
+    # Checked before optimizing, so code in pruned branches is still held to the dialect
+    resolve(optimize(ast))
+
+    return ParsedProgram(ast, parser.detected_dialect, parser.errors,
+                         parser.dialect_violations, dialect_errors)
+
+
+def cache_path(source_path, strict_dialect=False, preset_dialect=None, check_dialect=False):
+    """Where the cache entry for a source file parsed with these options lives."""
+    options = 'strict' if strict_dialect else 'mixed'
+    if preset_dialect:
+        options += '-' + preset_dialect
+    if check_dialect:
+        options += '-checked'
+    directory, file_name = os.path.split(os.path.abspath(source_path))
+    return os.path.join(directory, CACHE_DIR, f'{file_name}.{options}.pickle')
+
+
+def load_program(source_path, code, strict_dialect=False, preset_dialect=None, check_dialect=False):
+    """
+    Return the ParsedProgram for `code` read from `source_path`, reusing the
+    cached entry when it is still valid and refreshing it otherwise.
+    """
+    source_hash = hashlib.sha256(code.encode('utf-8')).hexdigest()
+    path = cache_path(source_path, strict_dialect, preset_dialect, check_dialect)
+
+    program = _read_entry(path, source_hash)
+    if program is None:
+        program = parse_program(code, strict_dialect, preset_dialect, check_dialect)
+        _write_entry(path, source_hash, program)
+    return program
+
+
+def _read_entry(path, source_hash):
+    try:
+        with open(path, 'rb') as f:
+            entry = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Truncated or corrupt entry, or one pickled by an incompatible build
+        return None
+
+    if (not isinstance(entry, dict)
+            or entry.get('version') != interpreter_version()
+            or entry.get('source_hash') != source_hash
+            or not isinstance(entry.get('program'), ParsedProgram)):
+        return None
+    return entry['program']
+
+
+def _write_entry(path, source_hash, program):
+    entry = {
+        'version': interpreter_version(),
+        'source_hash': source_hash,
+        'program': program,
+    }
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)  # readers never see a half-written entry
+    except (OSError, pickle.PicklingError, RecursionError):
+        # The cache is only an optimisation: read-only directories or very
+        # deep trees simply run uncached
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
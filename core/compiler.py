@@ -0,0 +1,459 @@
+"""Closure compiler for KozakScript.
+
+Each AST node is compiled once into a zero-argument Python closure that
+evaluates it. Hot nodes (literals, variables, arithmetic, comparisons,
+assignments and control flow) get specialised closures that call their
+children directly; every other node falls back to the tree-walking
+handler, so both engines share the same semantics and error messages.
+"""
+from core.interpreter import Interpreter, ReturnValue
+from core.dialect_messages import DialectMessages
+from core.matrix import LIST_TYPES
+
+from core.ast import (
+    KozakNumber,
+    KozakString,
+    KozakBoolean,
+    KozakVariable,
+    KozakBinOp,
+    KozakComparisonOp,
+    KozakAssign,
+    KozakUnaryOp,
+    KozakIf,
+    KozakWhile,
+    KozakFor,
+    KozakForEach,
+    KozakTry,
+    KozakReturn,
+    KozakEcho,
+    KozakArray,
+    KozakDictionaryAccess,
+    KozakFunctionCall,
+    KozakProgram,
+)
+
+
+NUMBER_TYPES = (int, float)
+
+
+def may_return(statements):
+    """
+    Whether running these statements can leave a return pending. Function
+    calls clear their own returns, so only return statements nested in
+    control flow (not in nested function definitions) count.
+    """
+    for stmt in statements:
+        if isinstance(stmt, KozakReturn):
+            return True
+        if isinstance(stmt, KozakIf):
+            if (may_return(stmt.body) or may_return(stmt.else_part or ())
+                    or any(may_return(body) for _, body in stmt.else_if_parts)):
+                return True
+        elif isinstance(stmt, (KozakWhile, KozakFor, KozakForEach)):
+            if may_return(stmt.body):
+                return True
+        elif isinstance(stmt, KozakTry):
+            if (may_return(stmt.try_body) or may_return(stmt.finally_body or ())
+                    or any(may_return(body) for _, body in stmt.catch_clauses)):
+                return True
+    return False
+
+
+class ClosureCompiler:
+    """Compiles AST nodes into closures bound to one interpreter."""
+
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self.cache = {}  # id(node) -> closure
+        self._nodes = []  # keeps compiled nodes alive so their ids are never reused
+        self._compilers = {
+            KozakNumber: self._compile_literal,
+            KozakString: self._compile_literal,
+            KozakBoolean: self._compile_literal,
+            KozakVariable: self._compile_variable,
+            KozakBinOp: self._compile_binop,
+            KozakComparisonOp: self._compile_comparison,
+            KozakAssign: self._compile_assign,
+            KozakUnaryOp: self._compile_unary_op,
+            KozakIf: self._compile_if,
+            KozakWhile: self._compile_while,
+            KozakFor: self._compile_for,
+            KozakEcho: self._compile_echo,
+            KozakArray: self._compile_array,
+            KozakDictionaryAccess: self._compile_dictionary_access,
+            KozakFunctionCall: self._compile_function_call,
+            KozakReturn: self._compile_return,
+            KozakProgram: self._compile_program,
+        }
+
+    def compile(self, node):
+        code = self.cache.get(id(node))
+        if code is None:
+            compile_node = self._compilers.get(node.__class__, self._compile_fallback)
+            code = compile_node(node)
+            self.cache[id(node)] = code
+            self._nodes.append(node)
+        return code
+
+    def compile_block(self, statements):
+        return tuple(self.compile(stmt) for stmt in statements)
+
+    def compile_body(self, statements):
+        """Compile a statement list into one closure that stops once a statement returns."""
+        code = self.compile_block(statements)
+        interpreter = self.interpreter
+
+        if not may_return(statements):
+            def run():
+                for stmt in code:
+                    stmt()
+            return run
+
+        def run():
+            for stmt in code:
+                stmt()
+                if interpreter._returning:
+                    return
+        return run
+
+    def _compile_fallback(self, node):
+        interpreter = self.interpreter
+        handler = interpreter._handlers.get(node.__class__)
+        if handler is None:
+            # Unknown nodes must fail when executed, exactly like the tree-walker
+            return lambda: Interpreter.eval(interpreter, node)
+        return lambda: handler(node)
+
+    def _compile_literal(self, node):
+        value = node.value
+        return lambda: value
+
+    def _compile_variable(self, node):
+        interpreter = self.interpreter
+        name = node.name
+        lookup = interpreter._eval_variable
+
+        if node.depth == 0:
+            def run():
+                try:
+                    return interpreter.env[name]
+                except KeyError:
+                    return lookup(node)
+            return run
+
+        functions = interpreter.functions
+
+        def run():
+            try:
+                return interpreter.env[name]
+            except KeyError:
+                # Unresolved names that are not variables may be function references
+                if name in functions:
+                    return functions[name]
+                return lookup(node)
+        return run
+
+    def _compile_binop(self, node):
+        left = self.compile(node.left)
+        right = self.compile(node.right)
+        op = node.op
+        binary_op = self.interpreter._binary_op
+
+        if op == '+':
+            def run():
+                lhs = left()
+                rhs = right()
+                if lhs.__class__ in NUMBER_TYPES and rhs.__class__ in NUMBER_TYPES:
+                    return lhs + rhs
+                return binary_op('+', lhs, rhs)
+            return run
+        if op == '-':
+            def run():
+                lhs = left()
+                rhs = right()
+                if lhs.__class__ in NUMBER_TYPES and rhs.__class__ in NUMBER_TYPES:
+                    return lhs - rhs
+                return binary_op('-', lhs, rhs)
+            return run
+        if op == '*':
+            # Non-numbers go through _binary_op, which does KozakMatrix arithmetic elementwise
+            def run():
+                lhs = left()
+                rhs = right()
+                if lhs.__class__ in NUMBER_TYPES and rhs.__class__ in NUMBER_TYPES:
+                    return lhs * rhs
+                return binary_op('*', lhs, rhs)
+            return run
+        if op == '%':
+            return lambda: left() % right()
+        return lambda: binary_op(op, left(), right())
+
+    def _compile_comparison(self, node):
+        left = self.compile(node.left)
+        right = self.compile(node.right)
+        op = node.op
+
+        if op == '==':
+            return lambda: left() == right()
+        if op == '!=':
+            return lambda: left() != right()
+        if op == '<':
+            return lambda: left() < right()
+        if op == '>':
+            return lambda: left() > right()
+        if op == '<=':
+            return lambda: left() <= right()
+        if op == '>=':
+            return lambda: left() >= right()
+
+        def run():
+            left()
+            right()
+        return run
+
+    def _compile_assign(self, node):
+        interpreter = self.interpreter
+        name = node.name
+        type_hint = node.type_hint
+        expr = self.compile(node.expr)
+        assign = interpreter._assign_variable
+
+        if type_hint:
+            return lambda: assign(name, expr(), type_hint)
+
+        type_constraints = interpreter.type_constraints
+
+        def run():
+            value = expr()
+            if interpreter.current_function or name in type_constraints:
+                assign(name, value)
+            else:
+                interpreter.env[name] = value
+        return run
+
+    def _compile_unary_op(self, node):
+        if not isinstance(node.target, KozakVariable) or node.op not in ('++', '--'):
+            return self._compile_fallback(node)
+
+        interpreter = self.interpreter
+        name = node.target.name
+        delta = 1 if node.op == '++' else -1
+        unary_op = interpreter._eval_unary_op
+
+        def run():
+            env = interpreter.env
+            try:
+                value = env[name]
+            except KeyError:
+                return unary_op(node)
+            if value.__class__ not in NUMBER_TYPES:
+                unary_op(node)
+            else:
+                env[name] = value + delta
+        return run
+
+    def _compile_if(self, node):
+        condition = self.compile(node.condition)
+        body = self.compile_body(node.body)
+        else_if_parts = tuple(
+            (self.compile(else_if_condition), self.compile_body(else_if_body))
+            for else_if_condition, else_if_body in node.else_if_parts
+        )
+        else_body = self.compile_body(node.else_part) if node.else_part else None
+
+        def run():
+            if condition():
+                body()
+                return
+            for else_if_condition, else_if_body in else_if_parts:
+                if else_if_condition():
+                    else_if_body()
+                    return
+            if else_body is not None:
+                else_body()
+        return run
+
+    def _compile_while(self, node):
+        interpreter = self.interpreter
+        condition = self.compile(node.condition)
+        body = self.compile_block(node.body)
+
+        if not may_return(node.body):
+            def run():
+                while condition():
+                    for stmt in body:
+                        stmt()
+            return run
+
+        def run():
+            while condition():
+                for stmt in body:
+                    stmt()
+                    if interpreter._returning:
+                        return
+        return run
+
+    def _compile_for(self, node):
+        interpreter = self.interpreter
+        initialization = self.compile(node.initialization)
+        condition = self.compile(node.condition)
+        step = self.compile(node.step)
+        body = self.compile_block(node.body)
+        returns = may_return(node.body)
+
+        if returns:
+            def run_steps():
+                while condition():
+                    for stmt in body:
+                        stmt()
+                        if interpreter._returning:
+                            return
+                    step()
+        else:
+            def run_steps():
+                while condition():
+                    for stmt in body:
+                        stmt()
+                    step()
+
+        counter = node.counter
+        if counter is None:
+            def run():
+                initialization()
+                run_steps()
+            return run
+
+        name = counter.name
+        counted_range = interpreter._counted_range
+        counter_after = interpreter._counter_after
+
+        def run():
+            initialization()
+            values = counted_range(counter)
+            if values is None:
+                return run_steps()
+            env = interpreter.env
+            for value in values:
+                env[name] = value
+                for stmt in body:
+                    stmt()
+                    if returns and interpreter._returning:
+                        return
+            env[name] = counter_after(values)
+        return run
+
+    def _compile_return(self, node):
+        interpreter = self.interpreter
+        value = self.compile(node.value) if node.value is not None else None
+
+        def run():
+            interpreter._return_value = value() if value is not None else None
+            interpreter._returning = True
+        return run
+
+    def _compile_echo(self, node):
+        interpreter = self.interpreter
+        expressions = self.compile_block(node.expressions)
+        boolean_string = DialectMessages.get_boolean_string
+
+        def run():
+            values = []
+            for expr in expressions:
+                value = expr()
+                if isinstance(value, bool):
+                    values.append(boolean_string(value, interpreter.parent_dialect))
+                else:
+                    values.append(value)
+            print(*values)
+        return run
+
+    def _compile_array(self, node):
+        elements = self.compile_block(node.elements)
+        return lambda: [element() for element in elements]
+
+    def _compile_dictionary_access(self, node):
+        if node.dictionary.__class__ is KozakDictionaryAccess:
+            return self._compile_nested_access(node)
+        container = self.compile(node.dictionary)
+        key = self.compile(node.key)
+        index_value = self.interpreter._index_value
+
+        def run():
+            target = container()
+            index = key()
+            if target.__class__ in LIST_TYPES and index.__class__ is int and 0 <= index < len(target):
+                return target[index]
+            return index_value(target, index)
+        return run
+
+    def _compile_nested_access(self, node):
+        """m[i][j] as one closure: the row is indexed inline, not through another call."""
+        container = self.compile(node.dictionary.dictionary)
+        row_key = self.compile(node.dictionary.key)
+        key = self.compile(node.key)
+        index_value = self.interpreter._index_value
+
+        def run():
+            target = container()
+            index = row_key()
+            if target.__class__ in LIST_TYPES and index.__class__ is int and 0 <= index < len(target):
+                target = target[index]
+            else:
+                target = index_value(target, index)
+            index = key()
+            if target.__class__ in LIST_TYPES and index.__class__ is int and 0 <= index < len(target):
+                return target[index]
+            return index_value(target, index)
+        return run
+
+    def _compile_function_call(self, node):
+        interpreter = self.interpreter
+        name = node.name
+
+        # Builtins cannot be redefined, so the call site is bound once
+        builtin = interpreter._builtins.get(name)
+        if builtin is not None:
+            return lambda: builtin(node)
+        if '.' in name:
+            return self._compile_fallback(node)
+
+        functions = interpreter.functions
+        arguments = self.compile_block(node.arguments)
+        execute = interpreter._execute_function_body
+        call = interpreter._eval_function_call
+
+        def run():
+            func_def = functions.get(name)
+            if func_def is None or len(arguments) != len(func_def.parameters):
+                # Let the tree-walker raise its usual error
+                return call(node)
+            args = [argument() for argument in arguments]
+            return execute(func_def.body, dict(zip(func_def.parameters, args)), name)
+        return run
+
+    def _compile_program(self, node):
+        interpreter = self.interpreter
+        statements = self.compile_block(node.statements)
+
+        def run():
+            for stmt in statements:
+                stmt()
+                if interpreter._returning:
+                    # A return outside any function ends the program as before
+                    raise ReturnValue(interpreter._take_return_value())
+        return run
+
+
+class ClosureInterpreter(Interpreter):
+    """Interpreter that runs compiled closures instead of walking the AST."""
+
+    def __init__(self, strict_dialect=False, parent_dialect=None):
+        super().__init__(strict_dialect=strict_dialect, parent_dialect=parent_dialect)
+        self.compiler = ClosureCompiler(self)
+        self._compiled = self.compiler.cache
+
+    def eval(self, node):
+        code = self._compiled.get(id(node))
+        if code is None:
+            code = self.compiler.compile(node)
+        return code()
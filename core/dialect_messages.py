@@ -143,6 +143,14 @@ class DialectMessages:
             'symbolic':          "TYPE_ERROR: '{name}' expected={expected} got={actual}",
             'english':           "Type mismatch for '{name}': expected {expected}, got {actual}",
         },
+        'matrix_dimensions': {
+            'ukrainian_latin':   "Rozmiry matryts' ne zbihayut'sya",
+            'ukrainian_cyrillic':"Розміри матриць не збігаються",
+            'russian_latin':     "Razmery matrits ne sovpadayut",
+            'russian_cyrillic':  "Размеры матриц не совпадают",
+            'symbolic':          "MATRIX_ERROR: dimension_mismatch",
+            'english':           "Matrix dimensions must match",
+        },
     }
 
     @staticmethod
@@ -0,0 +1,38 @@
+"""Variable scopes for KozakScript."""
+
+
+class Scope(dict):
+    """A frame of variables chained to the scope it was created from.
+
+    Reads and membership tests fall through to the parent chain, while
+    writes always land in this frame. A function call therefore only
+    builds a frame for its own parameters instead of copying every
+    visible variable.
+    """
+    __slots__ = ('parent',)
+
+    def __init__(self, variables=(), parent=None):
+        super().__init__(variables)
+        self.parent = parent
+
+    def __missing__(self, name):
+        scope = self.parent
+        while scope is not None:
+            if dict.__contains__(scope, name):
+                return dict.__getitem__(scope, name)
+            scope = scope.parent
+        raise KeyError(name)
+
+    def __contains__(self, name):
+        scope = self
+        while scope is not None:
+            if dict.__contains__(scope, name):
+                return True
+            scope = scope.parent
+        return False
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
@@ -4,11 +4,12 @@ import string
 import sys 
 import os
 from core.parser import Parser
-from core.modules.hash import HashModule
-from core.modules.math_module import MathModule
-from core.modules.game_module import GameModule
+from core.modules.registry import ModuleRegistry, BUILTIN_MODULES, MODULE_CLASSES
 from core.lexer import KEYWORD_TRANSLATIONS
 from core.dialect_messages import DialectMessages
+from core.environment import Scope
+from core.matrix import KozakMatrix, LIST_TYPES, MatrixError, elementwise
+from core.streams import FileStream, FileHandle, WriteCache
 
 
 from core import oop
@@ -79,6 +80,8 @@ class DialectChecker:
         'zavantazhyty_zobrazhennya': 'ukrainian_latin', 'namalyuvaty_zobrazhennya': 'ukrainian_latin',
         'zavantazhyty_zvuk': 'ukrainian_latin', 'vidtvoryty_zvuk': 'ukrainian_latin',
         'zakryty': 'ukrainian_latin',
+        'namalyuvaty_pryamokutnyky': 'ukrainian_latin', 'namalyuvaty_kola': 'ukrainian_latin',
+        'namalyuvaty_liniyi': 'ukrainian_latin',
 
         'create_window': 'english', 'set_icon': 'english', 'update': 'english',
         'set_fps': 'english', 'fill': 'english', 'draw_rect': 'english',
@@ -86,6 +89,7 @@ class DialectChecker:
         'mouse_position': 'english', 'mouse_pressed': 'english', 'draw_text': 'english',
         'load_image': 'english', 'draw_image': 'english', 'load_sound': 'english',
         'play_sound': 'english', 'close': 'english',
+        'draw_rects': 'english', 'draw_circles': 'english', 'draw_lines': 'english',
 
         'sozdat_okno': 'russian_latin', 'ustanovit_ikonku': 'russian_latin',
         'obnovit': 'russian_latin', 'ustanovit_fps': 'russian_latin',
@@ -96,6 +100,8 @@ class DialectChecker:
         'zagruzit_izobrazhenie': 'russian_latin', 'narisovat_izobrazhenie': 'russian_latin',
         'zagruzit_zvuk': 'russian_latin', 'vosproizvesti_zvuk': 'russian_latin',
         'zakryt': 'russian_latin',
+        'narisovat_pryamougolniki': 'russian_latin', 'narisovat_krugi': 'russian_latin',
+        'narisovat_linii': 'russian_latin',
 
         'створити_вікно': 'ukrainian_cyrillic', 'встановити_іконку': 'ukrainian_cyrillic',
         'оновити': 'ukrainian_cyrillic', 'встановити_фпс': 'ukrainian_cyrillic',
@@ -106,6 +112,8 @@ class DialectChecker:
         'завантажити_зображення': 'ukrainian_cyrillic', 'намалювати_зображення': 'ukrainian_cyrillic',
         'завантажити_звук': 'ukrainian_cyrillic', 'відтворити_звук': 'ukrainian_cyrillic',
         'закрити': 'ukrainian_cyrillic',
+        'намалювати_прямокутники': 'ukrainian_cyrillic', 'намалювати_кола': 'ukrainian_cyrillic',
+        'намалювати_лінії': 'ukrainian_cyrillic',
 
         'создать_окно': 'russian_cyrillic', 'установить_иконку': 'russian_cyrillic',
         'обновить': 'russian_cyrillic', 'установить_фпс': 'russian_cyrillic',
@@ -116,6 +124,8 @@ class DialectChecker:
         'загрузить_изображение': 'russian_cyrillic', 'нарисовать_изображение': 'russian_cyrillic',
         'загрузить_звук': 'russian_cyrillic', 'воспроизвести_звук': 'russian_cyrillic',
         'закрыть': 'russian_cyrillic',
+        'нарисовать_прямоугольники': 'russian_cyrillic', 'нарисовать_круги': 'russian_cyrillic',
+        'нарисовать_линии': 'russian_cyrillic',
     }
 
     GAME_COLOUR_DIALECTS = {
@@ -289,6 +299,7 @@ class DialectChecker:
             )
 
 class ReturnValue(Exception):
+    """Raised only when a return statement runs outside of any function."""
     def __init__(self, value):
         self.value = value
 
@@ -302,29 +313,116 @@ class ProgramExit(Exception):
         super().__init__(f"Program exited with code {code}")
 
 class Interpreter:
+
+    # AST node type -> name of the method that evaluates it
+    NODE_HANDLERS = {
+        KozakProgram: '_eval_program',
+        KozakClass: '_eval_ClassNode',
+        KozakNewInstance: 'eval_NewInstanceNode',
+        KozakPropertyAccess: 'eval_PropertyAccessNode',
+        KozakPropertyAssign: 'eval_PropertyAssignNode',
+        KozakIf: '_eval_if',
+        KozakWhile: '_eval_while',
+        KozakFor: '_eval_for',
+        KozakFunctionDef: '_eval_function_def',
+        KozakFunctionCall: '_eval_function_call',
+        KozakUnaryOp: '_eval_unary_op',
+        KozakAssign: '_eval_assign',
+        KozakEcho: '_eval_echo',
+        KozakNumber: '_eval_number',
+        KozakVariable: '_eval_variable',
+        KozakBinOp: '_eval_binop',
+        KozakString: '_eval_string',
+        KozakInput: '_eval_input',
+        KozakBoolean: '_eval_boolean',
+        KozakComparisonOp: '_eval_comparison_op',
+        KozakTypeCast: '_eval_type_cast',
+        KozakReturn: '_eval_return',
+        KozakArray: '_eval_array',
+        KozakArrayIndex: '_eval_array_index',
+        KozakForEach: '_eval_for_each',
+        KozakDictionary: '_eval_dictionary',
+        KozakDictionaryAccess: '_eval_dictionary_access',
+        KozakTry: '_eval_try',
+        KozakThrow: '_eval_throw',
+        KozakExit: '_eval_exit',
+        KozakImport: '_eval_import',
+        KozakSuper: '_eval_super',
+    }
+
+    # Builtin function spelling (every dialect) -> name of the method that implements it
+    BUILTIN_FUNCTIONS = {
+        **dict.fromkeys(KEYWORD_TRANSLATIONS['Destructor'].values(), '_builtin_destroy'),
+        **dict.fromkeys(('Velyki', 'Upper', 'Zaglavnye', '^str', 'Великі', 'Заглавные'), '_builtin_upper'),
+        **dict.fromkeys(('Mali', 'Lower', 'Strochnye', '_str', 'Малі', 'Строчные'), '_builtin_lower'),
+        **dict.fromkeys(('Zaminyty', 'Replace', 'Zamenit', 'str->', 'Заменить', 'Замінити'), '_builtin_replace'),
+        **dict.fromkeys(('Rozdilyty', 'Split', 'Razdelit', 'str//', 'Розділити', 'Разделить'), '_builtin_split'),
+        **dict.fromkeys(('Obrizaty', 'Strip', 'Obrezat', 'str--', 'Обрезать', 'Обрізати'), '_builtin_strip'),
+        **dict.fromkeys(('znayty', 'find', 'nayti', 'str?', 'знайти', 'найти'), '_builtin_find'),
+        **dict.fromkeys(('pidstrichka', 'substring', 'podstroka', 's[]', 'підстрічка', 'подстрока'), '_builtin_substring'),
+        **dict.fromkeys(('create_matrix', 'stvoryty_matrytsyu', 'sozdat_matritsu', '@[]', 'створити_матрицю', 'создать_матрицу'), '_builtin_create_matrix'),
+        **dict.fromkeys(('matrix_size', 'rozmir_matrytsi', 'razmer_matritsy', '#[]', 'розмір_матриці', 'размер_матрицы'), '_builtin_matrix_size'),
+        **dict.fromkeys(('flatten', 'splushchyty', 'spluschit', '[]>', 'сплющити', 'сплющить'), '_builtin_flatten'),
+        **dict.fromkeys(('transpose', 'transportuvaty', 'transportirovat', '[]^', 'транспортувати', 'транспортировать'), '_builtin_transpose'),
+        **dict.fromkeys(('get_row', 'otrymaty_ryadok', 'poluchit_stroku', '[]->', 'отримати_рядок', 'получить_строку'), '_builtin_get_row'),
+        **dict.fromkeys(('get_col', 'otrymaty_stovpets', 'poluchit_stolbets', '[]|', 'отримати_стовпець', 'получить_столбец'), '_builtin_get_col'),
+        **dict.fromkeys(('set_at', 'vstanovyty_na', 'ustanovit_na', '[]:=', 'встановити_на', 'установить_на'), '_builtin_set_at'),
+        **dict.fromkeys(('remove_key', 'vydalyty_klyuch', 'udalit_klyuch', 'vydalyty_klyuch_sym', 'видалити_ключ', 'удалить_ключ'), '_builtin_remove_key'),
+        **dict.fromkeys(('insert', 'vstavyty', 'vstavit', '+:', 'вставити', 'вставить'), '_builtin_insert'),
+        **dict.fromkeys(('append', 'dodaty', 'dobavit', '+<', 'додати', 'добавить'), '_builtin_append'),
+        **dict.fromkeys(('index_of', 'index_z', 'index_znachenia', 'index_znachennya', '?:', 'индекс_з', 'индекс_значения', 'індекс_з', 'індекс_значення'), '_builtin_index_of'),
+        **dict.fromkeys(('contains', 'mistyt', 'soderzhit', '?^', 'містить', 'содержит'), '_builtin_contains'),
+        **dict.fromkeys(('slice', 'vyrizaty', 'vyrezat', '[..]', 'вырезать', 'вирізати'), '_builtin_slice'),
+        **dict.fromkeys(('clear', 'ochystyty', 'ochistit', '--<', 'очистити', 'очистить'), '_builtin_clear'),
+        **dict.fromkeys(('pop', 'vyinyaty', 'vytaschit', '-<!', 'вийняти', 'вытащить'), '_builtin_pop'),
+        **dict.fromkeys(('remove', 'vydalyty', 'udalit', '-<', 'видалити', 'удалить'), '_builtin_remove'),
+        **dict.fromkeys(('Zapysaty', 'Write', 'Zapisat', '=>', 'Записати', 'Записать'), '_builtin_write'),
+        **dict.fromkeys(('Chytaty', 'Read', 'Chitat', '=<', 'Читати', 'Читать'), '_builtin_read'),
+        **dict.fromkeys(('Vidkryty', 'Open', 'Otkryt', '=>+', 'Відкрити', 'Открыть'), '_builtin_open'),
+        **dict.fromkeys(('Skynuty', 'Flush', 'Sbrosit', '=>~', 'Скинути', 'Сбросить'), '_builtin_flush'),
+        **dict.fromkeys(('Zakryty', 'Close', 'Zakryt', '=>-', 'Закрити', 'Закрыть'), '_builtin_close'),
+        **dict.fromkeys(('Chytaty_ryadky', 'Read_lines', 'Chitat_stroki', '=<|', 'Читати_рядки', 'Читать_строки'), '_builtin_read_lines'),
+        **dict.fromkeys(('Chytaty_chastyny', 'Read_chunks', 'Chitat_chasti', '=<#', 'Читати_частини', 'Читать_части'), '_builtin_read_chunks'),
+        **dict.fromkeys(KEYWORD_TRANSLATIONS['Dovzhyna'].values(), '_builtin_length'),
+        **dict.fromkeys(KEYWORD_TRANSLATIONS['Randint'].values(), '_builtin_randint'),
+        **dict.fromkeys(('klyuchi', 'keys', 'k{}', 'klyuchi_sym', 'ключи', 'ключі'), '_builtin_keys'),
+        **dict.fromkeys(('znachennya', 'values', 'znachennie', 'values_sym', 'значення', 'значенние'), '_builtin_values'),
+        **dict.fromkeys(('maye_klyuch', 'has_key', 'imeet_klyuch', '?k', 'имеет_ключ', 'має_ключ'), '_builtin_has_key'),
+    }
     
     def __init__(self, strict_dialect=False, parent_dialect=None):
         self._term = DialectMessages.friendly_term(parent_dialect)
         self.scopes = [{}]
-        self.env = {}
+        self.env = Scope()
         self.functions = {}
         self.class_table = oop.ClassTable()
         self.classes = {} 
         self.exit_code = 0
         self.imported_files = set()
         self.current_file_dir = None
+        self.use_ast_cache = True  # reuse parsed imports from __kozakcache__
         self.strict_dialect = strict_dialect
         self.parent_dialect = parent_dialect
-        self.modules = {
-            "hash": HashModule(),
-            "math": MathModule(),
-            "game": GameModule(dialect=parent_dialect),
-            # future modules to come.
-        }
+        self.modules = ModuleRegistry(dialect=parent_dialect)  # built-ins load on first use
         self.globals = self.env
         self.scopes = [{}]
         self.type_constraints = {}
         self.current_function = None
+        # Bound handlers, so eval() resolves a node with a single dict lookup
+        self._handlers = {
+            node_type: getattr(self, method_name)
+            for node_type, method_name in self.NODE_HANDLERS.items()
+        }
+        self._builtins = {
+            name: getattr(self, method_name)
+            for name, method_name in self.BUILTIN_FUNCTIONS.items()
+        }
+        # Completion record for return statements: blocks stop running while it is set
+        self._returning = False
+        self._return_value = None
+        # Files written by one-shot Write calls, and handles returned by Open
+        self._write_cache = WriteCache()
+        self._file_handles = set()
 
     def _execute_function_body(self, body, local_env, function_name=None):
         """
@@ -333,123 +431,104 @@ class Interpreter:
         """
         original_env = self.env
         original_function = self.current_function
-        merged_env = {**self.env, **local_env}
-        self.env = merged_env
+        # The new frame only holds the parameters; everything else is reached through the chain
+        self.env = Scope(local_env, parent=self.env)
         self.current_function = function_name
         try:
             for stmt in body:
                 self.eval(stmt)
+                if self._returning:
+                    return self._take_return_value()
             return None 
         except ReturnValue as e:
+            # Top-level code of a file imported inside the call returned
             return e.value
         finally:
             self.env = original_env
             self.current_function = original_function
 
     def eval(self, node):
-        if isinstance(node, KozakProgram):
-            return self._eval_program(node)
-        elif isinstance(node, KozakClass):
-            return self._eval_ClassNode(node)
-        elif isinstance(node, KozakNewInstance):
-            # This now reliably calls the correct, unique function defined below.
-            return self.eval_NewInstanceNode(node)
-        elif isinstance(node, KozakPropertyAccess):
-            return self.eval_PropertyAccessNode(node)
-        elif isinstance(node, KozakPropertyAssign):
-            return self.eval_PropertyAssignNode(node)
-        elif isinstance(node, KozakIf):
-            return self._eval_if(node)
-        elif isinstance(node, KozakWhile):
-            return self._eval_while(node)
-        elif isinstance(node, KozakFor):
-            return self._eval_for(node)
-        elif isinstance(node, KozakFunctionDef):
-            return self._eval_function_def(node)
-        elif isinstance(node, KozakFunctionCall):
-            return self._eval_function_call(node)
-        elif isinstance(node, KozakUnaryOp):
-            return self._eval_unary_op(node)
-        elif isinstance(node, KozakAssign):
-            return self._eval_assign(node)
-        elif isinstance(node, KozakEcho):
-            return self._eval_echo(node)
-        elif isinstance(node, KozakNumber):
-            return self._eval_number(node)
-        elif isinstance(node, KozakVariable):
-            return self._eval_variable(node)
-        elif isinstance(node, KozakBinOp):
-            return self._eval_binop(node)
-        elif isinstance(node, KozakString):
-            return self._eval_string(node)
-        elif isinstance(node, KozakInput):
-            return self._eval_input(node)
-        elif isinstance(node, KozakBoolean):
-            return self._eval_boolean(node)
-        elif isinstance(node, KozakComparisonOp):
-            return self._eval_comparison_op(node)
-        elif isinstance(node, KozakTypeCast):
-            return self._eval_type_cast(node)
-        elif isinstance(node, KozakReturn):
-            return_value = self.eval(node.value) if node.value is not None else None
-            raise ReturnValue(return_value)
-        elif isinstance(node, KozakArray):
-            return self._eval_array(node)
-        elif isinstance(node, KozakArrayIndex):
-            return self._eval_array_index(node)
-        elif isinstance(node, KozakForEach):
-            return self._eval_for_each(node)
-        elif isinstance(node, KozakDictionary):
-            return self._eval_dictionary(node)
-        elif isinstance(node, KozakDictionaryAccess):
-            return self._eval_dictionary_access(node)
-        elif isinstance(node, KozakTry):
-            return self._eval_try(node)
-        elif isinstance(node, KozakThrow):
-            return self._eval_throw(node)
-        elif isinstance(node, KozakExit):
-            return self._eval_exit(node)
-        elif isinstance(node, KozakImport):
-            return self._eval_import(node)
-        elif isinstance(node, KozakSuper):
-            return self._eval_super(node)
-        else:
+        handler = self._handlers.get(node.__class__)
+        if handler is None:
             raise RuntimeErrorKozak(f'Unknown node type: {type(node).__name__}')
+        return handler(node)
+
+    def _eval_return(self, node):
+        self._return_value = self.eval(node.value) if node.value is not None else None
+        self._returning = True
+
+    def _take_return_value(self):
+        """Clear the pending return and hand back its value."""
+        value = self._return_value
+        self._returning = False
+        self._return_value = None
+        return value
+
+    def _execute_block(self, statements):
+        """Run statements in order, stopping early once one of them returns."""
+        for stmt in statements:
+            self.eval(stmt)
+            if self._returning:
+                return
 
     def _eval_program(self, node):
         for stmt in node.statements:
            # print(f"DEBUG: Evaluating {type(stmt).__name__}")
             self.eval(stmt)
+            if self._returning:
+                # A return outside any function ends the program as before
+                raise ReturnValue(self._take_return_value())
         
 
     def _eval_assign(self, node):
         value = self.eval(node.expr)
-        if node.type_hint:
-            expected = self._normalize_type(node.type_hint)
+        self._assign_variable(node.name, value, node.type_hint)
+
+    def _assign_variable(self, name, value, type_hint=None):
+        """Store an already evaluated value, enforcing declared types."""
+        if type_hint:
+            expected = self._normalize_type(type_hint)
             actual = type(value).__name__
             if not self._type_matches(actual, expected):
                 raise RuntimeErrorKozak(
                     DialectMessages.runtime_error('type_mismatch', self.parent_dialect,
-                    name=node.name, expected=expected, actual=actual)
+                    name=name, expected=expected, actual=actual)
                     + f", {self._term}."
                 )
-            self.type_constraints[node.name] = expected
+            self.type_constraints[name] = expected
 
-        elif node.name in self.type_constraints:
-            expected = self.type_constraints[node.name]
+        elif name in self.type_constraints:
+            expected = self.type_constraints[name]
             actual = type(value).__name__
             
             if not self._type_matches(actual, expected):
                 raise RuntimeErrorKozak(
                 DialectMessages.runtime_error('type_mismatch', self.parent_dialect, 
-                name=node.name, expected=expected, actual=actual)
+                name=name, expected=expected, actual=actual)
                 + f", {self._term}."
             )
 
-        if self.current_function and node.name in self.globals and node.name not in locals().get('local_env', {}):
-            self.globals[node.name] = value
+        self._store_variable(name, value)
+
+    def _store_variable(self, name, value):
+        """Write a variable; inside functions, existing globals are written through."""
+        if self.current_function and name in self.globals:
+            self._keep_call_snapshot(name)
+            self.globals[name] = value
         else:
-            self.env[node.name] = value
+            self.env[name] = value
+
+    def _keep_call_snapshot(self, name):
+        """
+        Calls used to run on a copy of the environment, so the running calls
+        keep reading the value a global had when the outermost one started.
+        Park that value in the outermost call frame before it is overwritten.
+        """
+        frame = self.env
+        while frame.parent is not None and frame.parent is not self.globals:
+            frame = frame.parent
+        if frame is not self.globals and not dict.__contains__(frame, name):
+            dict.__setitem__(frame, name, self.globals[name])
     
     def _normalize_type(self, kozak_type):
         """Convert KozakScript type to Python type"""
@@ -496,6 +575,12 @@ class Interpreter:
         return (node.value)
 
     def _eval_variable(self, node):
+        if node.depth == 0:
+            # Parameters resolved to the current frame skip the membership walk
+            try:
+                return self.env[node.name]
+            except KeyError:
+                pass
         if node.name in self.env:
             return self.env[node.name]
         # Check global functions table for variables that might be function references
@@ -508,44 +593,64 @@ class Interpreter:
     def _eval_binop(self, node):
         left = self.eval(node.left)
         right = self.eval(node.right)
-        
-        if node.op == '+':
+        return self._binary_op(node.op, left, right)
+
+    def _binary_op(self, op, left, right):
+        """Apply a binary operator to already evaluated operands."""
+        if op == '+':
             if isinstance(left, (int, float)) and isinstance(right, (int, float)):
                 return left + right
             elif isinstance(left, str) or isinstance(right, str):
                 return str(left) + str(right)
+            elif isinstance(left, KozakMatrix) or isinstance(right, KozakMatrix):
+                return self._matrix_op(op, left, right)
             else:
                 raise RuntimeErrorKozak(f"Unsupported operand types for +: '{type(left).__name__}' and '{type(right).__name__}'")
-        elif node.op == '-':
+        elif op == '-':
+            if isinstance(left, KozakMatrix) or isinstance(right, KozakMatrix):
+                return self._matrix_op(op, left, right)
             return left - right
-        elif node.op == '*':
+        elif op == '*':
+            if isinstance(left, KozakMatrix) or isinstance(right, KozakMatrix):
+                return self._matrix_op(op, left, right)
             return left * right
-        elif node.op == '/':
+        elif op == '/':
             if right == 0:
                 raise RuntimeErrorKozak(
                 DialectMessages.runtime_error('divide_by_zero', self.parent_dialect)
                 + f", {self._term}."
             )
+            if isinstance(left, KozakMatrix) or isinstance(right, KozakMatrix):
+                return self._matrix_op(op, left, right)
             return left / right
-        elif node.op == '%':
+        elif op == '%':
             return left % right
-        elif node.op == '//':
+        elif op == '//':
             return left // right
-        elif node.op == '^':
+        elif op == '^':
             return left ** right
-        elif node.op == '^/':
+        elif op == '^/':
             if right == 0:
                 raise RuntimeErrorKozak(
                 DialectMessages.runtime_error('zero_exponent', self.parent_dialect)
                 + f", {self._term}."
             )
             return left ** (1 / right)
-        elif node.op == '&&':
+        elif op == '&&':
             return left and right
-        elif node.op == '||':
+        elif op == '||':
             return left or right
         else:
-            raise RuntimeErrorKozak(f'Unknown operator: {node.op}')
+            raise RuntimeErrorKozak(f'Unknown operator: {op}')
+
+    def _matrix_op(self, op, left, right):
+        """Elementwise + - * / on matrices, with errors in the program's dialect."""
+        try:
+            return elementwise(op, left, right)
+        except MatrixError as error:
+            raise RuntimeErrorKozak(
+                DialectMessages.runtime_error(error.args[0], self.parent_dialect)
+                + f", {self._term}.")
 
     def _eval_string(self, node):
         return node.value
@@ -576,8 +681,11 @@ class Interpreter:
         
     def _eval_type_cast(self, node):
         value = self.eval(node.expr)
-        
-        if node.target_type == 'Chyslo':
+        return self._cast_value(node.target_type, value)
+
+    def _cast_value(self, target_type, value):
+        """Convert an already evaluated value to a KozakScript type."""
+        if target_type == 'Chyslo':
             try:
                 return int(value)
             except (ValueError, TypeError):
@@ -586,7 +694,7 @@ class Interpreter:
                 value=value, target='Int')
                 + f", {self._term}."
             )
-        elif node.target_type == 'DroboveChyslo':
+        elif target_type == 'DroboveChyslo':
             try:
                 return float(value)
             except (ValueError, TypeError):
@@ -595,9 +703,9 @@ class Interpreter:
                 value=value, target='Float')
                 + f", {self._term}."
             )
-        elif node.target_type == 'Ryadok':
+        elif target_type == 'Ryadok':
             return str(value)
-        elif node.target_type == 'Logika':
+        elif target_type == 'Logika':
             if isinstance(value, str):
                 if value.lower() == 'pravda':
                     return True
@@ -605,41 +713,40 @@ class Interpreter:
                     return False
             return bool(value)
         else:
-            raise RuntimeErrorKozak(f"Unknown type cast: {node.target_type}")
+            raise RuntimeErrorKozak(f"Unknown type cast: {target_type}")
     
     def _eval_if(self, node):
         if self.eval(node.condition):
-            for stmt in node.body:
-                self.eval(stmt)
+            self._execute_block(node.body)
             return
 
         for else_if_condition, else_if_body in node.else_if_parts:
             if self.eval(else_if_condition):
-                for stmt in else_if_body:
-                    self.eval(stmt)
+                self._execute_block(else_if_body)
                 return
 
         if node.else_part:
-            for stmt in node.else_part:
-                self.eval(stmt)
+            self._execute_block(node.else_part)
 
     def _eval_while(self, node):
         while self.eval(node.condition):
             for stmt in node.body:
                 self.eval(stmt)
+                if self._returning:
+                    return
 
     def _eval_unary_op(self, node):
         if not isinstance(node.target, KozakVariable):
             raise RuntimeErrorKozak("Unary operators '++'/'--' only supported on simple variables.")
             
         var_name = node.target.name
-        if var_name not in self.env:
+        try:
+            current_value = self.env[var_name]
+        except KeyError:
              raise RuntimeErrorKozak(
                 DialectMessages.runtime_error('variable_not_defined', self.parent_dialect, name=var_name)
                 + f", {self._term}."
             )
-
-        current_value = self.env[var_name]
         
         if node.op == '++':
             if not isinstance(current_value, (int, float)):
@@ -661,16 +768,62 @@ class Interpreter:
     def _eval_for(self, node):
         self.eval(node.initialization)
         
+        values = self._counted_range(node.counter) if node.counter else None
+        if values is not None:
+            env = self.env
+            name = node.counter.name
+            for value in values:
+                env[name] = value
+                for stmt in node.body:
+                    self.eval(stmt)
+                    if self._returning:
+                        return
+            env[name] = self._counter_after(values)
+            return
+
         while self.eval(node.condition):
             for stmt in node.body:
                 self.eval(stmt)
+                if self._returning:
+                    return
             self.eval(node.step)
     
+    def _counted_range(self, loop):
+        """
+        range() of the values a counted loop (see core.optimizer) gives its
+        counter once initialized, or None if it must run step by step:
+        non-integer operands, typed counters, or counters written through
+        to a global from inside a function.
+        """
+        name = loop.name
+        if name in self.type_constraints or (self.current_function and name in self.globals):
+            return None
+        start = self.env[name]
+        bound = self.eval(loop.bound)
+        if start.__class__ is not int or bound.__class__ is not int:
+            return None
+        if loop.op == '<':
+            return range(start, bound)
+        if loop.op == '<=':
+            return range(start, bound + 1)
+        if loop.op == '>':
+            return range(start, bound, -1)
+        return range(start, bound - 1, -1)
+
+    @staticmethod
+    def _counter_after(values):
+        """Value a counted loop leaves in its counter: the first one that failed the condition."""
+        return values[-1] + values.step if values else values.start
+
     def _eval_function_def(self, node):
         self.functions[node.name] = node
 
 
     def _eval_function_call(self, node):
+        # Builtins win over user functions of the same name
+        builtin = self._builtins.get(node.name)
+        if builtin is not None:
+            return builtin(node)
 
         if '.' in node.name:
             parts = node.name.split('.', 1)
@@ -679,9 +832,9 @@ class Interpreter:
                 
                 # Check if first_part is a module
                 if first_part in self.modules:
-                    module = self.modules[first_part]
-                    if hasattr(module, method_name):
-                        method = getattr(module, method_name)
+                    module = self._load_module(first_part)
+                    method = getattr(module, method_name, None)
+                    if method is not None:
                         evaluated_args = [self.eval(arg_node) for arg_node in node.arguments]
                         return method(*evaluated_args)
                     else:
@@ -694,7 +847,8 @@ class Interpreter:
 
         if '.' in node.name:
             parts = node.name.split('.', 1)
-            if len(parts) == 2:
+            # Only class names can have static methods; skip the lookup for instances
+            if len(parts) == 2 and parts[0] in self.class_table.classes:
                 potential_class, method_name = parts
                 
                 # Check if this is a class name
@@ -726,398 +880,6 @@ class Interpreter:
                 except:
                     pass  
         
-        if node.name in ('Znyshchyty', 'Destructor', 'Unichtozhit', '@~', 'Знищити', 'Уничтожить'):
-            if len(node.arguments) != 1:
-                raise RuntimeErrorKozak(f"Function 'Destructor' expects exactly 1 argument, {self._term}.")
-            obj = self.eval(node.arguments[0])
-            if not isinstance(obj, oop.Instance):
-                raise RuntimeErrorKozak(f"Can only destroy object instances, {self._term}.")
-            obj.destroy(self)
-            return None
-        
-        if node.name in ('Velyki', 'Upper', 'Zaglavnye', '^str', 'Великі', 'Заглавные'):
-            if len(node.arguments) != 1:
-                raise RuntimeErrorKozak(f"Function 'Upper' expects exactly 1 argument, {self._term}.")
-            string = self.eval(node.arguments[0])
-            if not isinstance(string, str):
-                raise RuntimeErrorKozak(f"Argument for 'Upper' must be a string, {self._term}.")
-            return string.upper()
-        
-        if node.name in ('Mali', 'Lower', 'Strochnye', '_str', 'Малі', 'Строчные'):
-            if len(node.arguments) != 1:
-                raise RuntimeErrorKozak(f"Function 'Lower' expects exactly 1 argument, {self._term}.")
-            string = self.eval(node.arguments[0])
-            if not isinstance(string, str):
-                raise RuntimeErrorKozak(f"Argument for 'Lower' must be a string, {self._term}.")
-            return string.lower()
-        
-        if node.name in ('Zaminyty', 'Replace', 'Zamenit', 'str->', 'Заменить', 'Замінити'):
-            if len(node.arguments) != 3:
-                raise RuntimeErrorKozak(f"Function 'Replace' expects exactly 3 arguments, {self._term}.")
-            string = self.eval(node.arguments[0])
-            old = self.eval(node.arguments[1])
-            new = self.eval(node.arguments[2])
-            if not isinstance(string, str):
-                raise RuntimeErrorKozak(f"First argument for 'Replace' must be a string, {self._term}.")
-            return string.replace(str(old), str(new))
-        
-        if node.name in ('Rozdilyty', 'Split', 'Razdelit', 'str//', 'Розділити', 'Разделить'):
-            if len(node.arguments) not in (1,2):
-                raise RuntimeErrorKozak(f"Function 'Split' expects 1 or 2 arguments, {self._term}.")
-            string = self.eval(node.arguments[0])
-            delimiter = self.eval(node.arguments[1]) if len(node.arguments) == 2 else ' '
-            if not isinstance(string, str):
-                raise RuntimeErrorKozak(f"First argument for 'Split' must be a string, {self._term}.")
-            return string.split(str(delimiter))
-        
-        if node.name in ('Obrizaty', 'Strip', 'Obrezat', 'str--', 'Обрезать', 'Обрізати'):
-            if len(node.arguments) != 1:
-                raise RuntimeErrorKozak(f"Function 'strip' expects 1 argument, {self._term}.")
-            string = self.eval(node.arguments[0])
-            if not isinstance(string, str):
-                raise RuntimeErrorKozak(f"Argument must be a string, {self._term}.")
-            return string.strip()
-        
-        if node.name in ('znayty', 'find', 'nayti', 'str?','знайти', 'найти'):
-            if len(node.arguments) != 2:
-                raise RuntimeErrorKozak(f"Function 'find' expects 2 arguments (string, substring), {self._term}.")
-            string = self.eval(node.arguments[0])
-            substring = self.eval(node.arguments[1])
-            if not isinstance(string, str):
-                raise RuntimeErrorKozak(f"First argument must be a string, {self._term}.")
-            return string.find(str(substring))
-        
-        if node.name in ('pidstrichka', 'substring', 'podstroka', 's[]', 'підстрічка', 'подстрока'):
-            if len(node.arguments) not in (2, 3):
-                raise RuntimeErrorKozak(f"Function 'substring' expects 2 or 3 arguments, {self._term}.")
-            string = self.eval(node.arguments[0])
-            start = self.eval(node.arguments[1])
-            end = self.eval(node.arguments[2]) if len(node.arguments) == 3 else len(string)
-            if not isinstance(string, str):
-                raise RuntimeErrorKozak(f"First argument must be a string, {self._term}.")
-            if not isinstance(start, int) or not isinstance(end, int):
-                raise RuntimeErrorKozak(f"Indices must be integers, {self._term}.")
-            return string[start:end]
-
-                    
-        if node.name in ('create_matrix', 'stvoryty_matrytsyu', 'sozdat_matritsu', '@[]', 'створити_матрицю', 'создать_матрицу'):
-            if len(node.arguments) not in (2, 3):
-                raise RuntimeErrorKozak(f"Function 'create_matrix' expects 2 or 3 arguments (rows, cols, [fill_value]), {self._term}.")
-            
-            rows = self.eval(node.arguments[0])
-            cols = self.eval(node.arguments[1])
-            fill_value = self.eval(node.arguments[2]) if len(node.arguments) == 3 else 0
-            
-            if not isinstance(rows, int) or not isinstance(cols, int):
-                raise RuntimeErrorKozak(f"Rows and columns must be integers, {self._term}.")
-            if rows <= 0 or cols <= 0:
-                raise RuntimeErrorKozak(f"Matrix dimensions must be positive, {self._term}.")
-            
-            return [[fill_value for _ in range(cols)] for _ in range(rows)]
-        
-        # Get matrix dimensions
-        if node.name in ('matrix_size', 'rozmir_matrytsi', 'razmer_matritsy', '#[]', 'розмір_матриці', 'размер_матрицы'):
-            if len(node.arguments) != 1:
-                raise RuntimeErrorKozak(f"Function 'matrix_size' expects 1 argument, {self._term}.")
-            
-            matrix = self.eval(node.arguments[0])
-            if not isinstance(matrix, list):
-                raise RuntimeErrorKozak(f"Argument must be an array, {self._term}.")
-            
-            if not matrix or not isinstance(matrix[0], list):
-                return [len(matrix), 0]  # 1D array or empty
-            
-            return [len(matrix), len(matrix[0])]
-        
-        # Flatten a multidimensional array
-        if node.name in ('flatten', 'splushchyty', 'spluschit', '[]>', 'сплющити', 'сплющить'):
-            if len(node.arguments) != 1:
-                raise RuntimeErrorKozak(f"Function 'flatten' expects 1 argument, {self._term}.")
-            
-            arr = self.eval(node.arguments[0])
-            if not isinstance(arr, list):
-                raise RuntimeErrorKozak(f"Argument must be an array, {self._term}.")
-            
-            def flatten_recursive(lst):
-                result = []
-                for item in lst:
-                    if isinstance(item, list):
-                        result.extend(flatten_recursive(item))
-                    else:
-                        result.append(item)
-                return result
-            
-            return flatten_recursive(arr)
-        
-        # Transpose a 2D matrix
-        if node.name in ('transpose', 'transportuvaty', 'transportirovat', '[]^', 'транспортувати', 'транспортировать'):
-            if len(node.arguments) != 1:
-                raise RuntimeErrorKozak(f"Function 'transpose' expects 1 argument, {self._term}.")
-            
-            matrix = self.eval(node.arguments[0])
-            if not isinstance(matrix, list) or not matrix:
-                raise RuntimeErrorKozak(f"Argument must be a non-empty array, {self._term}.")
-            
-            if not all(isinstance(row, list) for row in matrix):
-                raise RuntimeErrorKozak(f"Argument must be a 2D array, {self._term}.")
-            
-            # Check all rows have same length
-            if not all(len(row) == len(matrix[0]) for row in matrix):
-                raise RuntimeErrorKozak(f"All rows must have the same length for transpose, {self._term}.")
-            
-            return [[matrix[j][i] for j in range(len(matrix))] for i in range(len(matrix[0]))]
-        
-        # Get row from matrix
-        if node.name in ('get_row', 'otrymaty_ryadok', 'poluchit_stroku', '[]->', 'отримати_рядок', 'получить_строку'):
-            if len(node.arguments) != 2:
-                raise RuntimeErrorKozak(f"Function 'get_row' expects 2 arguments (matrix, row_index), {self._term}.")
-            
-            matrix = self.eval(node.arguments[0])
-            row_idx = self.eval(node.arguments[1])
-            
-            if not isinstance(matrix, list):
-                raise RuntimeErrorKozak(f"First argument must be an array, {self._term}.")
-            if not isinstance(row_idx, int):
-                raise RuntimeErrorKozak(f"Row index must be an integer, {self._term}.")
-            if row_idx < 0 or row_idx >= len(matrix):
-                raise RuntimeErrorKozak(f"Row index out of bounds, {self._term}.")
-            
-            return matrix[row_idx]
-        
-        # Get column from matrix
-        if node.name in ('get_col', 'otrymaty_stovpets', 'poluchit_stolbets', '[]|', 'отримати_стовпець', 'получить_столбец'):
-            if len(node.arguments) != 2:
-                raise RuntimeErrorKozak(f"Function 'get_col' expects 2 arguments (matrix, col_index), {self._term}.")
-            
-            matrix = self.eval(node.arguments[0])
-            col_idx = self.eval(node.arguments[1])
-            
-            if not isinstance(matrix, list) or not matrix:
-                raise RuntimeErrorKozak(f"First argument must be a non-empty array, {self._term}.")
-            if not isinstance(col_idx, int):
-                raise RuntimeErrorKozak(f"Column index must be an integer, {self._term}.")
-            
-            if not all(isinstance(row, list) for row in matrix):
-                raise RuntimeErrorKozak(f"Argument must be a 2D array, {self._term}.")
-            
-            if col_idx < 0 or (matrix and col_idx >= len(matrix[0])):
-                raise RuntimeErrorKozak(f"Column index out of bounds, {self._term}.")
-            
-            return [row[col_idx] for row in matrix]
-        
-        # Set value at position in multidimensional array
-        if node.name in ('set_at', 'vstanovyty_na', 'ustanovit_na', '[]:=', "встановити_на", "установить_на"):
-            if len(node.arguments) < 3:
-                raise RuntimeErrorKozak(f"Function 'set_at' expects at least 3 arguments (array, indices..., value), {self._term}.")
-            
-            arr = self.eval(node.arguments[0])
-            if not isinstance(arr, list):
-                raise RuntimeErrorKozak(f"First argument must be an array, {self._term}.")
-            
-            # All arguments except last are indices, last is the value
-            indices = [self.eval(node.arguments[i]) for i in range(1, len(node.arguments) - 1)]
-            value = self.eval(node.arguments[-1])
-            
-            # Navigate to the target position
-            current = arr
-            for i, idx in enumerate(indices[:-1]):
-                if not isinstance(idx, int):
-                    raise RuntimeErrorKozak(f"Index {i+1} must be an integer, {self._term}.")
-                if idx < 0 or idx >= len(current):
-                    raise RuntimeErrorKozak(f"Index {i+1} out of bounds, {self._term}.")
-                current = current[idx]
-            
-            # Set the final value
-            last_idx = indices[-1]
-            if not isinstance(last_idx, int):
-                raise RuntimeErrorKozak(f"Last index must be an integer, {self._term}.")
-            if last_idx < 0 or last_idx >= len(current):
-                raise RuntimeErrorKozak(f"Last index out of bounds, {self._term}.")
-            
-            current[last_idx] = value
-            return None
-
-        
-        if node.name == 'remove_key' or node.name == 'vydalyty_klyuch' or node.name == 'udalit_klyuch' or node.name == 'vydalyty_klyuch_sym' or node.name == 'видалити_ключ' or node.name == 'удалить_ключ':
-            if len(node.arguments) != 2:
-                raise RuntimeErrorKozak(f"Function 'remove_key' expects exactly 2 arguments (dictionary, key), {self._term}.")
-            
-            dictionary = self.eval(node.arguments[0])
-            key = self.eval(node.arguments[1])
-            
-            return self._kozak_remove_key(dictionary, key)
-
-        if node.name == 'insert' or node.name == 'vstavyty' or node.name == 'vstavit' or node.name == '+:' or node.name == 'вставити' or node.name == 'вставить':
-            if len(node.arguments) != 3:
-                raise RuntimeErrorKozak(f"Function 'insert' expects exactly 3 arguments, {self._term}.")
-            arr = self.eval(node.arguments[0])
-            index = self.eval(node.arguments[1])
-            value = self.eval(node.arguments[2])
-            if not isinstance(arr, list):
-                raise RuntimeErrorKozak(f"First argument of 'insert' must be an array, {self._term}.")
-            if not isinstance(index, int):
-                raise RuntimeErrorKozak(f"Second argument of 'insert' must be an integer, {self._term}.")
-            if index < 0 or index > len(arr):
-                raise RuntimeErrorKozak(f"Array index out of bounds, {self._term}.")
-            arr.insert(index, value)
-            return None
-        
-        if node.name == 'append' or node.name == 'dodaty' or node.name == 'dobavit' or node.name == '+<' or node.name == 'додати' or node.name == 'добавить':
-            if len(node.arguments) != 2:
-                raise RuntimeErrorKozak(f"Function 'append' expects exactly 2 arguments, {self._term}.")
-            arr = self.eval(node.arguments[0])
-            value = self.eval(node.arguments[1])
-            if not isinstance(arr, list):
-                raise RuntimeErrorKozak(f"First argument of 'append' must be an array, {self._term}.")
-            arr.append(value)
-            return None
-
-        if node.name == 'index_of' or node.name == 'index_z' or node.name == 'index_znachenia' or node.name == 'index_znachennya' or node.name == '?:' or node.name == 'индекс_з' or node.name == 'индекс_значения' or node.name == 'індекс_з' or node.name == 'індекс_значення':
-            if len(node.arguments) != 2:
-                raise RuntimeErrorKozak(f"Function 'index_of' expects exactly 2 arguments, {self._term}.")
-            arr = self.eval(node.arguments[0])
-            value = self.eval(node.arguments[1])
-            if not isinstance(arr, list):
-                raise RuntimeErrorKozak(f"First argument of 'index_of' must be an array, {self._term}.")
-            try:
-                return arr.index(value)
-            except ValueError:
-                return -1
-
-        if node.name == 'contains' or node.name == 'mistyt' or node.name == 'soderzhit' or node.name == '?^' or node.name == 'містить' or node.name == 'содержит':
-            if len(node.arguments) != 2:
-                raise RuntimeErrorKozak(f"Function 'contains' expects exactly 2 arguments, {self._term}.")
-            arr = self.eval(node.arguments[0])
-            value = self.eval(node.arguments[1])
-            if not isinstance(arr, list):
-                raise RuntimeErrorKozak(f"First argument of 'contains' must be an array, {self._term}.")
-            return value in arr
-
-        if node.name == 'slice' or node.name == 'vyrizaty' or node.name == 'vyrezat' or node.name == '[..]' or node.name == 'вырезать' or node.name == 'вирізати':
-            if len(node.arguments) not in (2, 3):
-                raise RuntimeErrorKozak(f"Function 'slice' expects 2 or 3 arguments, {self._term}.")
-            arr = self.eval(node.arguments[0])
-            start = self.eval(node.arguments[1])
-            end = self.eval(node.arguments[2]) if len(node.arguments) == 3 else None
-            if not isinstance(arr, list):
-                raise RuntimeErrorKozak(f"First argument of 'slice' must be an array, {self._term}.")
-            if not isinstance(start, int) or (end is not None and not isinstance(end, int)):
-                raise RuntimeErrorKozak(f"Start and end arguments must be integers, {self._term}.")
-            return arr[start:end]
-
-        if node.name == 'clear' or node.name == 'ochystyty' or node.name == 'ochistit' or node.name == '--<' or node.name == 'очистити' or node.name == 'очистить':
-            if len(node.arguments) != 1:
-                raise RuntimeErrorKozak(f"Function 'clear' expects exactly 1 argument, {self._term}.")
-            arr = self.eval(node.arguments[0])
-            if not isinstance(arr, list):
-                raise RuntimeErrorKozak(f"Argument of 'clear' must be an array, {self._term}.")
-            arr.clear()
-            return None
-
-        if node.name == 'pop' or node.name == 'vyinyaty' or node.name == 'vytaschit' or node.name == '-<!' or node.name == 'вийняти' or node.name == 'вытащить':
-            if len(node.arguments) != 1:
-                raise RuntimeErrorKozak(f"Function 'pop' expects exactly 1 argument, {self._term}.")
-            arr = self.eval(node.arguments[0])
-            if not isinstance(arr, list):
-                raise RuntimeErrorKozak(f"Argument of 'pop' must be an array, {self._term}.")
-            if not arr:
-                raise RuntimeErrorKozak(f"Cannot pop from empty array, {self._term}.")
-            return arr.pop()
-
-        if node.name == 'remove' or node.name == 'vydalyty' or node.name == 'udalit' or node.name == '-<' or node.name == 'видалити' or node.name == 'удалить':
-            if len(node.arguments) != 2:
-                raise RuntimeErrorKozak(f"Function 'remove' expects exactly 2 arguments, {self._term}.")
-            arr = self.eval(node.arguments[0])
-            index = self.eval(node.arguments[1])
-            if not isinstance(arr, list):
-                raise RuntimeErrorKozak(f"First argument of 'remove' must be an array, {self._term}.")
-            if not isinstance(index, int):
-                raise RuntimeErrorKozak(f"Second argument of 'remove' must be an integer, {self._term}.")
-            if index < 0 or index >= len(arr):
-                raise RuntimeErrorKozak(f"Array index out of bounds, {self._term}.")
-            arr.pop(index)
-            return None
-
-        
-        if node.name in ('Zapysaty', 'Write', 'Zapisat', '=>', 'Записати', 'Записать'):
-            if len(node.arguments) < 2 or len(node.arguments) > 3:
-                raise RuntimeErrorKozak(f"Function 'Write' expects 2 or 3 arguments, {self._term}.")
-            file_name = self.eval(node.arguments[0])
-            content = self.eval(node.arguments[1])
-            append_mode = False
-            if len(node.arguments) == 3:
-                append_mode = bool(self.eval(node.arguments[2]))
-            
-            if not isinstance(file_name, str):
-                raise RuntimeErrorKozak(f"First argument for 'Write' (file name) must be a string, {self._term}.")
-            
-            mode = 'a' if append_mode else 'w'
-            try:
-                with open(file_name, mode, encoding='utf-8') as f:
-                    f.write(str(content))
-                return None
-            except IOError as e:
-                raise RuntimeErrorKozak(f"File writing error: {e}")
-
-
-        if node.name in ('Chytaty', 'Read', 'Chitat', '=<', 'Читати', 'Читать'):
-            if len(node.arguments) != 1:
-                raise RuntimeErrorKozak(f"Function 'Read' expects exactly 1 argument, {self._term}.")
-            file_name = self.eval(node.arguments[0])
-            if not isinstance(file_name, str):
-                raise RuntimeErrorKozak(f"Argument for 'Read' must be a string, {self._term}.")
-            try:
-                with open(file_name, 'r', encoding='utf-8') as f:
-                    return f.read()
-            except FileNotFoundError:
-                raise RuntimeErrorKozak(f"File '{file_name}' not found, {self._term}.")
-            except IOError as e:
-                raise RuntimeErrorKozak(f"File reading error: {e}")
-
-
-        if node.name in ('dovzhyna', 'length', 'dlinna', '___', 'длинна', 'довжина'):
-            if len(node.arguments) != 1:
-                raise RuntimeErrorKozak(f"Function 'length' expects exactly 1 argument, {self._term}.")
-            arg = self.eval(node.arguments[0])
-            if not isinstance(arg, (list, str, tuple)):
-                raise RuntimeErrorKozak(f"Argument for 'length' must be an array or a string, {self._term}.")
-            return len(arg)
-        
-        if node.name in('randint', 'випадкове_число', 'случайное_число', 'vypadkove_chyslo', 'sluchaynoye_chislo', '_+_+_'):
-            if len(node.arguments) != 2:
-                raise RuntimeErrorKozak(f"Function 'randint' expects exactly 2 arguments, {self._term}.")
-            start = self.eval(node.arguments[0])
-            end = self.eval(node.arguments[1])
-            if not isinstance(start, int) or not isinstance(end, int):
-                raise RuntimeErrorKozak(f"Arguments for 'randint' must be integers, {self._term}.")
-            return random.randint(start, end)
-
-        if node.name in ('klyuchi', 'keys', 'k{}', 'klyuchi_sym', 'ключи', 'ключі'):  # keys
-            if len(node.arguments) != 1:
-                raise RuntimeErrorKozak(f"Function 'keys' expects exactly 1 argument, {self._term}.")
-            dictionary = self.eval(node.arguments[0])
-            if not isinstance(dictionary, dict):
-                raise RuntimeErrorKozak(f"Argument must be a dictionary, {self._term}.")
-            return list(dictionary.keys())
-
-        if node.name in ('znachennya', 'values', 'znachennie', 'values_sym', 'значення', 'значенние'):  # values
-            if len(node.arguments) != 1:
-                raise RuntimeErrorKozak(f"Function 'values' expects exactly 1 argument, {self._term}.")
-            dictionary = self.eval(node.arguments[0])
-            if not isinstance(dictionary, dict):
-                raise RuntimeErrorKozak(f"Argument must be a dictionary, {self._term}.")
-            return list(dictionary.values())
-
-        if node.name in ('maye_klyuch', 'has_key', 'imeet_klyuch', '?k', 'имеет_ключ', 'має_ключ'):  # has_key
-            if len(node.arguments) != 2:
-                raise RuntimeErrorKozak(f"Function 'has_key' expects exactly 2 arguments, {self._term}.")
-            dictionary = self.eval(node.arguments[0])
-            key = self.eval(node.arguments[1])
-            if not isinstance(dictionary, dict):
-                raise RuntimeErrorKozak(f"First argument must be a dictionary, {self._term}.")
-            return key in dictionary
-        # --- End built-in functions ---
-
         if '.' in node.name:
             try:
                 # Припускаємо, що name має формат "instance_name.method_name"
@@ -1128,63 +890,7 @@ class Interpreter:
             else:
                 # 1. Обчислюємо аргументи, які передаються в метод
                 evaluated_args = [self.eval(arg_node) for arg_node in node.arguments]
-
-                # 2. Отримуємо змінну-екземпляр ('sobaka') з оточення
-                if instance_name not in self.env:
-                    raise RuntimeErrorKozak(f"Instance variable '{instance_name}' is not defined.")
-                obj = self.env[instance_name]
-                
-                # Перевіряємо, чи є це об'єкт Instance
-                if not isinstance(obj, oop.Instance):
-                    raise RuntimeErrorKozak(f"Cannot call method '{method_name}' on non-object variable '{instance_name}'.")
-
-                # 3. Знаходимо визначення методу у ClassDef
-                method_def = obj.class_def.find_method(method_name)
-                
-                if not method_def or not isinstance(method_def, KozakFunctionDef):
-                    raise RuntimeErrorKozak(f"Method '{method_name}' not found in class '{obj.class_def.name}'.")
-
-                # CHECK ACCESS MODIFIERS FOR METHOD CALLS
-                access_level = obj.class_def.get_method_access(method_name)
-                calling_instance = None
-                if 'this' in self.env and isinstance(self.env['this'], oop.Instance):
-                    calling_instance = self.env['this']
-
-                if access_level == 'private':
-                    if calling_instance is not obj:
-                        raise RuntimeErrorKozak(f"Cannot access private method '{method_name}' of class '{obj.class_def.name}'")
-                elif access_level == 'protected':
-                    if calling_instance is not None:
-                        # Check if calling instance is same class or subclass
-                        current = calling_instance.class_def
-                        is_subclass = False
-                        while current:
-                            if current == obj.class_def:
-                                is_subclass = True
-                                break
-                            current = current.parent_class
-                        if not is_subclass:
-                            raise RuntimeErrorKozak(f"Cannot access protected method '{method_name}' of class '{obj.class_def.name}'")
-                    else:
-                        # Called from outside any class context
-                        raise RuntimeErrorKozak(f"Cannot access protected method '{method_name}' of class '{obj.class_def.name}'")
-
-
-
-                # 4. Перевіряємо кількість аргументів
-                if len(evaluated_args) != len(method_def.parameters):
-                    raise RuntimeErrorKozak(
-                        DialectMessages.runtime_error('arg_count_mismatch', self.parent_dialect, 
-                        name=method_name, expected=len(method_def.parameters), actual=len(evaluated_args))
-                        + f", {self._term}."
-                    )
-
-                # 5. Виконуємо метод (створюємо локальне оточення, встановлюємо 'this')
-                local_env = {"this": obj}
-                for param, arg_val in zip(method_def.parameters, evaluated_args):
-                    local_env[param] = arg_val
-                
-                return self._execute_function_body(method_def.body, local_env, function_name=method_name)
+                return self._call_method(node, instance_name, method_name, evaluated_args)
         # --- КІНЕЦЬ ЛОГІКИ ДЛЯ ВИКЛИКУ МЕТОДУ ---
 
         # Existing user-defined function handling
@@ -1204,6 +910,574 @@ class Interpreter:
         return self._execute_function_body(func_def.body, local_env, function_name=node.name)
 
 
+    def _call_method(self, node, instance_name, method_name, evaluated_args):
+        """Call `instance_name.method_name(...)` with already evaluated arguments."""
+        # 2. Отримуємо змінну-екземпляр ('sobaka') з оточення
+        try:
+            obj = self.env[instance_name]
+        except KeyError:
+            raise RuntimeErrorKozak(f"Instance variable '{instance_name}' is not defined.")
+
+        # Перевіряємо, чи є це об'єкт Instance
+        if not isinstance(obj, oop.Instance):
+            raise RuntimeErrorKozak(f"Cannot call method '{method_name}' on non-object variable '{instance_name}'.")
+
+        # 3. Знаходимо визначення методу у ClassDef
+        # The call site remembers the method resolved for the last receiver class
+        cache = node.call_cache
+        if (cache is None or cache.class_def is not obj.class_def
+                or cache.version != self.class_table.version):
+            method_def = obj.class_def.find_method(method_name)
+
+            if not method_def or not isinstance(method_def, KozakFunctionDef):
+                raise RuntimeErrorKozak(f"Method '{method_name}' not found in class '{obj.class_def.name}'.")
+
+            cache = node.call_cache = oop.MethodCallCache(
+                obj.class_def,
+                self.class_table.version,
+                method_def,
+                obj.class_def.get_method_access(method_name),
+            )
+        method_def = cache.method_def
+
+        # CHECK ACCESS MODIFIERS FOR METHOD CALLS
+        access_level = cache.access_level
+        if access_level == 'private':
+            if self.env.get('this') is not obj:
+                raise RuntimeErrorKozak(f"Cannot access private method '{method_name}' of class '{obj.class_def.name}'")
+        elif access_level == 'protected':
+            calling_instance = None
+            if 'this' in self.env and isinstance(self.env['this'], oop.Instance):
+                calling_instance = self.env['this']
+            if calling_instance is not None:
+                # Check if calling instance is same class or subclass
+                if obj.class_def not in calling_instance.class_def.ancestors:
+                    raise RuntimeErrorKozak(f"Cannot access protected method '{method_name}' of class '{obj.class_def.name}'")
+            else:
+                # Called from outside any class context
+                raise RuntimeErrorKozak(f"Cannot access protected method '{method_name}' of class '{obj.class_def.name}'")
+
+
+
+        # 4. Перевіряємо кількість аргументів
+        if len(evaluated_args) != len(method_def.parameters):
+            raise RuntimeErrorKozak(
+                DialectMessages.runtime_error('arg_count_mismatch', self.parent_dialect, 
+                name=method_name, expected=len(method_def.parameters), actual=len(evaluated_args))
+                + f", {self._term}."
+            )
+
+        # 5. Виконуємо метод (створюємо локальне оточення, встановлюємо 'this')
+        local_env = {"this": obj}
+        for param, arg_val in zip(method_def.parameters, evaluated_args):
+            local_env[param] = arg_val
+
+        return self._execute_function_body(method_def.body, local_env, function_name=method_name)
+
+    def _builtin_destroy(self, node):
+        if len(node.arguments) != 1:
+            raise RuntimeErrorKozak(f"Function 'Destructor' expects exactly 1 argument, {self._term}.")
+        obj = self.eval(node.arguments[0])
+        if not isinstance(obj, oop.Instance):
+            raise RuntimeErrorKozak(f"Can only destroy object instances, {self._term}.")
+        obj.destroy(self)
+        return None
+
+    def _builtin_upper(self, node):
+        if len(node.arguments) != 1:
+            raise RuntimeErrorKozak(f"Function 'Upper' expects exactly 1 argument, {self._term}.")
+        string = self.eval(node.arguments[0])
+        if not isinstance(string, str):
+            raise RuntimeErrorKozak(f"Argument for 'Upper' must be a string, {self._term}.")
+        return string.upper()
+
+    def _builtin_lower(self, node):
+        if len(node.arguments) != 1:
+            raise RuntimeErrorKozak(f"Function 'Lower' expects exactly 1 argument, {self._term}.")
+        string = self.eval(node.arguments[0])
+        if not isinstance(string, str):
+            raise RuntimeErrorKozak(f"Argument for 'Lower' must be a string, {self._term}.")
+        return string.lower()
+
+    def _builtin_replace(self, node):
+        if len(node.arguments) != 3:
+            raise RuntimeErrorKozak(f"Function 'Replace' expects exactly 3 arguments, {self._term}.")
+        string = self.eval(node.arguments[0])
+        old = self.eval(node.arguments[1])
+        new = self.eval(node.arguments[2])
+        if not isinstance(string, str):
+            raise RuntimeErrorKozak(f"First argument for 'Replace' must be a string, {self._term}.")
+        return string.replace(str(old), str(new))
+
+    def _builtin_split(self, node):
+        if len(node.arguments) not in (1,2):
+            raise RuntimeErrorKozak(f"Function 'Split' expects 1 or 2 arguments, {self._term}.")
+        string = self.eval(node.arguments[0])
+        delimiter = self.eval(node.arguments[1]) if len(node.arguments) == 2 else ' '
+        if not isinstance(string, str):
+            raise RuntimeErrorKozak(f"First argument for 'Split' must be a string, {self._term}.")
+        return string.split(str(delimiter))
+
+    def _builtin_strip(self, node):
+        if len(node.arguments) != 1:
+            raise RuntimeErrorKozak(f"Function 'strip' expects 1 argument, {self._term}.")
+        string = self.eval(node.arguments[0])
+        if not isinstance(string, str):
+            raise RuntimeErrorKozak(f"Argument must be a string, {self._term}.")
+        return string.strip()
+
+    def _builtin_find(self, node):
+        if len(node.arguments) != 2:
+            raise RuntimeErrorKozak(f"Function 'find' expects 2 arguments (string, substring), {self._term}.")
+        string = self.eval(node.arguments[0])
+        substring = self.eval(node.arguments[1])
+        if not isinstance(string, str):
+            raise RuntimeErrorKozak(f"First argument must be a string, {self._term}.")
+        return string.find(str(substring))
+
+    def _builtin_substring(self, node):
+        if len(node.arguments) not in (2, 3):
+            raise RuntimeErrorKozak(f"Function 'substring' expects 2 or 3 arguments, {self._term}.")
+        string = self.eval(node.arguments[0])
+        start = self.eval(node.arguments[1])
+        end = self.eval(node.arguments[2]) if len(node.arguments) == 3 else len(string)
+        if not isinstance(string, str):
+            raise RuntimeErrorKozak(f"First argument must be a string, {self._term}.")
+        if not isinstance(start, int) or not isinstance(end, int):
+            raise RuntimeErrorKozak(f"Indices must be integers, {self._term}.")
+        return string[start:end]
+
+    def _builtin_create_matrix(self, node):
+        if len(node.arguments) not in (2, 3):
+            raise RuntimeErrorKozak(f"Function 'create_matrix' expects 2 or 3 arguments (rows, cols, [fill_value]), {self._term}.")
+        
+        rows = self.eval(node.arguments[0])
+        cols = self.eval(node.arguments[1])
+        fill_value = self.eval(node.arguments[2]) if len(node.arguments) == 3 else 0
+        
+        if not isinstance(rows, int) or not isinstance(cols, int):
+            raise RuntimeErrorKozak(f"Rows and columns must be integers, {self._term}.")
+        if rows <= 0 or cols <= 0:
+            raise RuntimeErrorKozak(f"Matrix dimensions must be positive, {self._term}.")
+        
+        return KozakMatrix.filled(rows, cols, fill_value)
+
+    def _builtin_matrix_size(self, node):
+        """Get matrix dimensions."""
+        if len(node.arguments) != 1:
+            raise RuntimeErrorKozak(f"Function 'matrix_size' expects 1 argument, {self._term}.")
+        
+        matrix = self.eval(node.arguments[0])
+        if not isinstance(matrix, list):
+            raise RuntimeErrorKozak(f"Argument must be an array, {self._term}.")
+        
+        if not matrix or not isinstance(matrix[0], list):
+            return [len(matrix), 0]  # 1D array or empty
+        
+        return [len(matrix), len(matrix[0])]
+
+    def _builtin_flatten(self, node):
+        """Flatten a multidimensional array."""
+        if len(node.arguments) != 1:
+            raise RuntimeErrorKozak(f"Function 'flatten' expects 1 argument, {self._term}.")
+        
+        arr = self.eval(node.arguments[0])
+        if not isinstance(arr, list):
+            raise RuntimeErrorKozak(f"Argument must be an array, {self._term}.")
+        
+        def flatten_recursive(lst):
+            result = []
+            for item in lst:
+                if isinstance(item, list):
+                    result.extend(flatten_recursive(item))
+                else:
+                    result.append(item)
+            return result
+        
+        return flatten_recursive(arr)
+
+    def _builtin_transpose(self, node):
+        """Transpose a 2D matrix."""
+        if len(node.arguments) != 1:
+            raise RuntimeErrorKozak(f"Function 'transpose' expects 1 argument, {self._term}.")
+        
+        matrix = self.eval(node.arguments[0])
+        if not isinstance(matrix, list) or not matrix:
+            raise RuntimeErrorKozak(f"Argument must be a non-empty array, {self._term}.")
+        
+        if not all(isinstance(row, list) for row in matrix):
+            raise RuntimeErrorKozak(f"Argument must be a 2D array, {self._term}.")
+        
+        # Check all rows have same length
+        if not all(len(row) == len(matrix[0]) for row in matrix):
+            raise RuntimeErrorKozak(f"All rows must have the same length for transpose, {self._term}.")
+        
+        return KozakMatrix(map(list, zip(*matrix)))
+
+    def _builtin_get_row(self, node):
+        """Get row from matrix."""
+        if len(node.arguments) != 2:
+            raise RuntimeErrorKozak(f"Function 'get_row' expects 2 arguments (matrix, row_index), {self._term}.")
+        
+        matrix = self.eval(node.arguments[0])
+        row_idx = self.eval(node.arguments[1])
+        
+        if not isinstance(matrix, list):
+            raise RuntimeErrorKozak(f"First argument must be an array, {self._term}.")
+        if not isinstance(row_idx, int):
+            raise RuntimeErrorKozak(f"Row index must be an integer, {self._term}.")
+        if row_idx < 0 or row_idx >= len(matrix):
+            raise RuntimeErrorKozak(f"Row index out of bounds, {self._term}.")
+        
+        return matrix[row_idx]
+
+    def _builtin_get_col(self, node):
+        """Get column from matrix."""
+        if len(node.arguments) != 2:
+            raise RuntimeErrorKozak(f"Function 'get_col' expects 2 arguments (matrix, col_index), {self._term}.")
+        
+        matrix = self.eval(node.arguments[0])
+        col_idx = self.eval(node.arguments[1])
+        
+        if not isinstance(matrix, list) or not matrix:
+            raise RuntimeErrorKozak(f"First argument must be a non-empty array, {self._term}.")
+        if not isinstance(col_idx, int):
+            raise RuntimeErrorKozak(f"Column index must be an integer, {self._term}.")
+        
+        if not all(isinstance(row, list) for row in matrix):
+            raise RuntimeErrorKozak(f"Argument must be a 2D array, {self._term}.")
+        
+        if col_idx < 0 or (matrix and col_idx >= len(matrix[0])):
+            raise RuntimeErrorKozak(f"Column index out of bounds, {self._term}.")
+        
+        return [row[col_idx] for row in matrix]
+
+    def _builtin_set_at(self, node):
+        """Set value at position in multidimensional array."""
+        if len(node.arguments) < 3:
+            raise RuntimeErrorKozak(f"Function 'set_at' expects at least 3 arguments (array, indices..., value), {self._term}.")
+        
+        arr = self.eval(node.arguments[0])
+        if not isinstance(arr, list):
+            raise RuntimeErrorKozak(f"First argument must be an array, {self._term}.")
+        
+        # All arguments except last are indices, last is the value
+        indices = [self.eval(node.arguments[i]) for i in range(1, len(node.arguments) - 1)]
+        value = self.eval(node.arguments[-1])
+        
+        # Navigate to the target position
+        current = arr
+        for i, idx in enumerate(indices[:-1]):
+            if not isinstance(idx, int):
+                raise RuntimeErrorKozak(f"Index {i+1} must be an integer, {self._term}.")
+            if idx < 0 or idx >= len(current):
+                raise RuntimeErrorKozak(f"Index {i+1} out of bounds, {self._term}.")
+            current = current[idx]
+        
+        # Set the final value
+        last_idx = indices[-1]
+        if not isinstance(last_idx, int):
+            raise RuntimeErrorKozak(f"Last index must be an integer, {self._term}.")
+        if last_idx < 0 or last_idx >= len(current):
+            raise RuntimeErrorKozak(f"Last index out of bounds, {self._term}.")
+        
+        current[last_idx] = value
+        return None
+
+    def _builtin_remove_key(self, node):
+        if len(node.arguments) != 2:
+            raise RuntimeErrorKozak(f"Function 'remove_key' expects exactly 2 arguments (dictionary, key), {self._term}.")
+        
+        dictionary = self.eval(node.arguments[0])
+        key = self.eval(node.arguments[1])
+        
+        return self._kozak_remove_key(dictionary, key)
+
+    def _builtin_insert(self, node):
+        if len(node.arguments) != 3:
+            raise RuntimeErrorKozak(f"Function 'insert' expects exactly 3 arguments, {self._term}.")
+        arr = self.eval(node.arguments[0])
+        index = self.eval(node.arguments[1])
+        value = self.eval(node.arguments[2])
+        if not isinstance(arr, list):
+            raise RuntimeErrorKozak(f"First argument of 'insert' must be an array, {self._term}.")
+        if not isinstance(index, int):
+            raise RuntimeErrorKozak(f"Second argument of 'insert' must be an integer, {self._term}.")
+        if index < 0 or index > len(arr):
+            raise RuntimeErrorKozak(f"Array index out of bounds, {self._term}.")
+        arr.insert(index, value)
+        return None
+
+    def _builtin_append(self, node):
+        if len(node.arguments) != 2:
+            raise RuntimeErrorKozak(f"Function 'append' expects exactly 2 arguments, {self._term}.")
+        arr = self.eval(node.arguments[0])
+        value = self.eval(node.arguments[1])
+        if not isinstance(arr, list):
+            raise RuntimeErrorKozak(f"First argument of 'append' must be an array, {self._term}.")
+        arr.append(value)
+        return None
+
+    def _builtin_index_of(self, node):
+        if len(node.arguments) != 2:
+            raise RuntimeErrorKozak(f"Function 'index_of' expects exactly 2 arguments, {self._term}.")
+        arr = self.eval(node.arguments[0])
+        value = self.eval(node.arguments[1])
+        if not isinstance(arr, list):
+            raise RuntimeErrorKozak(f"First argument of 'index_of' must be an array, {self._term}.")
+        try:
+            return arr.index(value)
+        except ValueError:
+            return -1
+
+    def _builtin_contains(self, node):
+        if len(node.arguments) != 2:
+            raise RuntimeErrorKozak(f"Function 'contains' expects exactly 2 arguments, {self._term}.")
+        arr = self.eval(node.arguments[0])
+        value = self.eval(node.arguments[1])
+        if not isinstance(arr, list):
+            raise RuntimeErrorKozak(f"First argument of 'contains' must be an array, {self._term}.")
+        return value in arr
+
+    def _builtin_slice(self, node):
+        if len(node.arguments) not in (2, 3):
+            raise RuntimeErrorKozak(f"Function 'slice' expects 2 or 3 arguments, {self._term}.")
+        arr = self.eval(node.arguments[0])
+        start = self.eval(node.arguments[1])
+        end = self.eval(node.arguments[2]) if len(node.arguments) == 3 else None
+        if not isinstance(arr, list):
+            raise RuntimeErrorKozak(f"First argument of 'slice' must be an array, {self._term}.")
+        if not isinstance(start, int) or (end is not None and not isinstance(end, int)):
+            raise RuntimeErrorKozak(f"Start and end arguments must be integers, {self._term}.")
+        return arr[start:end]
+
+    def _builtin_clear(self, node):
+        if len(node.arguments) != 1:
+            raise RuntimeErrorKozak(f"Function 'clear' expects exactly 1 argument, {self._term}.")
+        arr = self.eval(node.arguments[0])
+        if not isinstance(arr, list):
+            raise RuntimeErrorKozak(f"Argument of 'clear' must be an array, {self._term}.")
+        arr.clear()
+        return None
+
+    def _builtin_pop(self, node):
+        if len(node.arguments) != 1:
+            raise RuntimeErrorKozak(f"Function 'pop' expects exactly 1 argument, {self._term}.")
+        arr = self.eval(node.arguments[0])
+        if not isinstance(arr, list):
+            raise RuntimeErrorKozak(f"Argument of 'pop' must be an array, {self._term}.")
+        if not arr:
+            raise RuntimeErrorKozak(f"Cannot pop from empty array, {self._term}.")
+        return arr.pop()
+
+    def _builtin_remove(self, node):
+        if len(node.arguments) != 2:
+            raise RuntimeErrorKozak(f"Function 'remove' expects exactly 2 arguments, {self._term}.")
+        arr = self.eval(node.arguments[0])
+        index = self.eval(node.arguments[1])
+        if not isinstance(arr, list):
+            raise RuntimeErrorKozak(f"First argument of 'remove' must be an array, {self._term}.")
+        if not isinstance(index, int):
+            raise RuntimeErrorKozak(f"Second argument of 'remove' must be an integer, {self._term}.")
+        if index < 0 or index >= len(arr):
+            raise RuntimeErrorKozak(f"Array index out of bounds, {self._term}.")
+        arr.pop(index)
+        return None
+
+    def _builtin_write(self, node):
+        if len(node.arguments) < 2 or len(node.arguments) > 3:
+            raise RuntimeErrorKozak(f"Function 'Write' expects 2 or 3 arguments, {self._term}.")
+        file_name = self.eval(node.arguments[0])
+        content = self.eval(node.arguments[1])
+        if isinstance(file_name, FileHandle):
+            if len(node.arguments) == 3:
+                raise RuntimeErrorKozak(f"Function 'Write' expects 2 arguments when writing to an open file, {self._term}.")
+            return self._write_to_handle(file_name, content)
+
+        append_mode = False
+        if len(node.arguments) == 3:
+            append_mode = bool(self.eval(node.arguments[2]))
+        
+        if not isinstance(file_name, str):
+            raise RuntimeErrorKozak(f"First argument for 'Write' (file name) must be a string, {self._term}.")
+        
+        try:
+            self._write_cache.write(file_name, str(content), append_mode)
+            return None
+        except IOError as e:
+            raise RuntimeErrorKozak(f"File writing error: {e}")
+
+    def _write_to_handle(self, handle, content):
+        f = handle.file
+        if f.closed:
+            raise RuntimeErrorKozak(f"Cannot write to a closed file, {self._term}.")
+        if 'b' in f.mode:
+            content = content if isinstance(content, bytes) else str(content).encode('utf-8')
+        else:
+            content = content.decode('utf-8') if isinstance(content, bytes) else str(content)
+        try:
+            f.write(content)
+            return None
+        except IOError as e:
+            raise RuntimeErrorKozak(f"File writing error: {e}")
+
+    def _builtin_open(self, node):
+        """Open a file for writing: mode is "w" (default), "a", "wb" or "ab"."""
+        if len(node.arguments) not in (1, 2, 3):
+            raise RuntimeErrorKozak(f"Function 'Open' expects 1 to 3 arguments (file name, [mode], [buffer size]), {self._term}.")
+        file_name = self.eval(node.arguments[0])
+        mode = self.eval(node.arguments[1]) if len(node.arguments) >= 2 else 'w'
+        buffer_size = self.eval(node.arguments[2]) if len(node.arguments) == 3 else -1
+
+        if not isinstance(file_name, str):
+            raise RuntimeErrorKozak(f"First argument for 'Open' (file name) must be a string, {self._term}.")
+        if mode not in ('w', 'a', 'wb', 'ab'):
+            raise RuntimeErrorKozak(f"File mode must be \"w\", \"a\", \"wb\" or \"ab\", {self._term}.")
+        if len(node.arguments) == 3:
+            # 1 means line buffering, which only text files have
+            if not isinstance(buffer_size, int) or isinstance(buffer_size, bool) or buffer_size < 1 \
+                    or (buffer_size == 1 and 'b' in mode):
+                raise RuntimeErrorKozak(f"Buffer size must be a positive integer (1 for line buffering of text files), {self._term}.")
+
+        self._write_cache.release(file_name)
+        try:
+            if 'b' in mode:
+                f = open(file_name, mode, buffering=buffer_size)
+            else:
+                f = open(file_name, mode, buffering=buffer_size, encoding='utf-8')
+        except IOError as e:
+            raise RuntimeErrorKozak(f"File opening error: {e}")
+        handle = FileHandle(f)
+        self._file_handles.add(handle)
+        return handle
+
+    def _builtin_flush(self, node):
+        """Write out what is buffered for one open file, or for every file when called without arguments."""
+        if len(node.arguments) > 1:
+            raise RuntimeErrorKozak(f"Function 'Flush' expects 0 or 1 arguments, {self._term}.")
+        if not node.arguments:
+            self.flush_files()
+            return None
+        handle = self._file_handle_argument(node, 'Flush')
+        if not handle.file.closed:
+            handle.file.flush()
+        return None
+
+    def _builtin_close(self, node):
+        if len(node.arguments) != 1:
+            raise RuntimeErrorKozak(f"Function 'Close' expects exactly 1 argument, {self._term}.")
+        handle = self._file_handle_argument(node, 'Close')
+        handle.file.close()
+        self._file_handles.discard(handle)
+        return None
+
+    def _file_handle_argument(self, node, function_name):
+        handle = self.eval(node.arguments[0])
+        if not isinstance(handle, FileHandle):
+            raise RuntimeErrorKozak(f"Argument for '{function_name}' must be a file returned by 'Open', {self._term}.")
+        return handle
+
+    def flush_files(self):
+        """Push buffered writes of open files and of one-shot Write calls to disk."""
+        self._write_cache.flush()
+        for handle in self._file_handles:
+            handle.file.flush()
+
+    def close_files(self):
+        """Close every file the program left open; called when it finishes."""
+        self._write_cache.close()
+        while self._file_handles:
+            self._file_handles.pop().file.close()
+
+    def _builtin_read(self, node):
+        if len(node.arguments) != 1:
+            raise RuntimeErrorKozak(f"Function 'Read' expects exactly 1 argument, {self._term}.")
+        file_name = self.eval(node.arguments[0])
+        if not isinstance(file_name, str):
+            raise RuntimeErrorKozak(f"Argument for 'Read' must be a string, {self._term}.")
+        self._write_cache.flush(file_name)
+        try:
+            with open(file_name, 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            raise RuntimeErrorKozak(f"File '{file_name}' not found, {self._term}.")
+        except IOError as e:
+            raise RuntimeErrorKozak(f"File reading error: {e}")
+
+    def _builtin_read_lines(self, node):
+        """Stream a file line by line, without the line endings."""
+        if len(node.arguments) not in (1, 2):
+            raise RuntimeErrorKozak(f"Function 'Read_lines' expects 1 or 2 arguments (file name, [binary]), {self._term}.")
+        file_name = self.eval(node.arguments[0])
+        binary = len(node.arguments) == 2 and bool(self.eval(node.arguments[1]))
+        return FileStream(self._open_for_reading('Read_lines', file_name, binary))
+
+    def _builtin_read_chunks(self, node):
+        """Stream a file in pieces of at most `size` characters (or bytes in binary mode)."""
+        if len(node.arguments) not in (2, 3):
+            raise RuntimeErrorKozak(f"Function 'Read_chunks' expects 2 or 3 arguments (file name, size, [binary]), {self._term}.")
+        file_name = self.eval(node.arguments[0])
+        size = self.eval(node.arguments[1])
+        binary = len(node.arguments) == 3 and bool(self.eval(node.arguments[2]))
+        if not isinstance(size, int) or isinstance(size, bool) or size <= 0:
+            raise RuntimeErrorKozak(f"Chunk size for 'Read_chunks' must be a positive integer, {self._term}.")
+        return FileStream(self._open_for_reading('Read_chunks', file_name, binary), size)
+
+    def _open_for_reading(self, function_name, file_name, binary):
+        if not isinstance(file_name, str):
+            raise RuntimeErrorKozak(f"First argument for '{function_name}' (file name) must be a string, {self._term}.")
+        self._write_cache.flush(file_name)
+        try:
+            if binary:
+                return open(file_name, 'rb')
+            return open(file_name, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            raise RuntimeErrorKozak(f"File '{file_name}' not found, {self._term}.")
+        except IOError as e:
+            raise RuntimeErrorKozak(f"File reading error: {e}")
+
+    def _builtin_length(self, node):
+        if len(node.arguments) != 1:
+            raise RuntimeErrorKozak(f"Function 'length' expects exactly 1 argument, {self._term}.")
+        arg = self.eval(node.arguments[0])
+        if not isinstance(arg, (list, str, tuple, bytes)):
+            raise RuntimeErrorKozak(f"Argument for 'length' must be an array or a string, {self._term}.")
+        return len(arg)
+
+    def _builtin_randint(self, node):
+        if len(node.arguments) != 2:
+            raise RuntimeErrorKozak(f"Function 'randint' expects exactly 2 arguments, {self._term}.")
+        start = self.eval(node.arguments[0])
+        end = self.eval(node.arguments[1])
+        if not isinstance(start, int) or not isinstance(end, int):
+            raise RuntimeErrorKozak(f"Arguments for 'randint' must be integers, {self._term}.")
+        return random.randint(start, end)
+
+    def _builtin_keys(self, node):
+        if len(node.arguments) != 1:
+            raise RuntimeErrorKozak(f"Function 'keys' expects exactly 1 argument, {self._term}.")
+        dictionary = self.eval(node.arguments[0])
+        if not isinstance(dictionary, dict):
+            raise RuntimeErrorKozak(f"Argument must be a dictionary, {self._term}.")
+        return list(dictionary.keys())
+
+    def _builtin_values(self, node):
+        if len(node.arguments) != 1:
+            raise RuntimeErrorKozak(f"Function 'values' expects exactly 1 argument, {self._term}.")
+        dictionary = self.eval(node.arguments[0])
+        if not isinstance(dictionary, dict):
+            raise RuntimeErrorKozak(f"Argument must be a dictionary, {self._term}.")
+        return list(dictionary.values())
+
+    def _builtin_has_key(self, node):
+        if len(node.arguments) != 2:
+            raise RuntimeErrorKozak(f"Function 'has_key' expects exactly 2 arguments, {self._term}.")
+        dictionary = self.eval(node.arguments[0])
+        key = self.eval(node.arguments[1])
+        if not isinstance(dictionary, dict):
+            raise RuntimeErrorKozak(f"First argument must be a dictionary, {self._term}.")
+        return key in dictionary
+
     def _eval_array(self, node):
         return [self.eval(element) for element in node.elements]
 
@@ -1213,19 +1487,11 @@ class Interpreter:
         
         if not isinstance(array, list):
             raise RuntimeErrorKozak("Only arrays can be indexed!")
-        
-        if not isinstance(index, int):
-            raise RuntimeErrorKozak("Array index must be an integer!")
-
-        if index < 0 or index >= len(array):
-            raise RuntimeErrorKozak("Array index out of bounds!")
-
-        #return array[index]
-        return self._eval_dictionary_access(node)
+        return self._index_value(array, index)
     
     def _eval_for_each(self, node):
         array = self.eval(node.array_expr)
-        if not isinstance(array, list):
+        if not isinstance(array, (list, FileStream)):
             raise RuntimeErrorKozak(f"Can only iterate over arrays, {self._term}.")
         
         # Save original variable state if it exists, to be restored later
@@ -1234,12 +1500,14 @@ class Interpreter:
         
         for value in array:
             self.env[node.var_name] = value 
-            for stmt in node.body:
-                self.eval(stmt)
+            self._execute_block(node.body)
+            if self._returning:
+                break
         
         # Clean up / restore
         if is_new_var:
-             del self.env[node.var_name]
+             if node.var_name in self.env:  # an empty loop never bound it
+                 del self.env[node.var_name]
         elif original_var_value is not None:
              self.env[node.var_name] = original_var_value
 
@@ -1281,16 +1549,15 @@ class Interpreter:
     def eval_PropertyAccessNode(self, node):
         """(KozakPropertyAccess) Accesses a field or method on an object instance."""
         obj = self.eval(node.instance)
-        from core.modules.math_module import MathModule
-        from core.modules.hash import HashModule
-        from core.modules.game_module import GameModule
-        
-        
-        if isinstance(obj, (MathModule, HashModule, GameModule)):
+        return self._get_property(obj, node.property_name)
+
+    def _get_property(self, obj, property_name):
+        """Read a field or method from an already evaluated object or module."""
+        if obj.__class__ in MODULE_CLASSES:
                 try:
-                    attr = getattr(obj, node.property_name)
+                    attr = getattr(obj, property_name)
                 except ValueError as e:
-                    # __getattribute__ dialect guard raised this
+                    # GameView raises this for a name outside the program's dialect
                     obj._emergency_quit()
                     raise RuntimeErrorKozak(str(e))
                 if not callable(attr):
@@ -1299,14 +1566,14 @@ class Interpreter:
             
         
         if not isinstance(obj, oop.Instance):
-            raise RuntimeErrorKozak(f"Cannot access property '{node.property_name}' on non-object of type {type(obj).__name__}")
+            raise RuntimeErrorKozak(f"Cannot access property '{property_name}' on non-object of type {type(obj).__name__}")
         
         calling_instance = None
         if 'this' in self.env and isinstance(self.env['this'], oop.Instance):
             calling_instance = self.env['this']
         
         try:
-            return obj.get(node.property_name, calling_instance, self.current_function)  # ← ADD current_function
+            return obj.get(property_name, calling_instance, self.current_function)  # ← ADD current_function
         except RuntimeError as e:
             raise RuntimeErrorKozak(str(e))
 
@@ -1314,7 +1581,10 @@ class Interpreter:
         """(KozakPropertyAssign) Assigns a value to a field on an object instance OR dictionary key."""
         obj = self.eval(node.instance)
         value = self.eval(node.value)
-        
+        return self._assign_property(node, obj, value)
+
+    def _assign_property(self, node, obj, value):
+        """Store an evaluated value into an evaluated target; the key of node is evaluated here."""
         # Handle dictionary assignment
         if isinstance(obj, dict):
             key = self.eval(node.property_name) if hasattr(node.property_name, '__class__') and node.property_name.__class__.__name__.startswith('Kozak') else node.property_name
@@ -1339,20 +1609,24 @@ class Interpreter:
         if not isinstance(obj, oop.Instance):
             raise RuntimeErrorKozak(f"Cannot set property '{node.property_name}' on non-object of type {type(obj).__name__}")
         
+        if isinstance(node.property_name, str):
+            self._set_field(obj, node.property_name, value)
+        else: 
+            prop_name = self.eval(node.property_name)
+            self._set_field(obj, str(prop_name), value)
+        
+        return value
+
+    def _set_field(self, obj, name, value):
+        """Assign a field of an object instance, enforcing its access modifiers."""
         calling_instance = None
         if 'this' in self.env and isinstance(self.env['this'], oop.Instance):
             calling_instance = self.env['this']
         
         try:
-            if isinstance(node.property_name, str):
-                obj.set(node.property_name, value, calling_instance, self.current_function)  # ← ADD current_function
-            else: 
-                prop_name = self.eval(node.property_name)
-                obj.set(str(prop_name), value, calling_instance, self.current_function)  # ← ADD current_function
+            obj.set(name, value, calling_instance, self.current_function)  # ← ADD current_function
         except RuntimeError as e:
             raise RuntimeErrorKozak(str(e))
-        
-        return value
 
 
     
@@ -1404,9 +1678,19 @@ class Interpreter:
         return result
 
     def _eval_dictionary_access(self, node):
-        dictionary = self.eval(node.dictionary)
+        container = node.dictionary
+        if container.__class__ is KozakDictionaryAccess:
+            # m[i][j]: fetch the row directly instead of dispatching it through eval
+            dictionary = self._eval_dictionary_access(container)
+        else:
+            dictionary = self.eval(container)
         key = self.eval(node.key)
-        
+        if dictionary.__class__ in LIST_TYPES and key.__class__ is int and 0 <= key < len(dictionary):
+            return dictionary[key]
+        return self._index_value(dictionary, key)
+
+    def _index_value(self, dictionary, key):
+        """Look up key in an already evaluated dictionary or array."""
         # Handle both dictionaries and arrays
         if isinstance(dictionary, dict):
             if key not in dictionary:
@@ -1433,83 +1717,47 @@ class Interpreter:
         return None
     
     def _eval_try(self, node):
-        exception_caught = None
-        exception_value = None
-
         try:
-            for stmt in node.try_body:
-                self.eval(stmt)
-        except ReturnValue as e:  # Don't catch returns - let them propagate!
-            # Execute finally block first, then re-raise
-            if node.finally_body:
-                for stmt in node.finally_body:
-                    self.eval(stmt)
-            raise  # Re-raise the ReturnValue to propagate it up
-            
-        except RuntimeErrorKozak as e:
-            exception_caught = True
-            exception_value = str(e)
-
-            if node.catch_clauses:
-                exception_var, catch_body = node.catch_clauses[0]
-
-                if exception_var:
-                    original_value = self.env.get(exception_var)
-                    self.env[exception_var] = exception_value
-
-                try:
-                    for stmt in catch_body:
-                        self.eval(stmt)
-                except ReturnValue as e:  # If catch block returns, let it propagate
-                    if node.finally_body:
-                        for stmt in node.finally_body:
-                            self.eval(stmt)
-                    raise
-                
-                finally: 
-                    if exception_var:
-                        if original_value is not None:
-                            self.env[exception_var] = original_value
-                        elif exception_var in self.env:
-                            del self.env[exception_var]
-            else:
-                raise
-
+            self._execute_block(node.try_body)
+        except ReturnValue:
+            # Top-level return from an imported file is not an error
+            raise
         except Exception as e:
-            exception_caught = True
-            exception_value = str(e)
-            if node.catch_clauses:
-                exception_var, catch_body = node.catch_clauses[0]
-
-                if exception_var:
-                    original_value = self.env.get(exception_var)
-                    self.env[exception_var] = exception_value
-                
-                try:
-                    for stmt in catch_body:
-                        self.eval(stmt)
-                except ReturnValue as e:  # If catch block returns, let it propagate
-                    if node.finally_body:
-                        for stmt in node.finally_body:
-                            self.eval(stmt)
-                    raise
-                
-                finally:
-                    if exception_var:
-                        if original_value is not None:
-                            self.env[exception_var] = original_value
-                        elif exception_var in self.env:
-                            del self.env[exception_var]
-            else:
+            if not node.catch_clauses:
                 raise
-
+            exception_var, catch_body = node.catch_clauses[0]
+            self._run_catch(exception_var, catch_body, str(e))
         finally:
             if node.finally_body:
-                for stmt in node.finally_body:
-                    self.eval(stmt)
+                self._run_finally(node.finally_body)
         
-        # Try block completed without returning - this is normal
         return None
+
+    def _run_catch(self, exception_var, catch_body, exception_value):
+        if exception_var:
+            original_value = self.env.get(exception_var)
+            self.env[exception_var] = exception_value
+
+        try:
+            self._execute_block(catch_body)
+        finally:
+            if exception_var:
+                if original_value is not None:
+                    self.env[exception_var] = original_value
+                elif exception_var in self.env:
+                    del self.env[exception_var]
+
+    def _run_finally(self, finally_body):
+        """
+        Run a finally block exactly once. A return pending from the try or
+        catch block survives it, unless the finally block returns itself.
+        """
+        returning, return_value = self._returning, self._return_value
+        self._returning = False
+        self._execute_block(finally_body)
+        if not self._returning:
+            self._returning, self._return_value = returning, return_value
+
     def _eval_throw(self, node):
         message = self.eval(node.message)
         raise RuntimeErrorKozak(str(message))
@@ -1529,6 +1777,7 @@ class Interpreter:
             if exit_code < 0 or exit_code > 255:
                 raise RuntimeErrorKozak("Exit code must be between 0 and 255, {self._term}.")
         self.exit_code = exit_code
+        self.flush_files()
         raise ProgramExit(exit_code)
     
     def _eval_import(self, node):
@@ -1537,74 +1786,14 @@ class Interpreter:
         if not isinstance(file_path, str):
             raise RuntimeErrorKozak(f"Import file path must be a string, got {type(file_path).__name__} {self._term}.")
 
-        # Define these once, shared by both the alias path and the direct path below
-        built_in_modules = {
-            "hash": "core.modules.hash",
-            "math": "core.modules.math_module",
-            "game": "core.modules.game_module",
-        }
-        class_mapping = {
-            "hash": "HashModule",
-            "math": "MathModule",
-            "game": "GameModule",
-        }
-
-        canonical_name = MODULE_NAME_TRANSLATIONS.get(file_path, None)
-
-        if canonical_name and canonical_name in built_in_modules:
-            module_path = built_in_modules[canonical_name]
-            try:
-                module = __import__(module_path, fromlist=[''])
-                class_name = class_mapping.get(canonical_name)  # ← now defined
-                if class_name and hasattr(module, class_name):
-                    module_class = getattr(module, class_name)
-                    module_instance = (
-                        module_class(dialect=self.parent_dialect)
-                        if canonical_name == "game"
-                        else module_class()
-                    )
-                    self.modules[canonical_name] = module_instance
-                    self.modules[file_path] = module_instance
-                    self.env[file_path] = module_instance
-                    return None
-                else:
-                    raise RuntimeErrorKozak(
-                        f"Built-in module '{file_path}' missing '{class_name}' class, {self._term}."
-                    )
-            except RuntimeErrorKozak:
-                raise  # don't swallow your own errors
-            except Exception as e:
-                raise RuntimeErrorKozak(
-                    f"Failed to load built-in module '{file_path}', {self._term}: {e}"
-                )
+        canonical_name = MODULE_NAME_TRANSLATIONS.get(file_path, file_path)
 
-        if file_path in built_in_modules:
-            module_path = built_in_modules[file_path]
-            try:
-                module = __import__(module_path, fromlist=[''])
-                class_name = class_mapping.get(file_path)
-                if class_name and hasattr(module, class_name):
-                    module_class = getattr(module, class_name)
-                    module_instance = (
-                        module_class(dialect=self.parent_dialect)
-                        if file_path == "game"
-                        else module_class()
-                    )
-                    self.modules[file_path] = module_instance
-                    self.env[file_path] = module_instance
-                    return None
-                else:
-                    raise RuntimeErrorKozak(
-                        f"Built-in module '{file_path}' missing '{class_name}' class, {self._term}."
-                    )
-            except RuntimeErrorKozak:
-                raise
-            except Exception as e:
-                raise RuntimeErrorKozak(
-                    f"Failed to load built-in module '{file_path}', {self._term}: {e}"
-                )
+        if canonical_name in BUILTIN_MODULES:
+            module_instance = self._load_module(canonical_name)
+            self.modules[file_path] = module_instance
+            self.env[file_path] = module_instance
+            return None
 
-    
         if self.current_file_dir:
             full_path = os.path.join(self.current_file_dir, file_path)
         else:
@@ -1624,6 +1813,7 @@ class Interpreter:
             raise RuntimeErrorKozak(f"Can only import .kozak files, got '{file_path}'.")
         
         self.imported_files.add(full_path)
+        self._write_cache.flush(full_path)
 
         try:
             with open(full_path, 'r', encoding='utf-8') as f:
@@ -1633,17 +1823,17 @@ class Interpreter:
             raise RuntimeErrorKozak(f"Error reading import file '{full_path}': {e}")
         
         try:
-            from core.parser import Parser
-            from core.lexer import lex
+            from core.ast_cache import load_program, parse_program
 
-            tokens = list(lex(code))
-            parser = Parser(tokens, strict_dialect=self.strict_dialect)
-            if self.strict_dialect and self.parent_dialect:
-                parser.detected_dialect = self.parent_dialect
-            ast = parser.parse()
+            preset_dialect = self.parent_dialect if self.strict_dialect else None
+            if self.use_ast_cache:
+                program = load_program(full_path, code, self.strict_dialect, preset_dialect)
+            else:
+                program = parse_program(code, self.strict_dialect, preset_dialect)
+            ast = program.ast
 
-            if parser.errors:
-                error_messages = '\n'.join(parser.errors)
+            if program.errors:
+                error_messages = '\n'.join(program.errors)
                 raise RuntimeErrorKozak(f"Errors in imported file, {self._term} '{full_path}':\n{error_messages}")
         
         except SyntaxError as e:
@@ -1669,9 +1859,18 @@ class Interpreter:
             return self.functions[name]
         raise RuntimeErrorKozak(f'Variable {name} is not defined')
 
+    def _load_module(self, name):
+        """Look up a module, importing and creating a built-in one on first use."""
+        try:
+            return self.modules[name]
+        except Exception as e:
+            raise RuntimeErrorKozak(
+                f"Failed to load built-in module '{name}', {self._term}: {e}"
+            )
+
     def import_module(self, name):
         if name in self.modules:
-            return self.modules[name]
+            return self._load_module(name)
         raise RuntimeErrorKozak(f"Module '{name}' not found, {self._term}!")
 
     def _eval_super(self, node):
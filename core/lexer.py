@@ -235,7 +235,7 @@ KEYWORDS = {
     }
 
 TOKEN_SPECIFICATION = [
-    ('SYMBOLIC_MULTI', r'>>>|_\+_\+_|<<<|<->|<=>|##>|\+\+>|-->|\^>|1!|0!|!!>|!!|i`\*\*|f`\*\*|s`\*\*|b`\*\*|\+@|@=|@~|~`|~~|\?\?|\?!|<!|-<!|___|\[\.\.\]|->|::|<<|>>|<>|=<|=>|\+<|\+:|\?\^|-<|-<!|--<|\?:|-<|--<|k\{\}|v\{\}|\?k|-k|@\[\]|#\[\]|\[\]>|\[\]\^|\[\]->|\[\]\||\[\]:='),
+    ('SYMBOLIC_MULTI', r'>>>|_\+_\+_|<<<|<->|<=>|##>|\+\+>|-->|\^>|1!|0!|!!>|!!|i`\*\*|f`\*\*|s`\*\*|b`\*\*|\+@|@=|@~|~`|~~|\?\?|\?!|<!|-<!|___|\[\.\.\]|->|::|<<|>>|<>|=<\||=<#|=<|=>\+|=>~|=>-|=>|\+<|\+:|\?\^|-<|-<!|--<|\?:|-<|--<|k\{\}|v\{\}|\?k|-k|@\[\]|#\[\]|\[\]>|\[\]\^|\[\]->|\[\]\||\[\]:='),
     ('NUMBER', r'\d+(\.\d*)?'),
     ('STRING', r'"[^"]*"|\'[^\']*\''),
     ('MLCOMMENT', r'/\*.*?\*/'), 
@@ -292,7 +292,7 @@ DIALECT_KEYWORDS = {
             'tsey', 'Sprobuy', 'Piymat', 'Vkintsi', 'Kydaty', 'Vykhid', 'Importuvaty',
             'znachennya', 'maye_klyuch', 'vydalyty_klyuch',
             'dodaty', 'vstavyty', 'vydalyty', 'vyinyaty', 'ochystyty', 'vyrizaty',
-            'mistyt', 'index_z', 'Zapysaty', 'Chytaty', 'stvoryty_matrytsyu', 'rozmir_matrytsi', 'splushchyty', 'transportuvaty',
+            'mistyt', 'index_z', 'Zapysaty', 'Chytaty', 'Chytaty_ryadky', 'Chytaty_chastyny', 'Vidkryty', 'Skynuty', 'Zakryty', 'stvoryty_matrytsyu', 'rozmir_matrytsi', 'splushchyty', 'transportuvaty',
             'otrymaty_ryadok', 'otrymaty_stovpets', 'vstanovyty_na', 'Vidkrytyy', 'Zakrytyy', 'Zakhyshchenyy', 'Batko', 'Druh',
             'Znyshchyty', 'Statychnyy', 'vypadkove_chyslo'
         },
@@ -303,7 +303,7 @@ DIALECT_KEYWORDS = {
             'new', 'this', 'Try', 'Catch', 'Finally', 'Throw', 'Exit', 'Import',
             'keys', 'values', 'has_key', 'remove_key',
             'append', 'insert', 'remove', 'pop', 'clear', 'slice',
-            'contains', 'index_of', 'Write', 'Read', 'create_matrix', 'matrix_size', 'flatten', 'transpose',
+            'contains', 'index_of', 'Write', 'Read', 'Read_lines', 'Read_chunks', 'Open', 'Flush', 'Close', 'create_matrix', 'matrix_size', 'flatten', 'transpose',
             'get_row', 'get_col', 'set_at', 'Public', 'Private', 'Protected', 'Super', 'Friend', 'Destroy', 'Static', 'randint'
         },
         'russian_latin': {
@@ -313,7 +313,7 @@ DIALECT_KEYWORDS = {
             'etot', 'Poprobuy', 'Poymat', 'Nakonets', 'Brosat', 'Vykhod', 'Importirovat',
             'znachennie', 'imeet_klyuch', 'udalit_klyuch',
             'dobavit', 'vstavit', 'udalit', 'vytaschit', 'ochistit', 'vyrezat',
-            'soderzhit', 'index_znachenia', 'Zapisat', 'Chitat','sozdat_matritsu', 'razmer_matritsy', 'spluschit', 'transportirovat',
+            'soderzhit', 'index_znachenia', 'Zapisat', 'Chitat', 'Chitat_stroki', 'Chitat_chasti', 'Otkryt', 'Sbrosit', 'Zakryt', 'sozdat_matritsu', 'razmer_matritsy', 'spluschit', 'transportirovat',
             'poluchit_stroku', 'poluchit_stolbets', 'ustanovit_na', 'Otkrytyy', 'Zakrytyy', 'Zashchishchennyy', 'Roditel', 'Drug',
             'Unichtozhit', 'Statichnyy', 'sluchaynoye_chislo'
         },
@@ -324,7 +324,7 @@ DIALECT_KEYWORDS = {
             'цей', 'Спробуй', 'Піймати', 'Вкінці', 'Кидати', 'Вихід', 'Імпортувати',
             'значення', 'має_ключ', 'видалити_ключ',
             'додати', 'вставити', 'видалити', 'вийняти', 'очистити', 'вирізати',
-            'містить', 'індекс_значення', 'Записати', 'Читати', 'створити_матрицю', 'розмір_матриці', 'сплющити', 'транспонувати',
+            'містить', 'індекс_значення', 'Записати', 'Читати', 'Читати_рядки', 'Читати_частини', 'Відкрити', 'Скинути', 'Закрити', 'створити_матрицю', 'розмір_матриці', 'сплющити', 'транспонувати',
             'отримати_рядок', 'отримати_стовпець', 'встановити_на', 'Відкритий', 'Закритий', 'Захищений', 'Батько', 'Друг',
             'Знищити', 'Статичний', 'випадкове_число'},
 
@@ -335,7 +335,7 @@ DIALECT_KEYWORDS = {
             'этот', 'Попробуй', 'Поймать', 'Наконец', 'Бросать', 'Выход', 'Импортировать',
             'значения', 'имеет_ключ', 'удалить_ключ',
             'добавить', 'вставить', 'удалить', 'вытащить', 'очистить', 'вырезать',
-            'содержит', 'индекс_значения', 'Записать',  'Читать','создать_матрицу', 'размер_матрицы', 'сплющить', 'транспонировать',
+            'содержит', 'индекс_значения', 'Записать',  'Читать', 'Читать_строки', 'Читать_части', 'Открыть', 'Сбросить', 'Закрыть', 'создать_матрицу', 'размер_матрицы', 'сплющить', 'транспонировать',
             'получить_строку', 'получить_столбец', 'установить_на', 'Открытый', 'Закрытый', 'Защищённый', 'Родитель', 'Друг',
             'Уничтожить',  'Статичный', 'случайное_число'
         },
@@ -346,7 +346,7 @@ DIALECT_KEYWORDS = {
             '+@', '->', '<<', '>>', '<>', '!!>', '<<<', '#',
             r'k{}', r'v{}', '?k', '-k',
             '+<', '+:', '-<', '-<!', '--<', '[..]',
-            '?^', '?:', '=>', '=<', '@[]', '#[]', '[]>', '[]^', '[]->', '[]|', '[]:=', '++>', '-->', '##>', '^>', '<->', '@~', '@@', 
+            '?^', '?:', '=>', '=<', '=<|', '=<#', '=>+', '=>~', '=>-', '@[]', '#[]', '[]>', '[]^', '[]->', '[]|', '[]:=', '++>', '-->', '##>', '^>', '<->', '@~', '@@', 
         }
     }
 
@@ -402,19 +402,40 @@ KEYWORD_TRANSLATIONS = {
 
 
 
+# Compiled once at import; lex() is called for every run and every import
+TOKEN_REGEX = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern in TOKEN_SPECIFICATION),
+    re.DOTALL,
+)
+
+# Token kinds whose text can contain newlines
+MULTILINE_KINDS = ('MLCOMMENT', 'STRING')
+
+
 def lex(code):
-    tok_regex = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in TOKEN_SPECIFICATION)
-    tok_re = re.compile(tok_regex, re.DOTALL)
     detected_dialect = None
     conflicts=[]
 
+    # Position of the next token, advanced as we scan instead of recounting from the start
+    current_line = 1
+    line_start = 0
 
-    for match in re.finditer(tok_re, code):
+    for match in TOKEN_REGEX.finditer(code):
         kind = match.lastgroup
         value = match.group()
-        
-        line_num = code[:match.start()].count('\n') + 1
-        col_num = match.start() - code.rfind('\n', 0, match.start()) if '\n' in code[:match.start()] else match.start() + 1
+        start = match.start()
+
+        line_num = current_line
+        col_num = start - line_start + 1
+
+        if kind == 'NEWLINE':
+            current_line += 1
+            line_start = match.end()
+        elif kind in MULTILINE_KINDS:
+            newlines = value.count('\n')
+            if newlines:
+                current_line += newlines
+                line_start = start + value.rfind('\n') + 1
 
         if kind in ('SKIP', 'NEWLINE', 'MLCOMMENT', 'COMMENT'):
             continue
@@ -0,0 +1,76 @@
+"""Matrix values for KozakScript.
+
+create_matrix and transpose return a KozakMatrix: a list of row lists, so
+indexing, `m[i][j] := value`, Print, For-each and every list builtin see
+exactly the nested lists they saw before, and rows handed out by get_row
+stay shared with the matrix.
+
+`+ - * /` work elementwise on a KozakMatrix, against a matrix or nested
+list of the same shape or a scalar, one row at a time. Only values made by
+the matrix builtins do this: a nested list literal keeps Python's list
+semantics, so `[[0, 0]] * 2` still repeats the row. The engines route
+these operators through Interpreter._binary_op, which turns a MatrixError
+into a RuntimeErrorKozak in the program's dialect.
+"""
+import operator
+from itertools import repeat
+
+
+class MatrixError(Exception):
+    """An elementwise operation failed; args[0] is a DialectMessages runtime error key."""
+
+
+def _add(left, right):
+    # Elementwise +, with the string concatenation of Interpreter._binary_op
+    if isinstance(left, str) or isinstance(right, str):
+        return str(left) + str(right)
+    return left + right
+
+
+def _divide(left, right):
+    if right == 0:
+        raise MatrixError('divide_by_zero')
+    return left / right
+
+
+def _reflected(function):
+    return lambda left, right: function(right, left)
+
+
+ELEMENTWISE = {
+    '+': _add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': _divide,
+}
+
+
+class KozakMatrix(list):
+    """A rectangular list of row lists."""
+    __slots__ = ()
+
+    @classmethod
+    def filled(cls, rows, cols, fill_value):
+        return cls([fill_value] * cols for _ in range(rows))
+
+
+def _map_rows(function, matrix, other):
+    if isinstance(other, list):
+        if len(other) != len(matrix) or any(
+                not isinstance(row, list) or len(row) != len(own)
+                for own, row in zip(matrix, other)):
+            raise MatrixError('matrix_dimensions')
+        return KozakMatrix(list(map(function, own, row)) for own, row in zip(matrix, other))
+    return KozakMatrix(list(map(function, own, repeat(other))) for own in matrix)
+
+
+def elementwise(op, left, right):
+    """Apply `+ - * /` elementwise; at least one operand must be a KozakMatrix."""
+    function = ELEMENTWISE[op]
+    if isinstance(left, KozakMatrix):
+        return _map_rows(function, left, right)
+    return _map_rows(_reflected(function), right, left)
+
+
+# Containers the indexing fast paths read directly
+LIST_TYPES = (list, KozakMatrix)
@@ -2,192 +2,240 @@ import os
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = 'hide'
 import pygame
 import sys
+from collections import OrderedDict
 from core.dialect_messages import DialectMessages
 
+# Cache caps; override with KOZAK_GAME_FONT_CACHE / KOZAK_GAME_TEXT_CACHE, 0 turns a cache off
+FONT_CACHE_SIZE = 16    # fonts kept by size
+TEXT_CACHE_SIZE = 256   # rendered text surfaces kept by (text, colour, size)
+
+
+def _cache_size(variable, default):
+    """Cache cap from the environment variable, or the default when it is unset or not a number."""
+    try:
+        return max(0, int(os.environ[variable]))
+    except (KeyError, ValueError):
+        return default
+
+
+METHOD_DIALECTS = {
+    #ukrainian latin
+    'stvoryty_vikno': 'ukrainian_latin',
+    'vstanovyty_ikonku': 'ukrainian_latin',
+    'onovyty': 'ukrainian_latin',
+    'vstanovyty_fps': 'ukrainian_latin',
+    'zalyty': 'ukrainian_latin',
+    'namalyuvaty_pryamokutnyk': 'ukrainian_latin',
+    'namalyuvaty_kolo': 'ukrainian_latin',
+    'namalyuvaty_liniyu': 'ukrainian_latin',
+    'klavisha_natysnuta': 'ukrainian_latin',
+    'pozytsiya_myshi': 'ukrainian_latin',
+    'mysha_natysnuta': 'ukrainian_latin',
+    'napysaty_tekst': 'ukrainian_latin',
+    'zavantazhyty_zobrazhennya': 'ukrainian_latin',
+    'namalyuvaty_zobrazhennya': 'ukrainian_latin',
+    'zavantazhyty_zvuk': 'ukrainian_latin',
+    'vidtvoryty_zvuk': 'ukrainian_latin',
+    'zakryty': 'ukrainian_latin',
+    'namalyuvaty_pryamokutnyky': 'ukrainian_latin',
+    'namalyuvaty_kola': 'ukrainian_latin',
+    'namalyuvaty_liniyi': 'ukrainian_latin',
+
+    #english
+    'create_window': 'english',
+    'set_icon': 'english',
+    'update': 'english',
+    'set_fps': 'english',
+    'fill': 'english',
+    'draw_rect': 'english',
+    'draw_circle': 'english',
+    'draw_line': 'english',
+    'key_pressed': 'english',
+    'mouse_position': 'english',
+    'mouse_pressed': 'english',
+    'draw_text': 'english',
+    'load_image': 'english',
+    'draw_image': 'english',
+    'load_sound': 'english',
+    'play_sound': 'english',
+    'close': 'english',
+    'draw_rects': 'english',
+    'draw_circles': 'english',
+    'draw_lines': 'english',
+
+    #russian latin
+    'sozdat_okno': 'russian_latin',
+    'ustanovit_ikonku': 'russian_latin',
+    'obnovit': 'russian_latin',
+    'ustanovit_fps': 'russian_latin',
+    'zalit': 'russian_latin',
+    'narisovat_pryamougolnik': 'russian_latin',
+    'narisovat_krug': 'russian_latin',
+    'narisovat_liniyu': 'russian_latin',
+    'klavisha_nazhata': 'russian_latin',
+    'pozitsiya_myshi': 'russian_latin',
+    'mysh_nazhata': 'russian_latin',
+    'napisat_tekst': 'russian_latin',
+    'zagruzit_izobrazhenie': 'russian_latin',
+    'narisovat_izobrazhenie': 'russian_latin',
+    'zagruzit_zvuk': 'russian_latin',
+    'vosproizvesti_zvuk': 'russian_latin',
+    'zakryt': 'russian_latin',
+    'narisovat_pryamougolniki': 'russian_latin',
+    'narisovat_krugi': 'russian_latin',
+    'narisovat_linii': 'russian_latin',
+
+    #ukrainian cyrillic
+    'створити_вікно' : 'ukrainian_cyrillic',
+    'встановити_іконку': 'ukrainian_cyrillic',
+    'оновити': 'ukrainian_cyrillic',
+    'встановити_фпс': 'ukrainian_cyrillic',
+    'залити': 'ukrainian_cyrillic',
+    'намалювати_прямокутник': 'ukrainian_cyrillic',
+    'намалювати_коло': 'ukrainian_cyrillic',
+    'намалювати_лінію': 'ukrainian_cyrillic',
+    'клавіша_натиснута': 'ukrainian_cyrillic',
+    'позиція_миші': 'ukrainian_cyrillic',
+    'миша_натиснута': 'ukrainian_cyrillic',
+    'написати_текст': 'ukrainian_cyrillic',
+    'завантажити_зображення': 'ukrainian_cyrillic',
+    'намалювати_зображення': 'ukrainian_cyrillic',
+    'завантажити_звук': 'ukrainian_cyrillic',
+    'відтворити_звук': 'ukrainian_cyrillic',
+    'закрити': 'ukrainian_cyrillic',
+    'намалювати_прямокутники': 'ukrainian_cyrillic',
+    'намалювати_кола': 'ukrainian_cyrillic',
+    'намалювати_лінії': 'ukrainian_cyrillic',
+
+    #russian cyrillic
+    'создать_окно': 'russian_cyrillic',
+    'установить_иконку': 'russian_cyrillic',
+    'обновить': 'russian_cyrillic',
+    'установить_фпс': 'russian_cyrillic',
+    'залить': 'russian_cyrillic',
+    'нарисовать_прямоугольник': 'russian_cyrillic',
+    'нарисовать_круг': 'russian_cyrillic',
+    'нарисовать_линию': 'russian_cyrillic',
+    'клавиша_нажата': 'russian_cyrillic',
+    'позиция_мыши': 'russian_cyrillic',
+    'мышь_нажата': 'russian_cyrillic',
+    'написать_текст': 'russian_cyrillic',
+    'загрузить_изображение': 'russian_cyrillic',
+    'нарисовать_изображение': 'russian_cyrillic',
+    'загрузить_звук': 'russian_cyrillic',
+    'воспроизвести_звук': 'russian_cyrillic',
+    'закрыть': 'russian_cyrillic',
+    'нарисовать_прямоугольники': 'russian_cyrillic',
+    'нарисовать_круги': 'russian_cyrillic',
+    'нарисовать_линии': 'russian_cyrillic',
+}
+
+
+def _allowed_in(required, dialect):
+    """Whether a name that belongs to the required dialect may be used from dialect."""
+    effective = 'english' if dialect == 'symbolic' else dialect
+    return (
+        required == effective
+        or required == 'shared_slavic'
+        and effective in ('ukrainian_latin', 'russian_latin')
+    )
+
+
 class GameModule:
-    def __init__(self, dialect=None):
+    METHOD_DIALECTS = METHOD_DIALECTS
+
+    # Color constants - Ukrainian
+    CHORNYY = ЧОРНИЙ = (0, 0, 0)
+    BILYY = БІЛИЙ = (255, 255, 255)
+    CHERVONYY = ЧЕРВОНИЙ = (255, 0, 0)
+    ZELENYY = ЗЕЛЕНИЙ = (0, 255, 0)
+    SYNIY = СИНІЙ = (0, 0, 255)
+    ZHOVTYY = ЖОВТИЙ = (255, 255, 0)
+    POMARANCHEVYY = ПОМАРАНЧЕВИЙ = (255, 165, 0)
+    FIOLETOVYY = ФІОЛЕТОВИЙ = (128, 0, 128)
+    SIRYY = СІРИЙ = (128, 128, 128)
+
+    # Color constants - Russian
+    CHERNYY = ЧЕРНЫЙ = (0, 0, 0)
+    BELYY = БЕЛЫЙ = (255, 255, 255)
+    KRASNYY = КРАСНЫЙ = (255, 0, 0)
+    ZELENYY = ЗЕЛЕНЫЙ = (0, 255, 0)
+    SINIY = СИНИЙ = (0, 0, 255)
+    ZHELTYY = ЖЕЛТЫЙ = (255, 255, 0)
+    ORANZHEVYY = ОРАНЖЕВЫЙ = (255, 165, 0)
+    FIOLETOVYY = ФИОЛЕТОВЫЙ = (128, 0, 128)
+    SERYY = СЕРЫЙ = (128, 128, 128)
+
+    # Color constants - English
+    BLACK = (0,0,0)
+    WHITE = (255, 255, 255)
+    RED = (255, 0, 0)
+    GREEN = (0, 255, 0)
+    BLUE = (0, 0, 255)
+    YELLOW = (255, 255, 0)
+    ORANGE = (255, 165, 0)
+    PURPLE = (128, 0, 128)
+    GRAY = (128, 128, 128)
+
+    COLOUR_DIALECTS = {
+        # Shared Latin Slavic — allowed in both ukrainian_latin and russian_latin
+        'ZELENYY':    'shared_slavic',
+        'FIOLETOVYY': 'shared_slavic',
+
+        # Ukrainian Latin
+        'CHORNYY': 'ukrainian_latin',  'BILYY': 'ukrainian_latin',
+        'CHERVONYY': 'ukrainian_latin', 'SYNIY': 'ukrainian_latin',
+        'ZHOVTYY': 'ukrainian_latin',  'POMARANCHEVYY': 'ukrainian_latin',
+        'SIRYY': 'ukrainian_latin',
+
+        # Russian Latin
+        'CHERNYY': 'russian_latin',  'BELYY': 'russian_latin',
+        'KRASNYY': 'russian_latin',  'SINIY': 'russian_latin',
+        'ZHELTYY': 'russian_latin',  'ORANZHEVYY': 'russian_latin',
+        'SERYY': 'russian_latin',
+
+        # Ukrainian Cyrillic
+        'ЧОРНИЙ': 'ukrainian_cyrillic',  'БІЛИЙ': 'ukrainian_cyrillic',
+        'ЧЕРВОНИЙ': 'ukrainian_cyrillic', 'ЗЕЛЕНИЙ': 'ukrainian_cyrillic',
+        'СИНІЙ': 'ukrainian_cyrillic',   'ЖОВТИЙ': 'ukrainian_cyrillic',
+        'ПОМАРАНЧЕВИЙ': 'ukrainian_cyrillic', 'ФІОЛЕТОВИЙ': 'ukrainian_cyrillic',
+        'СІРИЙ': 'ukrainian_cyrillic',
+
+        # Russian Cyrillic
+        'ЧЕРНЫЙ': 'russian_cyrillic',  'БЕЛЫЙ': 'russian_cyrillic',
+        'КРАСНЫЙ': 'russian_cyrillic', 'ЗЕЛЕНЫЙ': 'russian_cyrillic',
+        'СИНИЙ': 'russian_cyrillic',   'ЖЕЛТЫЙ': 'russian_cyrillic',
+        'ОРАНЖЕВЫЙ': 'russian_cyrillic', 'ФИОЛЕТОВЫЙ': 'russian_cyrillic',
+        'СЕРЫЙ': 'russian_cyrillic',
+
+        # English
+        'BLACK': 'english',  'WHITE': 'english',  'RED': 'english',
+        'GREEN': 'english',  'BLUE': 'english',   'YELLOW': 'english',
+        'ORANGE': 'english', 'PURPLE': 'english', 'GRAY': 'english',
+    }
+
+    def __init__(self, dialect=None, trace=None, font_cache_size=None, text_cache_size=None):
         pygame.init()
         self.dialect = dialect
+        # Opt-in trace of every game call, e.g. KOZAK_GAME_TRACE=1 python main.py game.kozak
+        self.trace = bool(os.environ.get('KOZAK_GAME_TRACE')) if trace is None else trace
         self.screen = None
         self.clock = pygame.time.Clock()
         self.running = False
         self.sprites = {}  # Store loaded sprites
         self.sounds = {}   # Store loaded sounds
-
-        self.METHOD_DIALECTS = {
-            #ukrainian latin
-            'stvoryty_vikno': 'ukrainian_latin',
-            'vstanovyty_ikonku': 'ukrainian_latin',
-            'onovyty': 'ukrainian_latin',
-            'vstanovyty_fps': 'ukrainian_latin',
-            'zalyty': 'ukrainian_latin',
-            'namalyuvaty_pryamokutnyk': 'ukrainian_latin',
-            'namalyuvaty_kolo': 'ukrainian_latin',
-            'namalyuvaty_liniyu': 'ukrainian_latin',
-            'klavisha_natysnuta': 'ukrainian_latin',
-            'pozytsiya_myshi': 'ukrainian_latin',
-            'mysha_natysnuta': 'ukrainian_latin',
-            'napysaty_tekst': 'ukrainian_latin',
-            'zavantazhyty_zobrazhennya': 'ukrainian_latin',
-            'namalyuvaty_zobrazhennya': 'ukrainian_latin',
-            'zavantazhyty_zvuk': 'ukrainian_latin',
-            'vidtvoryty_zvuk': 'ukrainian_latin',
-            'zakryty': 'ukrainian_latin',
-
-            #english
-            'create_window': 'english',
-            'set_icon': 'english',
-            'update': 'english',
-            'set_fps': 'english',
-            'fill': 'english',
-            'draw_rect': 'english',
-            'draw_circle': 'english',
-            'draw_line': 'english',
-            'key_pressed': 'english',
-            'mouse_position': 'english',
-            'mouse_pressed': 'english',
-            'draw_text': 'english',
-            'load_image': 'english',
-            'draw_image': 'english',
-            'load_sound': 'english',
-            'play_sound': 'english',
-            'close': 'english',
-
-            #russian latin
-            'sozdat_okno': 'russian_latin',
-            'ustanovit_ikonku': 'russian_latin',
-            'obnovit': 'russian_latin',
-            'ustanovit_fps': 'russian_latin',
-            'zalit': 'russian_latin',
-            'narisovat_pryamougolnik': 'russian_latin',
-            'narisovat_krug': 'russian_latin',
-            'narisovat_liniyu': 'russian_latin',
-            'klavisha_nazhata': 'russian_latin',
-            'pozitsiya_myshi': 'russian_latin',
-            'mysh_nazhata': 'russian_latin',
-            'napisat_tekst': 'russian_latin',
-            'zagruzit_izobrazhenie': 'russian_latin',
-            'narisovat_izobrazhenie': 'russian_latin',
-            'zagruzit_zvuk': 'russian_latin',
-            'vosproizvesti_zvuk': 'russian_latin',
-            'zakryt': 'russian_latin',
-
-            #ukrainian cyrillic
-            'створити_вікно' : 'ukrainian_cyrillic',
-            'встановити_іконку': 'ukrainian_cyrillic',
-            'оновити': 'ukrainian_cyrillic',
-            'встановити_фпс': 'ukrainian_cyrillic',
-            'залити': 'ukrainian_cyrillic',
-            'намалювати_прямокутник': 'ukrainian_cyrillic',
-            'намалювати_коло': 'ukrainian_cyrillic',
-            'намалювати_лінію': 'ukrainian_cyrillic',
-            'клавіша_натиснута': 'ukrainian_cyrillic',
-            'позиція_миші': 'ukrainian_cyrillic',
-            'миша_натиснута': 'ukrainian_cyrillic',
-            'написати_текст': 'ukrainian_cyrillic',
-            'завантажити_зображення': 'ukrainian_cyrillic',
-            'намалювати_зображення': 'ukrainian_cyrillic',
-            'завантажити_звук': 'ukrainian_cyrillic',
-            'відтворити_звук': 'ukrainian_cyrillic',
-            'закрити': 'ukrainian_cyrillic',
-
-            #russian cyrillic
-            'создать_окно': 'russian_cyrillic',
-            'установить_иконку': 'russian_cyrillic',
-            'обновить': 'russian_cyrillic',
-            'установить_фпс': 'russian_cyrillic',
-            'залить': 'russian_cyrillic',
-            'нарисовать_прямоугольник': 'russian_cyrillic',
-            'нарисовать_круг': 'russian_cyrillic',
-            'нарисовать_линию': 'russian_cyrillic',
-            'клавиша_нажата': 'russian_cyrillic',
-            'позиция_мыши': 'russian_cyrillic',
-            'мышь_нажата': 'russian_cyrillic',
-            'написать_текст': 'russian_cyrillic',
-            'загрузить_изображение': 'russian_cyrillic',
-            'нарисовать_изображение': 'russian_cyrillic',
-            'загрузить_звук': 'russian_cyrillic',
-            'воспроизвести_звук': 'russian_cyrillic',
-            'закрыть': 'russian_cyrillic',           
-        }
-
-        
-        
-        # Color constants - Ukrainian
-        self.CHORNYY = self.ЧОРНИЙ = (0, 0, 0)
-        self.BILYY = self.БІЛИЙ = (255, 255, 255)
-        self.CHERVONYY = self.ЧЕРВОНИЙ = (255, 0, 0)
-        self.ZELENYY = self.ЗЕЛЕНИЙ = (0, 255, 0)
-        self.SYNIY = self.СИНІЙ = (0, 0, 255)
-        self.ZHOVTYY = self.ЖОВТИЙ = (255, 255, 0)
-        self.POMARANCHEVYY = self.ПОМАРАНЧЕВИЙ = (255, 165, 0)
-        self.FIOLETOVYY = self.ФІОЛЕТОВИЙ = (128, 0, 128)
-        self.SIRYY = self.СІРИЙ = (128, 128, 128)
-
-        # Color constants - Russian
-        self.CHERNYY = self.ЧЕРНЫЙ = (0, 0, 0)
-        self.BELYY = self.БЕЛЫЙ = (255, 255, 255)
-        self.KRASNYY = self.КРАСНЫЙ = (255, 0, 0)
-        self.ZELENYY = self.ЗЕЛЕНЫЙ = (0, 255, 0)
-        self.SINIY = self.СИНИЙ = (0, 0, 255)
-        self.ZHELTYY = self.ЖЕЛТЫЙ = (255, 255, 0)
-        self.ORANZHEVYY = self.ОРАНЖЕВЫЙ = (255, 165, 0)
-        self.FIOLETOVYY = self.ФИОЛЕТОВЫЙ = (128, 0, 128)
-        self.SERYY = self.СЕРЫЙ = (128, 128, 128)
-
-        # Color constants - English
-        self.BLACK = (0,0,0)
-        self.WHITE = (255, 255, 255)
-        self.RED = (255, 0, 0)
-        self.GREEN = (0, 255, 0)
-        self.BLUE = (0, 0, 255)
-        self.YELLOW = (255, 255, 0)
-        self.ORANGE = (255, 165, 0)
-        self.PURPLE = (128, 0, 128)
-        self.GRAY = (128, 128, 128)
-
-        # Add inside __init__, after the colour definitions:
-
-        self.COLOUR_DIALECTS = {
-            # Shared Latin Slavic — allowed in both ukrainian_latin and russian_latin
-            'ZELENYY':    'shared_slavic',
-            'FIOLETOVYY': 'shared_slavic',
-
-            # Ukrainian Latin
-            'CHORNYY': 'ukrainian_latin',  'BILYY': 'ukrainian_latin',
-            'CHERVONYY': 'ukrainian_latin', 'SYNIY': 'ukrainian_latin',
-            'ZHOVTYY': 'ukrainian_latin',  'POMARANCHEVYY': 'ukrainian_latin',
-            'SIRYY': 'ukrainian_latin',
-
-            # Russian Latin
-            'CHERNYY': 'russian_latin',  'BELYY': 'russian_latin',
-            'KRASNYY': 'russian_latin',  'SINIY': 'russian_latin',
-            'ZHELTYY': 'russian_latin',  'ORANZHEVYY': 'russian_latin',
-            'SERYY': 'russian_latin',
-
-            # Ukrainian Cyrillic
-            'ЧОРНИЙ': 'ukrainian_cyrillic',  'БІЛИЙ': 'ukrainian_cyrillic',
-            'ЧЕРВОНИЙ': 'ukrainian_cyrillic', 'ЗЕЛЕНИЙ': 'ukrainian_cyrillic',
-            'СИНІЙ': 'ukrainian_cyrillic',   'ЖОВТИЙ': 'ukrainian_cyrillic',
-            'ПОМАРАНЧЕВИЙ': 'ukrainian_cyrillic', 'ФІОЛЕТОВИЙ': 'ukrainian_cyrillic',
-            'СІРИЙ': 'ukrainian_cyrillic',
-
-            # Russian Cyrillic
-            'ЧЕРНЫЙ': 'russian_cyrillic',  'БЕЛЫЙ': 'russian_cyrillic',
-            'КРАСНЫЙ': 'russian_cyrillic', 'ЗЕЛЕНЫЙ': 'russian_cyrillic',
-            'СИНИЙ': 'russian_cyrillic',   'ЖЕЛТЫЙ': 'russian_cyrillic',
-            'ОРАНЖЕВЫЙ': 'russian_cyrillic', 'ФИОЛЕТОВЫЙ': 'russian_cyrillic',
-            'СЕРЫЙ': 'russian_cyrillic',
-
-            # English
-            'BLACK': 'english',  'WHITE': 'english',  'RED': 'english',
-            'GREEN': 'english',  'BLUE': 'english',   'YELLOW': 'english',
-            'ORANGE': 'english', 'PURPLE': 'english', 'GRAY': 'english',
-        }
-
-# Window management
-    def stvoryty_vikno(self, shyryna, vysota, nazva="KozakScript Game"):
-        self._dialect_guard('stvoryty_vikno')
+        if font_cache_size is None:
+            font_cache_size = _cache_size('KOZAK_GAME_FONT_CACHE', FONT_CACHE_SIZE)
+        if text_cache_size is None:
+            text_cache_size = _cache_size('KOZAK_GAME_TEXT_CACHE', TEXT_CACHE_SIZE)
+        self.font_cache_size = font_cache_size
+        self.text_cache_size = text_cache_size
+        # Least recently used first; text that does not change between frames is only blitted
+        self._fonts = OrderedDict()
+        self._text_surfaces = OrderedDict()
+
+    # Window management
+    def _stvoryty_vikno(self, shyryna, vysota, nazva="KozakScript Game"):
         try:
             ikonka = pygame.image.load("..\icon.png")
             pygame.display.set_icon(ikonka)
@@ -197,17 +245,16 @@ class GameModule:
         pygame.display.set_caption(nazva)
         self.running = True
         return True
+
+    stvoryty_vikno = _stvoryty_vikno
     
     def create_window(self, width, height, title="KozakScript Game"):
-        self._dialect_guard('create_window')
-        return self.stvoryty_vikno(width, height, title)
+        return self._stvoryty_vikno(width, height, title)
     
     def sozdat_okno(self, shirina, vysota, nazvanie="KozakScript Game"):
-        self._dialect_guard('sozdat_okno')
-        return self.stvoryty_vikno(shirina, vysota, nazvanie)
+        return self._stvoryty_vikno(shirina, vysota, nazvanie)
     
-    def vstanovyty_ikonku(self, shlyakh):
-        self._dialect_guard('vstanovyty_ikonku')
+    def _vstanovyty_ikonku(self, shlyakh):
         try:
             icon = pygame.image.load(shlyakh)
             pygame.display.set_icon(icon)
@@ -216,17 +263,16 @@ class GameModule:
             friendly = DialectMessages.friendly_term(self.dialect)
             raise ValueError(f"Failed to load icon '{shlyakh}', {friendly}: {e}")
 
+    vstanovyty_ikonku = _vstanovyty_ikonku
+
     def set_icon(self, path):
-        self._dialect_guard('set_icon')
-        return self.vstanovyty_ikonku(path)
+        return self._vstanovyty_ikonku(path)
 
     def ustanovit_ikonku(self, put):
-        self._dialect_guard('ustanovit_ikonku')
-        return self.vstanovyty_ikonku(put)
+        return self._vstanovyty_ikonku(put)
     
     # Main game loop
-    def onovyty(self):
-        self._dialect_guard('onovyty')
+    def _onovyty(self):
         if not self.running:
             return False
         try: 
@@ -240,92 +286,138 @@ class GameModule:
         except pygame.error:
             self.running = False
             return False
+
+    onovyty = _onovyty
     
     def update(self):
-        self._dialect_guard('update')
-        return self.onovyty()
+        return self._onovyty()
     
     def obnovit(self):
-        self._dialect_guard('obnovit')
-        return self.onovyty()
+        return self._onovyty()
     
     # FPS control
-    def vstanovyty_fps(self, fps):
-        self._dialect_guard('vstanovyty_fps')
+    def _vstanovyty_fps(self, fps):
         self.clock.tick(fps)
+
+    vstanovyty_fps = _vstanovyty_fps
     
     def set_fps(self, fps):
-        self._dialect_guard('set_fps')
-        self.vstanovyty_fps(fps)
+        self._vstanovyty_fps(fps)
     
     def ustanovit_fps(self, fps):
-        self._dialect_guard('ustanovit_fps')
-        self.vstanovyty_fps(fps)
+        self._vstanovyty_fps(fps)
     
     # Drawing functions
-    def zalyty(self, kolir):
-        self._dialect_guard('zalyty')
+    def _zalyty(self, kolir):
         if isinstance(kolir, (list, tuple)) and len(kolir) == 3:
             self.screen.fill(kolir)
         else:
             raise ValueError(self._color_error())
+
+    zalyty = _zalyty
     
     def fill(self, color):
-        self._dialect_guard('fill')
-        self.zalyty(color)
+        self._zalyty(color)
     
     def zalit(self, tsvet):
-        self._dialect_guard('zalit')
-        self.zalyty(tsvet)
+        self._zalyty(tsvet)
     
-    def namalyuvaty_pryamokutnyk(self, kolir, x, y, shyryna, vysota):
-        self._dialect_guard('namalyuvaty_pryamokutnyk')
+    def _namalyuvaty_pryamokutnyk(self, kolir, x, y, shyryna, vysota):
         if isinstance(kolir, (list, tuple)) and len(kolir) == 3:
             pygame.draw.rect(self.screen, kolir, (x, y, shyryna, vysota))
         else:
             raise ValueError(self._color_error())
+
+    namalyuvaty_pryamokutnyk = _namalyuvaty_pryamokutnyk
     
     def draw_rect(self, color, x, y, width, height):
-        self._dialect_guard('draw_rect')
-        self.namalyuvaty_pryamokutnyk(color, x, y, width, height)
+        self._namalyuvaty_pryamokutnyk(color, x, y, width, height)
     
     def narisovat_pryamougolnik(self, tsvet, x, y, shirina, vysota):
-        self._dialect_guard('narisovat_pryamougolnik')
-        self.namalyuvaty_pryamokutnyk(tsvet, x, y, shirina, vysota)
+        self._namalyuvaty_pryamokutnyk(tsvet, x, y, shirina, vysota)
     
-    def namalyuvaty_kolo(self, kolir, x, y, radius):
-        self._dialect_guard('namalyuvaty_kolo')
+    def _namalyuvaty_kolo(self, kolir, x, y, radius):
         if isinstance(kolir, (list, tuple)) and len(kolir) == 3:
             pygame.draw.circle(self.screen, kolir, (x, y), radius)
         else:
             raise ValueError(self._color_error())
+
+    namalyuvaty_kolo = _namalyuvaty_kolo
     
     def draw_circle(self, color, x, y, radius):
-        self._dialect_guard('draw_circle')
-        self.namalyuvaty_kolo(color, x, y, radius)
+        self._namalyuvaty_kolo(color, x, y, radius)
     
     def narisovat_krug(self, tsvet, x, y, radius):
-        self._dialect_guard('narisovat_krug')
-        self.namalyuvaty_kolo(tsvet, x, y, radius)
+        self._namalyuvaty_kolo(tsvet, x, y, radius)
     
-    def namalyuvaty_liniyu(self, kolir, x1, y1, x2, y2, tovshchyna=1):
-        self._dialect_guard('namalyuvaty_liniyu')
+    def _namalyuvaty_liniyu(self, kolir, x1, y1, x2, y2, tovshchyna=1):
         if isinstance(kolir, (list, tuple)) and len(kolir) == 3:
             pygame.draw.line(self.screen, kolir, (x1, y1), (x2, y2), tovshchyna)
         else:
             raise ValueError(self._color_error())
+
+    namalyuvaty_liniyu = _namalyuvaty_liniyu
     
     def draw_line(self, color, x1, y1, x2, y2, width=1):
-        self._dialect_guard('draw_line')
-        self.namalyuvaty_liniyu(color, x1, y1, x2, y2, width)
+        self._namalyuvaty_liniyu(color, x1, y1, x2, y2, width)
     
     def narisovat_liniyu(self, tsvet, x1, y1, x2, y2, tolshchina=1):
-        self._dialect_guard('narisovat_liniyu')
-        self.namalyuvaty_liniyu(tsvet, x1, y1, x2, y2, tolshchina)
+        self._namalyuvaty_liniyu(tsvet, x1, y1, x2, y2, tolshchina)
     
+    # Batched drawing: one module call for a whole array of shapes
+    def _namalyuvaty_pryamokutnyky(self, pryamokutnyky):
+        fill = self.screen.fill
+        for kolir, x, y, shyryna, vysota in self._shapes(pryamokutnyky, (5,), "[[R, G, B], x, y, w, h]"):
+            fill(kolir, (x, y, shyryna, vysota))
+
+    namalyuvaty_pryamokutnyky = _namalyuvaty_pryamokutnyky
+
+    def draw_rects(self, rects):
+        self._namalyuvaty_pryamokutnyky(rects)
+
+    def narisovat_pryamougolniki(self, pryamougolniki):
+        self._namalyuvaty_pryamokutnyky(pryamougolniki)
+
+    def _namalyuvaty_kola(self, kola):
+        circle, screen = pygame.draw.circle, self.screen
+        for kolir, x, y, radius in self._shapes(kola, (4,), "[[R, G, B], x, y, r]"):
+            circle(screen, kolir, (x, y), radius)
+
+    namalyuvaty_kola = _namalyuvaty_kola
+
+    def draw_circles(self, circles):
+        self._namalyuvaty_kola(circles)
+
+    def narisovat_krugi(self, krugi):
+        self._namalyuvaty_kola(krugi)
+
+    def _namalyuvaty_liniyi(self, liniyi):
+        line, screen = pygame.draw.line, self.screen
+        for shape in self._shapes(liniyi, (5, 6), "[[R, G, B], x1, y1, x2, y2, w?]"):
+            line(screen, shape[0], shape[1:3], shape[3:5], shape[5] if len(shape) == 6 else 1)
+
+    namalyuvaty_liniyi = _namalyuvaty_liniyi
+
+    def draw_lines(self, lines):
+        self._namalyuvaty_liniyi(lines)
+
+    def narisovat_linii(self, linii):
+        self._namalyuvaty_liniyi(linii)
+
+    def _shapes(self, shapes, lengths, form):
+        """Yield the shapes of a batch, checking each one's length and colour."""
+        if not isinstance(shapes, (list, tuple)):
+            raise ValueError(self._shape_error(form))
+        for shape in shapes:
+            if not isinstance(shape, (list, tuple)) or len(shape) not in lengths:
+                raise ValueError(self._shape_error(form))
+            kolir = shape[0]
+            if not (isinstance(kolir, (list, tuple)) and len(kolir) == 3):
+                raise ValueError(self._color_error())
+            yield shape
+
     # Input handling
-    def klavisha_natysnuta(self, klavisha_nazva):
-        self._dialect_guard('klavisha_natysnuta')
+    def _klavisha_natysnuta(self, klavisha_nazva):
         keys = pygame.key.get_pressed()
         key_map = {
             'vverkh': pygame.K_UP, 'up': pygame.K_UP, 'vgoru': pygame.K_UP, 'вгору': pygame.K_UP, 'вверх': pygame.K_UP,
@@ -342,340 +434,351 @@ class GameModule:
         if key_code:
             return keys[key_code]
         return False
+
+    klavisha_natysnuta = _klavisha_natysnuta
     
     def key_pressed(self, key_name):
-        self._dialect_guard('key_pressed')
-        return self.klavisha_natysnuta(key_name)
+        return self._klavisha_natysnuta(key_name)
     
     def klavisha_nazhata(self, imya_klavishi):
-        self._dialect_guard('klavisha_nazhata')
-        return self.klavisha_natysnuta(imya_klavishi)
+        return self._klavisha_natysnuta(imya_klavishi)
     
-    def pozytsiya_myshi(self):
-        self._dialect_guard('pozytsiya_myshi')
+    def _pozytsiya_myshi(self):
         pos = pygame.mouse.get_pos()
         return list(pos)  # Return as array [x, y]
+
+    pozytsiya_myshi = _pozytsiya_myshi
     
     def mouse_position(self):
-        self._dialect_guard('mouse_position')
-        return self.pozytsiya_myshi()
+        return self._pozytsiya_myshi()
     
     def pozitsiya_myshi(self):
-        self._dialect_guard('pozitsiya_myshi')
-        return self.pozytsiya_myshi()
+        return self._pozytsiya_myshi()
     
-    def mysha_natysnuta(self, knopka=0):
-        self._dialect_guard('mysha_natysnuta')
+    def _mysha_natysnuta(self, knopka=0):
         buttons = pygame.mouse.get_pressed()
         if knopka < len(buttons):
             return buttons[knopka]
         return False
+
+    mysha_natysnuta = _mysha_natysnuta
     
     def mouse_pressed(self, button=0):
-        self._dialect_guard('mouse_pressed')
-        return self.mysha_natysnuta(button)
+        return self._mysha_natysnuta(button)
     
     def mysh_nazhata(self, knopka=0):
-        self._dialect_guard('mysh_nazhata')
-        return self.mysha_natysnuta(knopka)
+        return self._mysha_natysnuta(knopka)
     
     # Text rendering
-    def napysaty_tekst(self, text, x, y, kolir, rozmir=24):
-        self._dialect_guard('napysaty_tekst')
-        font = pygame.font.Font(None, rozmir)
+    def _napysaty_tekst(self, text, x, y, kolir, rozmir=24):
         if isinstance(kolir, (list, tuple)) and len(kolir) == 3:
-            text_surface = font.render(str(text), True, kolir)
+            text_surface = self._text_surface(str(text), tuple(kolir), rozmir)
             self.screen.blit(text_surface, (x, y))
         else:
             raise ValueError(self._color_error())
+
+    napysaty_tekst = _napysaty_tekst
     
     def draw_text(self, text, x, y, color, size=24):
-        self._dialect_guard('draw_text')
-        self.napysaty_tekst(text, x, y, color, size)
+        self._napysaty_tekst(text, x, y, color, size)
     
     def napisat_tekst(self, text, x, y, tsvet, razmer=24):
-        self._dialect_guard('napisat_tekst')
-        self.napysaty_tekst(text, x, y, tsvet, razmer)
+        self._napysaty_tekst(text, x, y, tsvet, razmer)
+
+    def _font(self, size):
+        font = self._fonts.get(size)
+        if font is not None:
+            self._fonts.move_to_end(size)
+            return font
+        font = pygame.font.Font(None, size)
+        if self.font_cache_size > 0:
+            if len(self._fonts) >= self.font_cache_size:
+                self._fonts.popitem(last=False)
+            self._fonts[size] = font
+        return font
+
+    def _text_surface(self, text, colour, size):
+        key = (text, colour, size)
+        surface = self._text_surfaces.get(key)
+        if surface is not None:
+            self._text_surfaces.move_to_end(key)
+            return surface
+        surface = self._font(size).render(text, True, colour)
+        if self.text_cache_size > 0:
+            if len(self._text_surfaces) >= self.text_cache_size:
+                self._text_surfaces.popitem(last=False)
+            self._text_surfaces[key] = surface
+        return surface
     
     # Sprite/Image handling
-    def zavantazhyty_zobrazhennya(self, shlyakh, nazva):
-        self._dialect_guard('zavantazhyty_zobrazhennya')
+    def _zavantazhyty_zobrazhennya(self, shlyakh, nazva):
         try:
             image = pygame.image.load(shlyakh)
             self.sprites[nazva] = image
             return True
         except:
             return False
+
+    zavantazhyty_zobrazhennya = _zavantazhyty_zobrazhennya
     
     def load_image(self, path, name):
-        self._dialect_guard('load_image')
-        return self.zavantazhyty_zobrazhennya(path, name)
+        return self._zavantazhyty_zobrazhennya(path, name)
     
     def zagruzit_izobrazhenie(self, put, imya):
-        self._dialect_guard('zagruzit_izobrazhenie')
-        return self.zavantazhyty_zobrazhennya(put, imya)
+        return self._zavantazhyty_zobrazhennya(put, imya)
     
-    def namalyuvaty_zobrazhennya(self, nazva, x, y):
-        self._dialect_guard('namalyuvaty_zobrazhennya')
+    def _namalyuvaty_zobrazhennya(self, nazva, x, y):
         if nazva in self.sprites:
             self.screen.blit(self.sprites[nazva], (x, y))
         else:
             friendly = DialectMessages.friendly_term(self.dialect)
             raise ValueError(f"Image '{nazva}' not loaded, {friendly}!")
+
+    namalyuvaty_zobrazhennya = _namalyuvaty_zobrazhennya
     
     def draw_image(self, name, x, y):
-        self._dialect_guard('draw_image')
-        self.namalyuvaty_zobrazhennya(name, x, y)
+        self._namalyuvaty_zobrazhennya(name, x, y)
     
     def narisovat_izobrazhenie(self, imya, x, y):
-        self._dialect_guard('narisovat_izobrazhenie')
-        self.namalyuvaty_zobrazhennya(imya, x, y)
+        self._namalyuvaty_zobrazhennya(imya, x, y)
     
     # Sound handling
-    def zavantazhyty_zvuk(self, shlyakh, nazva):
-        self._dialect_guard('zavantazhyty_zvuk')
+    def _zavantazhyty_zvuk(self, shlyakh, nazva):
         try:
             sound = pygame.mixer.Sound(shlyakh)
             self.sounds[nazva] = sound
             return True
         except:
             return False
+
+    zavantazhyty_zvuk = _zavantazhyty_zvuk
     
     def load_sound(self, path, name):
-        self._dialect_guard('load_sound')
-        return self.zavantazhyty_zvuk(path, name)
+        return self._zavantazhyty_zvuk(path, name)
     
     def zagruzit_zvuk(self, put, imya):
-        self._dialect_guard('zagruzit_zvuk')
-        return self.zavantazhyty_zvuk(put, imya)
+        return self._zavantazhyty_zvuk(put, imya)
     
-    def vidtvoryty_zvuk(self, nazva):
-        self._dialect_guard('vidtvoryty_zvuk')
+    def _vidtvoryty_zvuk(self, nazva):
         if nazva in self.sounds:
             self.sounds[nazva].play()
         else:
             friendly = DialectMessages.friendly_term(self.dialect)
             raise ValueError(f"Sound '{nazva}' not loaded, {friendly}!")
+
+    vidtvoryty_zvuk = _vidtvoryty_zvuk
     
     def play_sound(self, name):
-        self._dialect_guard('play_sound')
-        self.vidtvoryty_zvuk(name)
+        self._vidtvoryty_zvuk(name)
     
     def vosproizvesti_zvuk(self, imya):
-        self._dialect_guard('vosproizvesti_zvuk')
-        self.vidtvoryty_zvuk(imya)
+        self._vidtvoryty_zvuk(imya)
     
     # Cleanup
-    def zakryty(self):
-        self._dialect_guard('zakryty')
+    def _zakryty(self):
         self.running = False
+        # Fonts are invalid once pygame quits
+        self._fonts.clear()
+        self._text_surfaces.clear()
         if pygame.get_init():
             try:
                 pygame.quit()
             except:
                 pass
+
+    zakryty = _zakryty
     
     def close(self):
-        self._dialect_guard('close')
-        self.zakryty()
+        self._zakryty()
     
     def zakryt(self):
-        self._dialect_guard('zakryt')
-        self.zakryty()
+        self._zakryty()
 
     # --- CYRILLIC WRAPPERS ---
 
     def створити_вікно(self, ширина, висота, назва="KozakScript Game"):
-        self._dialect_guard('створити_вікно')
-        return self.stvoryty_vikno(ширина, висота, назва)
+        return self._stvoryty_vikno(ширина, висота, назва)
 
     def встановити_іконку(self, шлях):
-        self._dialect_guard('встановити_іконку')
-        return self.vstanovyty_ikonku(шлях)
+        return self._vstanovyty_ikonku(шлях)
 
     def оновити(self):
-        self._dialect_guard('оновити')
-        return self.onovyty()
+        return self._onovyty()
 
     def встановити_фпс(self, фпс):
-        self._dialect_guard('встановити_фпс')
-        self.vstanovyty_fps(фпс)
+        self._vstanovyty_fps(фпс)
 
     def залити(self, колір):
-        self._dialect_guard('залити')
-        self.zalyty(колір)
+        self._zalyty(колір)
 
     def намалювати_прямокутник(self, колір, x, y, ширина, висота):
-        self._dialect_guard('намалювати_прямокутник')
-        self.namalyuvaty_pryamokutnyk(колір, x, y, ширина, висота)
+        self._namalyuvaty_pryamokutnyk(колір, x, y, ширина, висота)
 
     def намалювати_коло(self, колір, x, y, радіус):
-        self._dialect_guard('намалювати_коло')
-        self.namalyuvaty_kolo(колір, x, y, радіус)
+        self._namalyuvaty_kolo(колір, x, y, радіус)
 
     def намалювати_лінію(self, колір, x1, y1, x2, y2, товщина=1):
-        self._dialect_guard('намалювати_лінію')
-        self.namalyuvaty_liniyu(колір, x1, y1, x2, y2, товщина)
+        self._namalyuvaty_liniyu(колір, x1, y1, x2, y2, товщина)
+
+    def намалювати_прямокутники(self, прямокутники):
+        self._namalyuvaty_pryamokutnyky(прямокутники)
+
+    def намалювати_кола(self, кола):
+        self._namalyuvaty_kola(кола)
+
+    def намалювати_лінії(self, лінії):
+        self._namalyuvaty_liniyi(лінії)
 
     def клавіша_натиснута(self, назва_клавіші):
-        self._dialect_guard('клавіша_натиснута')
-        return self.klavisha_natysnuta(назва_клавіші)
+        return self._klavisha_natysnuta(назва_клавіші)
 
     def позиція_миші(self):
-        self._dialect_guard('позиція_миші')
-        return self.pozytsiya_myshi()
+        return self._pozytsiya_myshi()
 
     def миша_натиснута(self, кнопка=0):
-        self._dialect_guard('миша_натиснута')
-        return self.mysha_natysnuta(кнопка)
+        return self._mysha_natysnuta(кнопка)
 
     def написати_текст(self, текст, x, y, колір, розмір=24):
-        self._dialect_guard('написати_текст')
-        self.napysaty_tekst(текст, x, y, колір, розмір)
+        self._napysaty_tekst(текст, x, y, колір, розмір)
 
     def завантажити_зображення(self, шлях, назва):
-        self._dialect_guard('завантажити_зображення')
-        return self.zavantazhyty_zobrazhennya(шлях, назва)
+        return self._zavantazhyty_zobrazhennya(шлях, назва)
 
     def намалювати_зображення(self, назва, x, y):
-        self._dialect_guard('намалювати_зображення')
-        self.namalyuvaty_zobrazhennya(назва, x, y)
+        self._namalyuvaty_zobrazhennya(назва, x, y)
 
     def завантажити_звук(self, шлях, назва):
-        self._dialect_guard('завантажити_звук')
-        return self.zavantazhyty_zvuk(шлях, назва)
+        return self._zavantazhyty_zvuk(шлях, назва)
 
     def відтворити_звук(self, назва):
-        self._dialect_guard('відтворити_звук')
-        self.vidtvoryty_zvuk(назва)
+        self._vidtvoryty_zvuk(назва)
 
     def закрити(self):
-        self._dialect_guard('закрити')
-        self.zakryty()
+        self._zakryty()
 
     def создать_окно(self, ширина, высота, название="KozakScript Game"):
-        self._dialect_guard('создать_окно')
-        return self.stvoryty_vikno(ширина, высота, название)
+        return self._stvoryty_vikno(ширина, высота, название)
 
     def установить_иконку(self, путь):
-        self._dialect_guard('установить_иконку')
-        return self.vstanovyty_ikonku(путь)
+        return self._vstanovyty_ikonku(путь)
 
     def обновить(self):
-        self._dialect_guard('обновить')
-        return self.onovyty()
+        return self._onovyty()
 
     def установить_фпс(self, фпс):
-        self._dialect_guard('установить_фпс')
-        self.vstanovyty_fps(фпс)
+        self._vstanovyty_fps(фпс)
 
     def залить(self, цвет):
-        self._dialect_guard('залить')
-        self.zalyty(цвет)
+        self._zalyty(цвет)
 
     def нарисовать_прямоугольник(self, цвет, x, y, ширина, высота):
-        self._dialect_guard('нарисовать_прямоугольник')
-        self.namalyuvaty_pryamokutnyk(цвет, x, y, ширина, высота)
+        self._namalyuvaty_pryamokutnyk(цвет, x, y, ширина, высота)
 
     def нарисовать_круг(self, цвет, x, y, радиус):
-        self._dialect_guard('нарисовать_круг')
-        self.namalyuvaty_kolo(цвет, x, y, радиус)
+        self._namalyuvaty_kolo(цвет, x, y, радиус)
 
     def нарисовать_линию(self, цвет, x1, y1, x2, y2, толщина=1):
-        self._dialect_guard('нарисовать_линию')
-        self.namalyuvaty_liniyu(цвет, x1, y1, x2, y2, толщина)
+        self._namalyuvaty_liniyu(цвет, x1, y1, x2, y2, толщина)
+
+    def нарисовать_прямоугольники(self, прямоугольники):
+        self._namalyuvaty_pryamokutnyky(прямоугольники)
+
+    def нарисовать_круги(self, круги):
+        self._namalyuvaty_kola(круги)
+
+    def нарисовать_линии(self, линии):
+        self._namalyuvaty_liniyi(линии)
 
     def клавиша_нажата(self, имя_клавиши):
-        self._dialect_guard('клавиша_нажата')
-        return self.klavisha_natysnuta(имя_клавиши)
+        return self._klavisha_natysnuta(имя_клавиши)
 
     def позиция_мыши(self):
-        self._dialect_guard('позиция_мыши')
-        return self.pozytsiya_myshi()
+        return self._pozytsiya_myshi()
 
     def мышь_нажата(self, кнопка=0):
-        self._dialect_guard('мышь_нажата')
-        return self.mysha_natysnuta(кнопка)
+        return self._mysha_natysnuta(кнопка)
 
     def написать_текст(self, текст, x, y, цвет, размер=24):
-        self._dialect_guard('написать_текст')
-        self.napysaty_tekst(текст, x, y, цвет, размер)
+        self._napysaty_tekst(текст, x, y, цвет, размер)
 
     def загрузить_изображение(self, путь, имя):
-        self._dialect_guard('загрузить_изображение')
-        return self.zavantazhyty_zobrazhennya(путь, имя)
+        return self._zavantazhyty_zobrazhennya(путь, имя)
 
     def нарисовать_изображение(self, имя, x, y):
-        self._dialect_guard('нарисовать_изображение')
-        self.namalyuvaty_zobrazhennya(имя, x, y)
+        self._namalyuvaty_zobrazhennya(имя, x, y)
 
     def загрузить_звук(self, путь, имя):
-        self._dialect_guard('загрузить_звук')
-        return self.zavantazhyty_zvuk(путь, имя)
+        return self._zavantazhyty_zvuk(путь, имя)
 
     def воспроизвести_звук(self, имя):
-        self._dialect_guard('воспроизвести_звук')
-        self.vidtvoryty_zvuk(имя)
+        self._vidtvoryty_zvuk(имя)
 
     def закрыть(self):
-        self._dialect_guard('закрыть')
-        self.zakryty()
-
-    def _dialect_guard(self, method_name):
-        effective_dialect = self.dialect
-        if effective_dialect == 'symbolic':
-            effective_dialect = 'english'
-
-        if self.dialect is None:
-            return
-
-        required = self.METHOD_DIALECTS.get(method_name)
-
-        # --- НАШ ДЕБАГ ---
-        print(f"--- DEBUG KozakScript ---")
-        print(f"Викликаний метод: '{method_name}'")
-        print(f"Діалект методу в базі: {required}")
-        print(f"Поточний діалект системи: {self.dialect}")
-        # Перевіримо назву посимвольно на випадок прихованої латини
-        hex_name = ' '.join(hex(ord(c)) for c in method_name)
-        print(f"Hex-коди символів: {hex_name}")
-        print(f"-------------------------")
-        # -----------------
-
-        if required and required != effective_dialect:
-            friendly = DialectMessages.friendly_term(self.dialect)
-            MESSAGES = {
-                'ukrainian_latin':  (
-                    f"Metod '{method_name}' nalezhyt' dialektu '{required}', "
-                    f"ale tvoya prohrama vykorystovuye '{self.dialect}'. "
-                    f"Vykorystovuy vidpovidnyk dlya '{self.dialect}', {friendly}!"
-                ),
-                'ukrainian_cyrillic': (
-                    f"Метод '{method_name}' належить діалекту '{required}', "
-                    f"але твоя програма використовує '{self.dialect}'. "
-                    f"Використовуй відповідник для '{self.dialect}', {friendly}!"
-                ),
-                'russian_latin': (
-                    f"Metod '{method_name}' prinadlezhit dialektu '{required}', "
-                    f"no tvoya programma ispol'zuyet '{self.dialect}'. "
-                    f"Ispol'zuy ekvivalent dlya '{self.dialect}', {friendly}!"
-                ),
-                'russian_cyrillic': (
-                    f"Метод '{method_name}' принадлежит диалекту '{required}', "
-                    f"но твоя программа использует '{self.dialect}'. "
-                    f"Используй эквивалент для '{self.dialect}', {friendly}!"
-                ),
-                'symbolic': (
-                    f"METHOD_DIALECT_MISMATCH: '{method_name}' requires dialect='{required}', "
-                    f"current dialect='{self.dialect}'. Use correct dialect equivalent."
-                ),
-                'english': (
-                    f"Method '{method_name}' belongs to the '{required}' dialect, "
-                    f"but your program uses '{self.dialect}'. "
-                    f"Use the '{self.dialect}' equivalent instead, {friendly}!"
-                ),
-            }
-            raise ValueError(MESSAGES.get(self.dialect, MESSAGES['english']))
+        self._zakryty()
+
+    def _method_dialect_error(self, method_name, required):
+        friendly = DialectMessages.friendly_term(self.dialect)
+        MESSAGES = {
+            'ukrainian_latin':  (
+                f"Metod '{method_name}' nalezhyt' dialektu '{required}', "
+                f"ale tvoya prohrama vykorystovuye '{self.dialect}'. "
+                f"Vykorystovuy vidpovidnyk dlya '{self.dialect}', {friendly}!"
+            ),
+            'ukrainian_cyrillic': (
+                f"Метод '{method_name}' належить діалекту '{required}', "
+                f"але твоя програма використовує '{self.dialect}'. "
+                f"Використовуй відповідник для '{self.dialect}', {friendly}!"
+            ),
+            'russian_latin': (
+                f"Metod '{method_name}' prinadlezhit dialektu '{required}', "
+                f"no tvoya programma ispol'zuyet '{self.dialect}'. "
+                f"Ispol'zuy ekvivalent dlya '{self.dialect}', {friendly}!"
+            ),
+            'russian_cyrillic': (
+                f"Метод '{method_name}' принадлежит диалекту '{required}', "
+                f"но твоя программа использует '{self.dialect}'. "
+                f"Используй эквивалент для '{self.dialect}', {friendly}!"
+            ),
+            'symbolic': (
+                f"METHOD_DIALECT_MISMATCH: '{method_name}' requires dialect='{required}', "
+                f"current dialect='{self.dialect}'. Use correct dialect equivalent."
+            ),
+            'english': (
+                f"Method '{method_name}' belongs to the '{required}' dialect, "
+                f"but your program uses '{self.dialect}'. "
+                f"Use the '{self.dialect}' equivalent instead, {friendly}!"
+            ),
+        }
+        return MESSAGES.get(self.dialect, MESSAGES['english'])
+
+    def _colour_dialect_error(self, name, required):
+        dialect = self.dialect
+        friendly = DialectMessages.friendly_term(dialect)
+        PREFIXES = {
+            'english': "Colour ",
+            'ukrainian_cyrillic': "Колір ",
+            'ukrainian_latin': "COLIR",
+            'russian_latin': "TSVET",
+            'russian_cyrillic': "ЦВЕТ",
+        }
+        return (
+            f"{PREFIXES.get(dialect, PREFIXES['english'])}'{name}' belongs to the '{required}' dialect, "
+            f"but your program uses '{dialect}'. "
+            f"Use the '{dialect}' equivalent, {friendly}!"
+        )
+
+    def _shape_error(self, form):
+        """Return a dialect-aware error message for a malformed shape in a batch."""
+        friendly = DialectMessages.friendly_term(self.dialect)
+        MESSAGES = {
+            'ukrainian_latin':   f"Kozhna figura povynna buty masyvom {form}, {friendly}!",
+            'ukrainian_cyrillic': f"Кожна фігура повинна бути масивом {form}, {friendly}!",
+            'russian_latin':     f"Kazhdaya figura dolzhna byt' massivom {form}, {friendly}!",
+            'russian_cyrillic':  f"Каждая фигура должна быть массивом {form}, {friendly}!",
+            'symbolic':          f"INVALID_SHAPE: expected {form} array.",
+            'english':           f"Each shape must be a {form} array, {friendly}!",
+        }
+        return MESSAGES.get(self.dialect, MESSAGES['english'])
 
     def _color_error(self):
         """Return a dialect-aware error message for invalid color arguments."""
@@ -693,62 +796,71 @@ class GameModule:
     def _emergency_quit(self):
         """Called when an error occurs mid-game to prevent freeze."""
         self.running = False
+        # Fonts are invalid once pygame quits
+        self._fonts.clear()
+        self._text_surfaces.clear()
         if pygame.get_init():
             try:
                 pygame.quit()
             except:
                 pass
 
-    
-    def __getattribute__(self, name):
-        """Intercept colour constant access to enforce dialect."""
-        # Get COLOUR_DIALECTS safely without recursing
-        colour_dialects = object.__getattribute__(self, 'COLOUR_DIALECTS') \
-            if 'COLOUR_DIALECTS' in object.__getattribute__(self, '__dict__') \
-            else {}
-
-        if name in colour_dialects:
-            dialect = object.__getattribute__(self, 'dialect')
-            if dialect is not None:
-                effective = 'english' if dialect == 'symbolic' else dialect
-                required = colour_dialects[name]
-
-                allowed = (
-                    required == effective
-                    or required == 'shared_slavic'
-                    and effective in ('ukrainian_latin', 'russian_latin')
-                )
-                if not allowed:
-                    friendly = DialectMessages.friendly_term(dialect)
-                    if dialect == 'english':
-                        raise ValueError(
-                            f"Colour '{name}' belongs to the '{required}' dialect, "
-                            f"but your program uses '{dialect}'. "
-                            f"Use the '{dialect}' equivalent, {friendly}!"
-                        )
-                    elif dialect == 'ukrainian_cyrillic':
-                        raise ValueError(
-                            f"Колір '{name}' belongs to the '{required}' dialect, "
-                            f"but your program uses '{dialect}'. "
-                            f"Use the '{dialect}' equivalent, {friendly}!"
-                        )
-                    elif dialect == 'ukrainian_latin':
-                        raise ValueError(
-                            f"COLIR'{name}' belongs to the '{required}' dialect, "
-                            f"but your program uses '{dialect}'. "
-                            f"Use the '{dialect}' equivalent, {friendly}!"
-                        )
-                    elif dialect == 'russian_latin':
-                        raise ValueError(
-                            f"TSVET'{name}' belongs to the '{required}' dialect, "
-                            f"but your program uses '{dialect}'. "
-                            f"Use the '{dialect}' equivalent, {friendly}!"
-                        )
-                    elif dialect == 'russian_cyrillic':
-                        raise ValueError(
-                            f"ЦВЕТ'{name}' belongs to the '{required}' dialect, "
-                            f"but your program uses '{dialect}'. "
-                            f"Use the '{dialect}' equivalent, {friendly}!"
-                        )
-
-        return object.__getattribute__(self, name)
\ No newline at end of file
+
+class GameView:
+    """
+    The game module as a program sees it: the methods and colours of its
+    dialect and nothing else. Methods are bound into slots and colours are
+    class attributes, so looking one up costs nothing extra; only a name
+    the dialect does not have reaches __getattr__ and its dialect error.
+    """
+    __slots__ = ('_game',)
+    _methods = ()
+
+    def __init__(self, game):
+        self._game = game
+        for name in self._methods:
+            method = getattr(game, name)
+            setattr(self, name, _traced(name, method, game.dialect) if game.trace else method)
+
+    def __getattr__(self, name):
+        required = METHOD_DIALECTS.get(name) or GameModule.COLOUR_DIALECTS.get(name)
+        if required is None or name == '_game':
+            raise AttributeError(name)
+        if name in GameModule.COLOUR_DIALECTS:
+            raise ValueError(self._game._colour_dialect_error(name, required))
+        raise ValueError(self._game._method_dialect_error(name, required))
+
+    def _emergency_quit(self):
+        self._game._emergency_quit()
+
+
+def _traced(name, method, dialect):
+    def call(*args):
+        print(f"[game] {name}{args}, program dialect: {dialect}", file=sys.stderr)
+        return method(*args)
+    return call
+
+
+def _view_class(dialect):
+    """A GameView subclass exposing what the dialect may use (everything when it is unknown)."""
+    def allowed(required):
+        return dialect is None or _allowed_in(required, dialect)
+
+    methods = tuple(name for name, required in METHOD_DIALECTS.items() if allowed(required))
+    namespace = {'__slots__': methods, '_methods': methods}
+    for name, required in GameModule.COLOUR_DIALECTS.items():
+        if allowed(required):
+            namespace[name] = getattr(GameModule, name)
+    return type('GameView', (GameView,), namespace)
+
+
+GAME_VIEWS = {
+    dialect: _view_class(dialect)
+    for dialect in (None, 'ukrainian_latin', 'english', 'russian_latin',
+                    'symbolic', 'ukrainian_cyrillic', 'russian_cyrillic')
+}
+
+
+def game_view(dialect=None):
+    """Start the game module and return the view of it for the program's dialect."""
+    return GAME_VIEWS.get(dialect, GAME_VIEWS[None])(GameModule(dialect))
@@ -1,5 +1,59 @@
-"""Math module for KozakScript"""
+"""Math module for KozakScript
+
+Every function that takes numbers also takes arrays and matrices and
+applies itself to each element with map(), so the loop runs in C instead
+of in KozakScript, and every element gets exactly the result or error the
+scalar function gives.
+"""
 import math
+import operator
+from itertools import chain, repeat
+
+from core.matrix import KozakMatrix
+
+
+def _map(function, values):
+    if values and isinstance(values[0], list):
+        return values.__class__(_map(function, row) for row in values)
+    return list(map(function, values))
+
+
+def _map2(function, x, y):
+    if isinstance(x, list):
+        if isinstance(y, list):
+            if len(x) != len(y):
+                raise ValueError("Arrays must have the same length")
+            if x and isinstance(x[0], list):
+                return x.__class__(_map2(function, a, b) for a, b in zip(x, y))
+            return list(map(function, x, y))
+        if x and isinstance(x[0], list):
+            return x.__class__(_map2(function, row, y) for row in x)
+        return list(map(function, x, repeat(y)))
+    if y and isinstance(y[0], list):
+        return y.__class__(_map2(function, x, row) for row in y)
+    return list(map(function, repeat(x), y))
+
+
+def _unary(function, x):
+    """function(x), element by element when x is an array or matrix."""
+    if isinstance(x, list):
+        return _map(function, x)
+    return function(x)
+
+
+def _binary(function, x, y):
+    """function(x, y), element by element when either side is an array or matrix."""
+    if isinstance(x, list) or isinstance(y, list):
+        return _map2(function, x, y)
+    return function(x, y)
+
+
+def _elements(values):
+    """The elements of an array, or of every row of a matrix."""
+    if isinstance(values, list) and values and isinstance(values[0], list):
+        return list(chain.from_iterable(values))
+    return values
+
 
 class MathModule:
     """Provides mathematical functions and constants"""
@@ -33,160 +87,162 @@ class MathModule:
     # Trigonometric functions
     def sin(self, x):
         """Sine of x (x in radians)"""
-        return math.sin(x)
+        return _unary(math.sin, x)
     
     def cos(self, x):
         """Cosine of x (x in radians)"""
-        return math.cos(x)
+        return _unary(math.cos, x)
     
     def tan(self, x):
         """Tangent of x (x in radians)"""
-        return math.tan(x)
+        return _unary(math.tan, x)
     
     def asin(self, x):
         """Arc sine of x, in radians"""
-        return math.asin(x)
+        return _unary(math.asin, x)
     
     def acos(self, x):
         """Arc cosine of x, in radians"""
-        return math.acos(x)
+        return _unary(math.acos, x)
     
     def atan(self, x):
         """Arc tangent of x, in radians"""
-        return math.atan(x)
+        return _unary(math.atan, x)
     
     def atan2(self, y, x):
         """Arc tangent of y/x, in radians"""
-        return math.atan2(y, x)
+        return _binary(math.atan2, y, x)
     
     # Hyperbolic functions
     def sinh(self, x):
         """Hyperbolic sine of x"""
-        return math.sinh(x)
+        return _unary(math.sinh, x)
     
     def cosh(self, x):
         """Hyperbolic cosine of x"""
-        return math.cosh(x)
+        return _unary(math.cosh, x)
     
     def tanh(self, x):
         """Hyperbolic tangent of x"""
-        return math.tanh(x)
+        return _unary(math.tanh, x)
     
     def asinh(self, x):
         """Inverse hyperbolic sine of x"""
-        return math.asinh(x)
+        return _unary(math.asinh, x)
     
     def acosh(self, x):
         """Inverse hyperbolic cosine of x"""
-        return math.acosh(x)
+        return _unary(math.acosh, x)
     
     def atanh(self, x):
         """Inverse hyperbolic tangent of x"""
-        return math.atanh(x)
+        return _unary(math.atanh, x)
     
     # Angle conversion
     def degrees(self, x):
         """Convert angle x from radians to degrees"""
-        return math.degrees(x)
+        return _unary(math.degrees, x)
     
     def radians(self, x):
         """Convert angle x from degrees to radians"""
-        return math.radians(x)
+        return _unary(math.radians, x)
     
     # Power and logarithmic functions
     def exp(self, x):
         """e raised to the power x"""
-        return math.exp(x)
+        return _unary(math.exp, x)
     
     def log(self, x, base=None):
         """Logarithm of x to the given base (natural log if base not specified)"""
         if base is None:
-            return math.log(x)
-        return math.log(x, base)
+            return _unary(math.log, x)
+        return _binary(math.log, x, base)
     
     def log10(self, x):
         """Base-10 logarithm of x"""
-        return math.log10(x)
+        return _unary(math.log10, x)
     
     def log2(self, x):
         """Base-2 logarithm of x"""
-        return math.log2(x)
+        return _unary(math.log2, x)
     
     def sqrt(self, x):
         """Square root of x"""
-        return math.sqrt(x)
+        return _unary(math.sqrt, x)
     
     def pow(self, x, y):
         """x raised to the power y"""
-        return math.pow(x, y)
+        return _binary(math.pow, x, y)
     
     # Rounding and absolute value
     def ceil(self, x):
         """Smallest integer >= x"""
-        return math.ceil(x)
+        return _unary(math.ceil, x)
     
     def floor(self, x):
         """Largest integer <= x"""
-        return math.floor(x)
+        return _unary(math.floor, x)
     
     def trunc(self, x):
         """Truncate x to an integer"""
-        return math.trunc(x)
+        return _unary(math.trunc, x)
     
     def round(self, x, ndigits=None):
         """Round x to ndigits decimal places"""
         if ndigits is None:
-            return round(x)
-        return round(x, ndigits)
+            return _unary(round, x)
+        return _binary(round, x, ndigits)
     
     def abs(self, x):
         """Absolute value of x"""
-        return abs(x)
+        return _unary(abs, x)
     
     def fabs(self, x):
         """Absolute value of x (as float)"""
-        return math.fabs(x)
+        return _unary(math.fabs, x)
     
     # Special functions
     def factorial(self, x):
         """Factorial of x (x!)"""
-        return math.factorial(x)
+        return _unary(math.factorial, x)
     
     def gcd(self, a, b):
         """Greatest common divisor of a and b"""
-        return math.gcd(a, b)
+        return _binary(math.gcd, a, b)
     
     def lcm(self, a, b):
         """Least common multiple of a and b"""
-        return math.lcm(a, b)
+        return _binary(math.lcm, a, b)
     
     def copysign(self, x, y):
         """Return x with the sign of y"""
-        return math.copysign(x, y)
+        return _binary(math.copysign, x, y)
     
     def fmod(self, x, y):
         """Floating point remainder of x/y"""
-        return math.fmod(x, y)
+        return _binary(math.fmod, x, y)
     
     def modf(self, x):
         """Return fractional and integer parts of x"""
-        return math.modf(x)
+        return _unary(math.modf, x)
     
     def isnan(self, x):
         """Check if x is NaN"""
-        return math.isnan(x)
+        return _unary(math.isnan, x)
     
     def isinf(self, x):
         """Check if x is infinite"""
-        return math.isinf(x)
+        return _unary(math.isinf, x)
     
     def isfinite(self, x):
         """Check if x is finite"""
-        return math.isfinite(x)
+        return _unary(math.isfinite, x)
     
     # Distance and norm
     def hypot(self, *args):
         """Euclidean norm, sqrt(sum of squares)"""
+        if len(args) == 2 and (isinstance(args[0], list) or isinstance(args[1], list)):
+            return _binary(math.hypot, *args)
         return math.hypot(*args)
     
     def dist(self, p, q):
@@ -197,26 +253,49 @@ class MathModule:
     def min(self, *args):
         """Return the minimum value"""
         if len(args) == 1 and isinstance(args[0], (list, tuple)):
-            return min(args[0])
+            return min(_elements(args[0]))
         return min(args)
     
     def max(self, *args):
         """Return the maximum value"""
         if len(args) == 1 and isinstance(args[0], (list, tuple)):
-            return max(args[0])
+            return max(_elements(args[0]))
         return max(args)
     
     def sum(self, iterable):
         """Sum of all elements in iterable"""
-        return sum(iterable)
+        return sum(_elements(iterable))
+
+    def mean(self, values):
+        """Arithmetic mean of all elements"""
+        values = _elements(values)
+        if not values:
+            raise ValueError("mean() of an empty array")
+        return math.fsum(values) / len(values)
+
+    def dot(self, a, b):
+        """Dot product of two arrays, or the matrix product when either is a matrix"""
+        a_matrix = bool(a) and isinstance(a[0], list)
+        b_matrix = bool(b) and isinstance(b[0], list)
+        inner = len(a[0]) if a_matrix else len(a)
+        if inner != len(b):
+            raise ValueError(f"dot() shapes do not match: {inner} columns against {len(b)} rows")
+        if not a_matrix and not b_matrix:
+            return sum(map(operator.mul, a, b))
+        if not b_matrix:
+            return [sum(map(operator.mul, row, b)) for row in a]
+        columns = list(zip(*b))
+        if not a_matrix:
+            return [sum(map(operator.mul, a, column)) for column in columns]
+        return KozakMatrix([sum(map(operator.mul, row, column)) for column in columns] for row in a)
     
     # Combinatorics
     def comb(self, n, k):
         """Number of ways to choose k items from n items (binomial coefficient)"""
-        return math.comb(n, k)
+        return _binary(math.comb, n, k)
     
     def perm(self, n, k=None):
         """Number of ways to choose k items from n items with order"""
         if k is None:
-            k = n
-        return math.perm(n, k)
\ No newline at end of file
+            return _unary(math.perm, n)
+        return _binary(math.perm, n, k)
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""Lazy registry of KozakScript's built-in modules.
+
+A module is imported and instantiated the first time a program looks it
+up, by Import or by calling one of its functions, so a program that never
+touches game does not pay for importing pygame and opening its subsystems.
+"""
+import importlib
+
+
+BUILTIN_MODULES = {
+    "hash": ("core.modules.hash", "HashModule"),
+    "math": ("core.modules.math_module", "MathModule"),
+    "game": ("core.modules.game_module", "game_view"),
+    # future modules to come.
+}
+
+# Classes of the modules created so far, for telling module objects apart from instances
+MODULE_CLASSES = set()
+
+
+class ModuleRegistry(dict):
+    """Loaded modules by name; built-in modules count as present before they are loaded."""
+
+    def __init__(self, dialect=None):
+        super().__init__()
+        self.dialect = dialect
+
+    def __contains__(self, name):
+        return dict.__contains__(self, name) or name in BUILTIN_MODULES
+
+    def __missing__(self, name):
+        if name not in BUILTIN_MODULES:
+            raise KeyError(name)
+        module_path, factory_name = BUILTIN_MODULES[name]
+        factory = getattr(importlib.import_module(module_path), factory_name)
+        module = factory(dialect=self.dialect) if name == "game" else factory()
+        MODULE_CLASSES.add(type(module))
+        self[name] = module
+        return module
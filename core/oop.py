@@ -1,3 +1,26 @@
+import dataclasses
+
+from core.ast import KozakPropertyAssign, KozakVariable
+
+
+# Marks a shaped field slot that has not been assigned yet
+_MISSING = object()
+
+
+def _constructor_fields(node, found):
+    """Collect, in order, the field names a constructor body assigns through `this`."""
+    if isinstance(node, list) or isinstance(node, tuple):
+        for item in node:
+            _constructor_fields(item, found)
+    elif dataclasses.is_dataclass(node):
+        if (isinstance(node, KozakPropertyAssign) and isinstance(node.instance, KozakVariable)
+                and node.instance.name == 'this' and isinstance(node.property_name, str)):
+            found.setdefault(node.property_name, len(found))
+        for field in dataclasses.fields(node):
+            _constructor_fields(getattr(node, field.name), found)
+    return found
+
+
 class ClassDef:
     """Represents a class definition in KozakScript."""
     def __init__(self, name, methods, constructor=None, destructor=None, parent_class=None, field_access=None, method_access=None, friends=None, friend_classes=None, ):
@@ -17,81 +40,102 @@ class ClassDef:
             if hasattr(method_def, 'is_static') and method_def.is_static:
                 self.static_methods[method_name] = method_def
 
+        self._flatten()
+
+    def _flatten(self):
+        """
+        Precompute the inherited lookup tables once, when the class is defined.
+        The parent is already flattened, so each table is the parent's table
+        overlaid with this class's own entries.
+        """
+        parent = self.parent_class
+        if parent:
+            self.all_methods = {**parent.all_methods, **self.methods}
+            self.all_method_access = {**parent.all_method_access, **self.method_access}
+            self.all_field_access = {**parent.all_field_access, **self.field_access}
+            self.all_friends = parent.all_friends | set(self.friends)
+            self.all_friend_classes = parent.all_friend_classes | set(self.friend_classes)
+            self.hierarchy = [self] + parent.hierarchy
+            self.root = parent.root
+        else:
+            self.all_methods = dict(self.methods)
+            self.all_method_access = dict(self.method_access)
+            self.all_field_access = dict(self.field_access)
+            self.all_friends = set(self.friends)
+            self.all_friend_classes = set(self.friend_classes)
+            self.hierarchy = [self]
+            self.root = self
+        self.ancestors = frozenset(self.hierarchy)  # this class and all its ancestors
+
+        # Fields assigned in Tvir get fixed slots; the parent's come first
+        self.shape = dict(parent.shape) if parent else {}
+        if self.constructor is not None:
+            for name in _constructor_fields(self.constructor.body, {}):
+                self.shape.setdefault(name, len(self.shape))
+
     def find_method(self, name):
-        """Recursively search for a method in the class or its ancestors."""
-        if name in self.methods:
-            return self.methods[name]
-        
-        # Recurse up the inheritance chain
-        if self.parent_class:
-            return self.parent_class.find_method(name)
-            
-        return None
+        """Find a method in the class or its ancestors."""
+        return self.all_methods.get(name)
     
     def is_friend_class(self, class_name):
         """Check if a class is a friend of this class"""
-        if class_name in self.friend_classes:
-            return True
-        
-        # Check parent class friend classes
-        if self.parent_class:
-            return self.parent_class.is_friend_class(class_name)
-        
-        return False
+        return class_name in self.all_friend_classes
 
     def get_method_access(self, name):
         """Get the access level of a method"""
-        if name in self.method_access:
-            return self.method_access[name]
-        
-        if self.parent_class:
-            return self.parent_class.get_method_access(name)
-        
-        return 'public'  # default
+        return self.all_method_access.get(name, 'public')
     
     def get_field_access(self, name):
         """Get the access level of a field"""
-        if name in self.field_access:
-            return self.field_access[name]
-        
-        if self.parent_class:
-            return self.parent_class.get_field_access(name)
-        
-        return 'public'  # default
+        return self.all_field_access.get(name, 'public')
     
     def is_friend(self, function_name):
         """Check if a function is a friend of this class"""
-        if function_name in self.friends:
-            return True
-        
-        # Check parent class friends
-        if self.parent_class:
-            return self.parent_class.is_friend(function_name)
-        
-        return False
+        return function_name in self.all_friends
     
     def get_class_hierarchy(self):
         """Get list of all classes in inheritance chain (this class and all ancestors)"""
-        hierarchy = [self]
-        current = self.parent_class
-        while current:
-            hierarchy.append(current)
-            current = current.parent_class
-        return hierarchy
+        return list(self.hierarchy)
 
 
 class Instance:
-    """Represents an object instance."""
+    """
+    Represents an object instance.
+
+    Fields listed in the class shape live in a fixed-size list; any other
+    field goes to a dict that is only created when first needed.
+    """
+    __slots__ = ('class_def', 'slots', 'extra_fields', '_destroyed')
+
     def __init__(self, class_def):
         self.class_def = class_def
-        self.fields = {}  # instance variables
+        self.slots = [_MISSING] * len(class_def.shape)  # values of shaped fields
+        self.extra_fields = None  # dict for fields outside the shape
         self._destroyed = False  # flag to indicate if destructor has been called
 
-    def __del__(self):
-        if not self._destroyed and self.class_def.destructor:
-            self._destroyed = True
+    @property
+    def fields(self):
+        """All assigned fields as a dict (a copy)."""
+        fields = {name: self.slots[slot] for name, slot in self.class_def.shape.items()
+                  if self.slots[slot] is not _MISSING}
+        if self.extra_fields:
+            fields.update(self.extra_fields)
+        return fields
+
+    def _get_field(self, name):
+        """Return a field's value, or _MISSING if it has not been assigned."""
+        slot = self.class_def.shape.get(name)
+        if slot is not None:
+            return self.slots[slot]
+        if self.extra_fields is not None:
+            return self.extra_fields.get(name, _MISSING)
+        return _MISSING
 
     def destroy(self, interpreter):
+        """
+        Run the class destructor once. Destructors only run through an explicit
+        Destructor(obj) call; garbage collection never runs them.
+        """
         if self._destroyed:
             return
         
@@ -171,22 +215,8 @@ class Instance:
         Check if other_class_def is in the same class family (inheritance chain).
         This allows derived classes to access protected members.
         """
-        # Get all classes in this object's hierarchy
-        my_hierarchy = self.class_def.get_class_hierarchy()
-        
-        # Get all classes in the other object's hierarchy
-        other_hierarchy = []
-        current = other_class_def
-        while current:
-            other_hierarchy.append(current)
-            current = current.parent_class
-        
-        # Check if there's any overlap (shared ancestor or one inherits from other)
-        for my_class in my_hierarchy:
-            if my_class in other_hierarchy:
-                return True
-        
-        return False
+        # With single inheritance two chains overlap exactly when they share a root
+        return self.class_def.root is other_class_def.root
 
     def get(self, name, calling_instance=None, calling_function=None):
         """
@@ -199,7 +229,8 @@ class Instance:
         """
         # First check instance fields
         self._check_not_destroyed()
-        if name in self.fields:
+        value = self._get_field(name)
+        if value is not _MISSING:
             access_level = self.class_def.get_field_access(name)
             
             if access_level == 'private':
@@ -216,7 +247,7 @@ class Instance:
                         f"Protected fields can only be accessed from the class, derived classes, or friend functions."
                     )
             
-            return self.fields[name]
+            return value
 
         # Check for methods
         method_node = self.class_def.find_method(name)
@@ -271,25 +302,42 @@ class Instance:
                     f"Protected fields can only be modified from the class, derived classes, or friend functions."
                 )
         
-        self.fields[name] = value
+        slot = self.class_def.shape.get(name)
+        if slot is not None:
+            self.slots[slot] = value
+        else:
+            if self.extra_fields is None:
+                self.extra_fields = {}
+            self.extra_fields[name] = value
     
     def _is_subclass_of(self, other_class_def):
         """Check if this instance's class is a subclass of another class"""
-        current = self.class_def
-        while current:
-            if current == other_class_def:
-                return True
-            current = current.parent_class
-        return False
+        return other_class_def in self.class_def.ancestors
+
+
+class MethodCallCache:
+    """Inline cache for one `instance.method(...)` call site.
+
+    Holds the method and access level resolved for the last receiver class.
+    """
+    __slots__ = ('class_def', 'version', 'method_def', 'access_level')
+
+    def __init__(self, class_def, version, method_def, access_level):
+        self.class_def = class_def
+        self.version = version  # ClassTable.version the entry was resolved against
+        self.method_def = method_def
+        self.access_level = access_level
 
 
 class ClassTable:
     """Stores all class definitions."""
     def __init__(self):
         self.classes = {}
+        self.version = 0  # bumped on every (re)definition to invalidate call-site caches
 
     def define_class(self, name, class_def):
         self.classes[name] = class_def
+        self.version += 1
 
     def get_class(self, name):
         if name not in self.classes:
@@ -0,0 +1,336 @@
+"""Constant folding pass for KozakScript.
+
+Runs between Parser.parse and the resolver and rewrites the tree in place:
+
+- binary operators, comparisons and type casts whose operands are all
+  KozakNumber/KozakString/KozakBoolean literals become a single literal;
+- If statements with constant conditions keep only the branches that can
+  run, and an always-taken branch replaces the whole statement;
+- While loops whose condition is a constant false value are dropped;
+- counted Dlya loops (`i := start; i < bound; i++`) whose body cannot
+  change the counter or the bound are marked with a CountedLoop, so the
+  interpreter can drive them with range() instead of evaluating the
+  condition and step on every iteration.
+
+An expression is only folded when evaluating it cannot fail. Division by
+zero, failing casts, comparing strings with numbers and the like are left
+in the tree, so the interpreter still raises them with its dialect-aware
+message at the point the program reaches them.
+"""
+import dataclasses
+import operator
+
+from core.ast import (
+    KozakNumber,
+    KozakString,
+    KozakBoolean,
+    KozakVariable,
+    KozakAssign,
+    KozakUnaryOp,
+    KozakBinOp,
+    KozakComparisonOp,
+    KozakTypeCast,
+    KozakIf,
+    KozakWhile,
+    KozakFor,
+    KozakForEach,
+    KozakTry,
+    KozakFunctionCall,
+    KozakNewInstance,
+    KozakSuper,
+    KozakImport,
+)
+
+
+LITERALS = (KozakNumber, KozakString, KozakBoolean)
+
+# Folding must not turn a short expression into a huge constant
+MAX_FOLDED_LENGTH = 10_000
+MAX_FOLDED_EXPONENT = 1024
+MAX_FOLDED_BITS = 65_536  # about 20k decimal digits
+
+NOT_CONSTANT = object()
+
+BINARY_OPERATORS = {
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '%': operator.mod,
+    '//': operator.floordiv,
+    '^': operator.pow,
+    '^/': lambda left, right: left ** (1 / right),
+    '&&': lambda left, right: left and right,
+    '||': lambda left, right: left or right,
+}
+
+COMPARISON_OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '>': operator.gt,
+    '<=': operator.le,
+    '>=': operator.ge,
+}
+
+
+def binary_value(op, left, right):
+    """Value of `left op right` as Interpreter._binary_op computes it, or NOT_CONSTANT."""
+    if op == '+':
+        if isinstance(left, (int, float)) and isinstance(right, (int, float)):
+            return left + right
+        if isinstance(left, str) or isinstance(right, str):
+            return str(left) + str(right)
+        return NOT_CONSTANT
+    if op in ('/', '^/') and right == 0:
+        return NOT_CONSTANT  # raises a dialect message at runtime
+    if op == '*' and (isinstance(left, str) or isinstance(right, str)):
+        return NOT_CONSTANT  # string repetition can grow without bound
+    if op == '^' and isinstance(right, (int, float)):
+        if abs(right) > MAX_FOLDED_EXPONENT:
+            return NOT_CONSTANT
+        # Bound the result, not just the exponent: (10^1000)^1000 has a small exponent too
+        if isinstance(left, int) and right > 0 and abs(left).bit_length() * right > MAX_FOLDED_BITS:
+            return NOT_CONSTANT
+    function = BINARY_OPERATORS.get(op)
+    if function is None:
+        return NOT_CONSTANT
+    try:
+        return function(left, right)
+    except Exception:
+        return NOT_CONSTANT
+
+
+def comparison_value(op, left, right):
+    """Value of `left op right` as Interpreter._eval_comparison_op computes it, or NOT_CONSTANT."""
+    function = COMPARISON_OPERATORS.get(op)
+    if function is None:
+        return NOT_CONSTANT
+    try:
+        return function(left, right)
+    except Exception:
+        return NOT_CONSTANT
+
+
+def cast_value(target_type, value):
+    """Value of a successful Interpreter._cast_value, or NOT_CONSTANT."""
+    try:
+        if target_type == 'Chyslo':
+            return int(value)
+        if target_type == 'DroboveChyslo':
+            return float(value)
+    except Exception:
+        return NOT_CONSTANT
+    if target_type == 'Ryadok':
+        return str(value)
+    if target_type == 'Logika':
+        if isinstance(value, str):
+            if value.lower() == 'pravda':
+                return True
+            if value.lower() == 'nepravda':
+                return False
+        return bool(value)
+    return NOT_CONSTANT
+
+
+def literal(value):
+    """The literal node for a folded value, or None if it has no literal form."""
+    if isinstance(value, bool):
+        return KozakBoolean(value)
+    if isinstance(value, int) and value.bit_length() > MAX_FOLDED_BITS:
+        return None
+    if isinstance(value, (int, float)):
+        return KozakNumber(value)
+    if isinstance(value, str) and len(value) <= MAX_FOLDED_LENGTH:
+        return KozakString(value)
+    return None
+
+
+class CountedLoop:
+    """
+    A `Dlya` loop that counts `name` by `step` (+1 or -1) while
+    `name op bound` holds. The body never assigns the counter or a variable
+    bound and never runs user code that could.
+    """
+    __slots__ = ('name', 'op', 'bound', 'step')
+
+    def __init__(self, name, op, bound, step):
+        self.name = name
+        self.op = op
+        self.bound = bound  # KozakNumber or KozakVariable
+        self.step = step
+
+
+def _step_of(stmt, name):
+    """+1 or -1 if stmt increments or decrements `name` by one, else None."""
+    if isinstance(stmt, KozakUnaryOp):
+        if isinstance(stmt.target, KozakVariable) and stmt.target.name == name:
+            return {'++': 1, '--': -1}.get(stmt.op)
+        return None
+    if isinstance(stmt, KozakAssign) and not stmt.type_hint and stmt.name == name:
+        expr = stmt.expr
+        if (isinstance(expr, KozakBinOp) and expr.op in ('+', '-')
+                and isinstance(expr.left, KozakVariable) and expr.left.name == name
+                and isinstance(expr.right, KozakNumber)
+                and expr.right.value.__class__ is int and expr.right.value == 1):
+            return 1 if expr.op == '+' else -1
+    return None
+
+
+def _scan_effects(node, written):
+    """
+    Add the variable names node may assign to `written`. Returns False if
+    it may run user code (functions, methods, constructors, imports),
+    which can assign any variable through the caller's scope.
+    """
+    if isinstance(node, (list, tuple)):
+        return all(_scan_effects(item, written) for item in node)
+    if not dataclasses.is_dataclass(node):
+        return True
+
+    if isinstance(node, (KozakNewInstance, KozakSuper, KozakImport)):
+        return False
+    if isinstance(node, KozakFunctionCall):
+        from core.interpreter import Interpreter
+        # Builtins only read their arguments, except Destructor, which runs user code
+        if Interpreter.BUILTIN_FUNCTIONS.get(node.name, '_builtin_destroy') == '_builtin_destroy':
+            return False
+    elif isinstance(node, KozakAssign):
+        written.add(node.name)
+    elif isinstance(node, KozakUnaryOp) and isinstance(node.target, KozakVariable):
+        written.add(node.target.name)
+    elif isinstance(node, KozakForEach):
+        written.add(node.var_name)
+    elif isinstance(node, KozakTry):
+        written.update(var for var, _ in node.catch_clauses if var)
+
+    return all(_scan_effects(getattr(node, field.name), written)
+               for field in dataclasses.fields(node))
+
+
+def counted_loop(node):
+    """The CountedLoop for a KozakFor, or None if it has to run step by step."""
+    init, condition = node.initialization, node.condition
+    if not isinstance(init, KozakAssign) or init.type_hint:
+        return None
+    name = init.name
+    if (not isinstance(condition, KozakComparisonOp)
+            or not isinstance(condition.left, KozakVariable) or condition.left.name != name):
+        return None
+
+    step = _step_of(node.step, name)
+    if step is None or condition.op not in (('<', '<=') if step == 1 else ('>', '>=')):
+        return None
+
+    bound = condition.right
+    if not isinstance(bound, (KozakNumber, KozakVariable)):
+        return None
+    written = set()
+    if not _scan_effects(node.body, written) or name in written:
+        return None
+    if isinstance(bound, KozakVariable) and (bound.name == name or bound.name in written):
+        return None
+    return CountedLoop(name, condition.op, bound, step)
+
+
+class Optimizer:
+    """Folds constant expressions and prunes branches that can never run."""
+
+    def __init__(self):
+        self._folders = {
+            KozakBinOp: self._fold_binop,
+            KozakComparisonOp: self._fold_comparison,
+            KozakTypeCast: self._fold_type_cast,
+            KozakIf: self._fold_if,
+            KozakWhile: self._fold_while,
+            KozakFor: self._fold_for,
+        }
+
+    def optimize(self, node):
+        return self._visit(node)
+
+    def _visit(self, node):
+        if isinstance(node, list):
+            node[:] = self._visit_statements(node)
+            return node
+        if isinstance(node, tuple):
+            return tuple(self._visit(item) for item in node)
+        if isinstance(node, dict):
+            for key, value in node.items():
+                node[key] = self._visit(value)
+            return node
+        if not dataclasses.is_dataclass(node):
+            return node
+
+        # Children first, so folded operands can fold their parent
+        for field in dataclasses.fields(node):
+            value = getattr(node, field.name)
+            folded = self._visit(value)
+            if folded is not value:
+                setattr(node, field.name, folded)
+
+        fold = self._folders.get(node.__class__)
+        return fold(node) if fold is not None else node
+
+    def _visit_statements(self, statements):
+        result = []
+        for stmt in statements:
+            folded = self._visit(stmt)
+            if isinstance(stmt, (KozakIf, KozakWhile)) and isinstance(folded, list):
+                # The statement was replaced by the statements that actually run
+                result.extend(folded)
+            else:
+                result.append(folded)
+        return result
+
+    def _fold(self, node, value):
+        if value is NOT_CONSTANT:
+            return node
+        folded = literal(value)
+        return folded if folded is not None else node
+
+    def _fold_binop(self, node):
+        if isinstance(node.left, LITERALS) and isinstance(node.right, LITERALS):
+            return self._fold(node, binary_value(node.op, node.left.value, node.right.value))
+        return node
+
+    def _fold_comparison(self, node):
+        if isinstance(node.left, LITERALS) and isinstance(node.right, LITERALS):
+            return self._fold(node, comparison_value(node.op, node.left.value, node.right.value))
+        return node
+
+    def _fold_type_cast(self, node):
+        if isinstance(node.expr, LITERALS):
+            return self._fold(node, cast_value(node.target_type, node.expr.value))
+        return node
+
+    def _fold_if(self, node):
+        else_part = node.else_part
+        kept = []
+        for condition, body in [(node.condition, node.body)] + list(node.else_if_parts):
+            if not isinstance(condition, LITERALS):
+                kept.append((condition, body))
+            elif condition.value:
+                # Always taken, so every later branch is unreachable
+                else_part = body
+                break
+        if not kept:
+            return list(else_part or [])
+        node.condition, node.body = kept[0]
+        node.else_if_parts = kept[1:]
+        node.else_part = else_part
+        return node
+
+    def _fold_while(self, node):
+        if isinstance(node.condition, LITERALS) and not node.condition.value:
+            return []
+        return node
+
+
+    def _fold_for(self, node):
+        node.counter = counted_loop(node)
+        return node
+
+
+def optimize(program):
+    """Fold constants in a parsed program in place and return it."""
+    return Optimizer().optimize(program)
@@ -0,0 +1,79 @@
+"""Variable resolution pass for KozakScript.
+
+Runs between Parser.parse and Interpreter.eval and annotates every
+KozakVariable, KozakAssign and KozakUnaryOp with the depth of the frame
+the name resolves to.
+
+KozakScript functions see the variables of their caller, so the only names
+whose frame is known before the program runs are the parameters of the
+function being executed: they get depth 0 (the current frame). Every other
+name keeps depth None and is looked up dynamically through the scope chain.
+The pass only annotates; frames stay dicts addressed by name, and the
+engines use depth 0 to read a parameter straight from the current frame.
+"""
+import dataclasses
+
+from core.ast import (
+    KozakVariable,
+    KozakAssign,
+    KozakUnaryOp,
+    KozakFunctionDef,
+    KozakDestructor,
+)
+
+
+class Resolver:
+    """Annotates variable nodes with the depth of the frame they resolve to."""
+
+    def __init__(self):
+        self.parameters = None  # parameter names of the function being resolved
+
+    def resolve(self, node):
+        self._visit(node)
+        return node
+
+    def _visit(self, node):
+        if isinstance(node, list) or isinstance(node, tuple):
+            for item in node:
+                self._visit(item)
+            return
+        if isinstance(node, dict):
+            for item in node.values():
+                self._visit(item)
+            return
+        if not dataclasses.is_dataclass(node):
+            return
+
+        if isinstance(node, KozakFunctionDef):
+            self._visit_function(node.body, node.parameters)
+            return
+        if isinstance(node, KozakDestructor):
+            self._visit_function(node.body, ())
+            return
+
+        if isinstance(node, KozakVariable) or isinstance(node, KozakAssign):
+            self._annotate(node, node.name)
+        elif isinstance(node, KozakUnaryOp) and isinstance(node.target, KozakVariable):
+            self._annotate(node, node.target.name)
+
+        for field in dataclasses.fields(node):
+            self._visit(getattr(node, field.name))
+
+    def _visit_function(self, body, parameters):
+        outer_parameters = self.parameters
+        self.parameters = frozenset(parameters)
+        try:
+            self._visit(body)
+        finally:
+            self.parameters = outer_parameters
+
+    def _annotate(self, node, name):
+        if self.parameters is not None and name in self.parameters:
+            node.depth = 0
+        else:
+            node.depth = None
+
+
+def resolve(program):
+    """Annotate a parsed program in place and return it."""
+    return Resolver().resolve(program)
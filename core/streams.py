@@ -0,0 +1,105 @@
+"""File streams for KozakScript.
+
+Read returns a whole file as one string. Read_lines and Read_chunks
+return a FileStream instead: the file is opened straight away, so a
+missing file fails at the call like it does for Read, but its contents
+are only read as a For-each loop asks for them, one line or one chunk at
+a time. Memory use stays bounded by the longest line (or the chunk size)
+however large the file is.
+
+On the writing side, Open returns a FileHandle that Write, Flush and
+Close work on, and one-shot Write(path, text) calls go through a
+WriteCache of open handles instead of opening and closing the file on
+every call.
+"""
+import os
+from collections import OrderedDict
+from functools import partial
+
+
+WRITE_CACHE_SIZE = 8  # files one-shot Write keeps open at once
+
+
+class FileStream:
+    """Lines or fixed-size chunks of an open file, read lazily by For-each."""
+    __slots__ = ('file', 'chunk_size')
+
+    def __init__(self, file, chunk_size=None):
+        self.file = file
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        # A stream is read once; the file is closed when the loop finishes or is abandoned
+        if self.file.closed:
+            return
+        with self.file as f:
+            if self.chunk_size:
+                end = b'' if 'b' in f.mode else ''
+                yield from iter(partial(f.read, self.chunk_size), end)
+                return
+            newline = b'\n' if 'b' in f.mode else '\n'
+            for line in f:
+                yield line[:-1] if line.endswith(newline) else line
+
+    def __repr__(self):
+        kind = f'chunks of {self.chunk_size}' if self.chunk_size else 'lines'
+        return f"<{kind} from '{self.file.name}'>"
+
+
+class FileHandle:
+    """A file opened by Open, written with Write until Close."""
+    __slots__ = ('file',)
+
+    def __init__(self, file):
+        self.file = file
+
+    def __repr__(self):
+        state = 'closed' if self.file.closed else f"mode '{self.file.mode}'"
+        return f"<file '{self.file.name}', {state}>"
+
+
+class WriteCache:
+    """
+    Open handles behind one-shot Write calls, least recently used first.
+    A file stays open after a write, so appending to it again is a
+    buffered write instead of an open/write/close round trip; the text
+    reaches the disk when the file is read, flushed, evicted or closed.
+    """
+
+    def __init__(self, size=WRITE_CACHE_SIZE):
+        self.size = size
+        self.files = OrderedDict()  # absolute path -> open text file
+
+    def write(self, path, content, append):
+        key = os.path.abspath(path)
+        f = self.files.pop(key, None)
+        if f is not None and not append:
+            f.close()  # overwriting starts the file again
+            f = None
+        if f is None:
+            f = open(path, 'a' if append else 'w', encoding='utf-8')
+            if len(self.files) >= self.size:
+                self.files.popitem(last=False)[1].close()
+        # After the first write the handle sits at the end of the file, so later appends go there
+        self.files[key] = f
+        f.write(content)
+
+    def flush(self, path=None):
+        """Write out pending text, for one path or for every cached file."""
+        if path is None:
+            for f in self.files.values():
+                f.flush()
+            return
+        f = self.files.get(os.path.abspath(path))
+        if f is not None:
+            f.flush()
+
+    def release(self, path):
+        """Close the cached handle for path, before something else opens the file."""
+        f = self.files.pop(os.path.abspath(path), None)
+        if f is not None:
+            f.close()
+
+    def close(self):
+        while self.files:
+            self.files.popitem(last=False)[1].close()
@@ -0,0 +1,738 @@
+"""Bytecode compiler and virtual machine for KozakScript.
+
+The compiler turns AST nodes into a flat list of (opcode, argument)
+instructions for a stack machine, and the VM runs them in one dispatch
+loop. Loads, stores, arithmetic, comparisons, jumps, calls, object
+creation and property access have their own instructions; every other
+node is handed to the tree-walking handler through EVAL, so the VM keeps
+the semantics and error messages of Interpreter.
+
+KozakScript functions see their caller's variables, so frames stay the
+name-keyed scopes of core.environment: LOAD_LOCAL reads a parameter the
+resolver placed in the current frame, LOAD_NAME walks the scope chain.
+"""
+import operator
+
+from core.interpreter import Interpreter, ReturnValue, RuntimeErrorKozak
+from core.compiler import may_return
+from core.dialect_messages import DialectMessages
+from core.environment import Scope
+from core.matrix import LIST_TYPES
+from core import oop
+
+from core.ast import (
+    KozakNumber,
+    KozakString,
+    KozakBoolean,
+    KozakVariable,
+    KozakBinOp,
+    KozakComparisonOp,
+    KozakAssign,
+    KozakUnaryOp,
+    KozakIf,
+    KozakWhile,
+    KozakFor,
+    KozakReturn,
+    KozakEcho,
+    KozakArray,
+    KozakDictionaryAccess,
+    KozakFunctionCall,
+    KozakPropertyAccess,
+    KozakPropertyAssign,
+    KozakNewInstance,
+    KozakTypeCast,
+)
+
+
+# Opcodes, roughly in order of how often they run
+LOAD_LOCAL = 0             # node: resolved parameter of the current frame
+LOAD_NAME = 1              # node: variable looked up through the scope chain
+LOAD_CONST = 2             # value
+STORE_NAME = 3             # name
+STORE_TYPED = 4            # (name, type_hint)
+BINARY_ADD = 5
+BINARY_SUB = 6
+BINARY_MUL = 7
+BINARY_MOD = 8
+BINARY_OP = 9              # operator string, see Interpreter._binary_op
+COMPARE_OP = 10            # function of (left, right)
+POP_JUMP_IF_FALSE = 11     # target
+JUMP = 12                  # target
+INCREMENT = 13             # KozakUnaryOp node
+BINARY_SUBSCR = 14
+LOAD_FUNCTION = 15         # KozakFunctionCall node
+CALL_FUNCTION = 16         # (name, argument count)
+CALL_METHOD = 17           # (KozakFunctionCall node, instance name, method name, argument count)
+CALL_BUILTIN = 18          # (bound builtin, KozakFunctionCall node)
+JUMP_IF_STATIC_CALL = 19   # (receiver name, target): module and static calls take the EVAL path
+LOAD_ATTR = 20             # property name
+STORE_ATTR = 21            # KozakPropertyAssign node with a plain property name
+STORE_PROPERTY = 22        # KozakPropertyAssign node whose key is an expression
+LOAD_CLASS = 23            # class name
+JUMP_IF_NO_CONSTRUCTOR = 24  # target
+NEW = 25                   # argument count
+BUILD_LIST = 26            # element count
+CAST = 27                  # target type
+ECHO = 28                  # expression count
+RETURN = 29
+RETURN_IF_SET = 30         # leave the code object if a fallback statement returned
+POP_TOP = 31
+EVAL = 32                  # (handler, node): run a node on the tree-walker
+HALT = 33
+SETUP_RANGE = 34           # (CountedLoop, target): push the loop's range, or jump to the stepping loop
+FOR_RANGE = 35             # (counter name, target): store the next counter value, or jump when done
+SUBSCR_NAME = 36           # node: index the top of the stack by a variable, m[i][j] without loads
+SUBSCR_CONST = 37          # value: index the top of the stack by a literal key
+
+OPCODE_NAMES = {
+    value: name for name, value in globals().items()
+    if name.isupper() and isinstance(value, int)
+}
+
+COMPARISONS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '>': operator.gt,
+    '<=': operator.le,
+    '>=': operator.ge,
+}
+
+ARITHMETIC = {
+    '+': BINARY_ADD,
+    '-': BINARY_SUB,
+    '*': BINARY_MUL,
+    '%': BINARY_MOD,
+}
+
+NUMBER_TYPES = (int, float)
+
+_DONE = object()  # end of a FOR_RANGE iterator
+
+
+def _unknown_comparison(left, right):
+    # Operators the tree-walker does not know evaluate both sides to None
+    return None
+
+
+class Code:
+    """A compiled instruction stream."""
+    __slots__ = ('instructions',)
+
+    def __init__(self, instructions):
+        self.instructions = instructions
+
+    def disassemble(self):
+        """Human-readable listing, one instruction per line."""
+        lines = []
+        for pc, (op, arg) in enumerate(self.instructions):
+            if isinstance(arg, tuple) and arg and callable(arg[0]):
+                arg = arg[1]  # show the node, not the bound handler
+            text = '' if arg is None else repr(arg)
+            if len(text) > 60:
+                text = text[:57] + '...'
+            lines.append(f'{pc:4} {OPCODE_NAMES[op]:<22} {text}')
+        return '\n'.join(lines)
+
+
+class BytecodeCompiler:
+    """Compiles AST nodes and statement lists into Code bound to one interpreter."""
+
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self.cache = {}  # id(node or statement list) -> Code
+        self._nodes = []  # keeps compiled nodes alive so their ids are never reused
+        self._out = None  # instructions of the Code being emitted
+        self._expressions = {
+            KozakNumber: self._emit_literal,
+            KozakString: self._emit_literal,
+            KozakBoolean: self._emit_literal,
+            KozakVariable: self._emit_variable,
+            KozakBinOp: self._emit_binop,
+            KozakComparisonOp: self._emit_comparison,
+            KozakArray: self._emit_array,
+            KozakDictionaryAccess: self._emit_dictionary_access,
+            KozakFunctionCall: self._emit_function_call,
+            KozakPropertyAccess: self._emit_property_access,
+            KozakNewInstance: self._emit_new_instance,
+            KozakTypeCast: self._emit_type_cast,
+        }
+        self._statements = {
+            KozakAssign: self._emit_assign,
+            KozakUnaryOp: self._emit_unary_op,
+            KozakIf: self._emit_if,
+            KozakWhile: self._emit_while,
+            KozakFor: self._emit_for,
+            KozakEcho: self._emit_echo,
+            KozakReturn: self._emit_return,
+            KozakPropertyAssign: self._emit_property_assign,
+        }
+
+    def compile(self, node):
+        """Code that evaluates one node and leaves its value on the stack."""
+        code = self.cache.get(id(node))
+        if code is None:
+            code = self._assemble(self._emit_expression, node)
+            self.cache[id(node)] = code
+            self._nodes.append(node)
+        return code
+
+    def compile_block(self, statements):
+        """Code that runs a statement list, stopping once a statement returns."""
+        code = self.cache.get(id(statements))
+        if code is None:
+            code = self._assemble(self._emit_block, statements)
+            self.cache[id(statements)] = code
+            self._nodes.append(statements)
+        return code
+
+    def _assemble(self, emit, source):
+        outer = self._out
+        self._out = []
+        try:
+            emit(source)
+            self._out.append((HALT, None))
+            return Code(self._out)
+        finally:
+            self._out = outer
+
+    # --- emission helpers ---
+
+    def _emit(self, op, arg=None):
+        self._out.append((op, arg))
+        return len(self._out) - 1
+
+    def _label(self):
+        return len(self._out)
+
+    def _patch(self, index, target):
+        op, _ = self._out[index]
+        self._out[index] = (op, target)
+
+    def _patch_pair(self, index, target):
+        op, (name, _) = self._out[index]
+        self._out[index] = (op, (name, target))
+
+    def _emit_block(self, statements):
+        for stmt in statements:
+            self._emit_statement(stmt)
+
+    def _emit_statement(self, node):
+        emit_node = self._statements.get(node.__class__)
+        if emit_node is not None:
+            emit_node(node)
+            return
+        self._emit_expression(node)
+        self._emit(POP_TOP)
+        if node.__class__ not in self._expressions and may_return([node]):
+            # Try blocks and friends run on the tree-walker and may leave a return pending
+            self._emit(RETURN_IF_SET)
+
+    def _emit_expression(self, node):
+        emit_node = self._expressions.get(node.__class__)
+        if emit_node is not None:
+            emit_node(node)
+        elif node.__class__ in self._statements and node.__class__ is not KozakPropertyAssign:
+            # A statement evaluated on its own (tree-walker handlers return None for these)
+            self._statements[node.__class__](node)
+            self._emit(LOAD_CONST, None)
+        else:
+            self._emit_fallback(node)
+
+    def _emit_fallback(self, node):
+        interpreter = self.interpreter
+        handler = interpreter._handlers.get(node.__class__)
+        if handler is None:
+            # Unknown nodes must fail when executed, exactly like the tree-walker
+            handler = lambda node: Interpreter.eval(interpreter, node)
+        self._emit(EVAL, (handler, node))
+
+    # --- expressions ---
+
+    def _emit_literal(self, node):
+        self._emit(LOAD_CONST, node.value)
+
+    def _emit_variable(self, node):
+        self._emit(LOAD_LOCAL if node.depth == 0 else LOAD_NAME, node)
+
+    def _emit_binop(self, node):
+        self._emit_expression(node.left)
+        self._emit_expression(node.right)
+        op = ARITHMETIC.get(node.op)
+        if op is None:
+            self._emit(BINARY_OP, node.op)
+        else:
+            self._emit(op)
+
+    def _emit_comparison(self, node):
+        self._emit_expression(node.left)
+        self._emit_expression(node.right)
+        self._emit(COMPARE_OP, COMPARISONS.get(node.op, _unknown_comparison))
+
+    def _emit_array(self, node):
+        for element in node.elements:
+            self._emit_expression(element)
+        self._emit(BUILD_LIST, len(node.elements))
+
+    def _emit_dictionary_access(self, node):
+        self._emit_expression(node.dictionary)
+        key = node.key
+        # Plain keys are read by the subscript itself, so each dimension of m[i][j] is one instruction
+        if key.__class__ is KozakVariable:
+            self._emit(SUBSCR_NAME, key)
+        elif key.__class__ in (KozakNumber, KozakString):
+            self._emit(SUBSCR_CONST, key.value)
+        else:
+            self._emit_expression(key)
+            self._emit(BINARY_SUBSCR)
+
+    def _emit_function_call(self, node):
+        interpreter = self.interpreter
+        name = node.name
+
+        # Builtins cannot be redefined, so the call site is bound once
+        builtin = interpreter._builtins.get(name)
+        if builtin is not None:
+            self._emit(CALL_BUILTIN, (builtin, node))
+            return
+
+        if '.' in name:
+            instance_name, method_name = name.split('.', 1)
+            # Module functions and static methods check their target before
+            # evaluating arguments, so they keep the tree-walker's order
+            branch = self._emit(JUMP_IF_STATIC_CALL, (instance_name, None))
+            for argument in node.arguments:
+                self._emit_expression(argument)
+            self._emit(CALL_METHOD, (node, instance_name, method_name, len(node.arguments)))
+            jump = self._emit(JUMP)
+            self._patch_pair(branch, self._label())
+            self._emit_fallback(node)
+            self._patch(jump, self._label())
+            return
+
+        # Checks the function exists and takes this many arguments before they are evaluated
+        self._emit(LOAD_FUNCTION, node)
+        for argument in node.arguments:
+            self._emit_expression(argument)
+        self._emit(CALL_FUNCTION, (name, len(node.arguments)))
+
+    def _emit_property_access(self, node):
+        self._emit_expression(node.instance)
+        self._emit(LOAD_ATTR, node.property_name)
+
+    def _emit_new_instance(self, node):
+        self._emit(LOAD_CLASS, node.class_name)
+        # Arguments are only evaluated when there is a constructor to pass them to
+        skip = self._emit(JUMP_IF_NO_CONSTRUCTOR)
+        for argument in node.arguments:
+            self._emit_expression(argument)
+        self._emit(NEW, len(node.arguments))
+        self._patch(skip, self._label())
+
+    def _emit_type_cast(self, node):
+        self._emit_expression(node.expr)
+        self._emit(CAST, node.target_type)
+
+    # --- statements ---
+
+    def _emit_assign(self, node):
+        self._emit_expression(node.expr)
+        if node.type_hint:
+            self._emit(STORE_TYPED, (node.name, node.type_hint))
+        else:
+            self._emit(STORE_NAME, node.name)
+
+    def _emit_unary_op(self, node):
+        if not isinstance(node.target, KozakVariable) or node.op not in ('++', '--'):
+            self._emit_fallback(node)
+            self._emit(POP_TOP)
+            return
+        self._emit(INCREMENT, node)
+
+    def _emit_if(self, node):
+        exits = []
+        branches = [(node.condition, node.body)] + list(node.else_if_parts)
+        for position, (condition, body) in enumerate(branches, 1):
+            self._emit_expression(condition)
+            skip = self._emit(POP_JUMP_IF_FALSE)
+            self._emit_block(body)
+            if position < len(branches) or node.else_part:
+                exits.append(self._emit(JUMP))
+            self._patch(skip, self._label())
+        if node.else_part:
+            self._emit_block(node.else_part)
+        end = self._label()
+        for jump in exits:
+            self._patch(jump, end)
+
+    def _emit_while(self, node):
+        start = self._label()
+        self._emit_expression(node.condition)
+        exit_jump = self._emit(POP_JUMP_IF_FALSE)
+        self._emit_block(node.body)
+        self._emit(JUMP, start)
+        self._patch(exit_jump, self._label())
+
+    def _emit_for(self, node):
+        self._emit_statement(node.initialization)
+        counted = None
+        if node.counter is not None:
+            # Counted loops run on range() and only take the stepping code below as a fallback
+            counted = self._emit(SETUP_RANGE, (node.counter, None))
+            next_value = self._emit(FOR_RANGE, (node.counter.name, None))
+            self._emit_block(node.body)
+            self._emit(JUMP, next_value)
+            self._patch_pair(counted, self._label())
+        start = self._label()
+        self._emit_expression(node.condition)
+        exit_jump = self._emit(POP_JUMP_IF_FALSE)
+        self._emit_block(node.body)
+        self._emit_statement(node.step)
+        self._emit(JUMP, start)
+        self._patch(exit_jump, self._label())
+        if counted is not None:
+            self._patch_pair(next_value, self._label())
+
+    def _emit_echo(self, node):
+        for expr in node.expressions:
+            self._emit_expression(expr)
+        self._emit(ECHO, len(node.expressions))
+
+    def _emit_return(self, node):
+        if node.value is None:
+            self._emit(LOAD_CONST, None)
+        else:
+            self._emit_expression(node.value)
+        self._emit(RETURN)
+
+    def _emit_property_assign(self, node):
+        self._emit_expression(node.instance)
+        self._emit_expression(node.value)
+        if node.property_name.__class__.__name__.startswith('Kozak'):
+            # The key is evaluated after the target is known to accept it
+            self._emit(STORE_PROPERTY, node)
+        else:
+            self._emit(STORE_ATTR, node)
+
+
+class VirtualMachine(Interpreter):
+    """Interpreter that compiles to bytecode and runs it on a stack machine."""
+
+    def __init__(self, strict_dialect=False, parent_dialect=None):
+        super().__init__(strict_dialect=strict_dialect, parent_dialect=parent_dialect)
+        self.compiler = BytecodeCompiler(self)
+        self._compiled = self.compiler.cache
+
+    def eval(self, node):
+        code = self._compiled.get(id(node))
+        if code is None:
+            code = self.compiler.compile(node)
+        return self._run(code)
+
+    def _execute_block(self, statements):
+        self._run(self.compiler.compile_block(statements))
+
+    def _eval_program(self, node):
+        self._run(self.compiler.compile_block(node.statements))
+        if self._returning:
+            # A return outside any function ends the program as before
+            raise ReturnValue(self._take_return_value())
+
+    def _execute_function_body(self, body, local_env, function_name=None):
+        code = self.compiler.compile_block(body)
+        original_env = self.env
+        original_function = self.current_function
+        # The new frame only holds the parameters; everything else is reached through the chain
+        self.env = Scope(local_env, parent=self.env)
+        self.current_function = function_name
+        try:
+            self._run(code)
+            if self._returning:
+                return self._take_return_value()
+            return None
+        except ReturnValue as e:
+            # Top-level code of a file imported inside the call returned
+            return e.value
+        finally:
+            self.env = original_env
+            self.current_function = original_function
+
+    def _run(self, code):
+        instructions = code.instructions
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        # Calls restore env and current_function before returning, so they are fixed for this run
+        env = self.env
+        in_function = self.current_function
+        pc = 0
+
+        while True:
+            op, arg = instructions[pc]
+            pc += 1
+
+            if op == LOAD_LOCAL:
+                try:
+                    push(env[arg.name])
+                except KeyError:
+                    push(self._eval_variable(arg))
+
+            elif op == LOAD_NAME:
+                try:
+                    push(env[arg.name])
+                except KeyError:
+                    # Unresolved names that are not variables may be function references
+                    function = self.functions.get(arg.name)
+                    push(function if function is not None else self._eval_variable(arg))
+
+            elif op == LOAD_CONST:
+                push(arg)
+
+            elif op == STORE_NAME:
+                if in_function or arg in self.type_constraints:
+                    self._assign_variable(arg, pop())
+                else:
+                    env[arg] = pop()
+
+            elif op == BINARY_ADD:
+                right = pop()
+                left = pop()
+                if left.__class__ in NUMBER_TYPES and right.__class__ in NUMBER_TYPES:
+                    push(left + right)
+                else:
+                    push(self._binary_op('+', left, right))
+
+            elif op == COMPARE_OP:
+                right = pop()
+                stack[-1] = arg(stack[-1], right)
+
+            elif op == POP_JUMP_IF_FALSE:
+                if not pop():
+                    pc = arg
+
+            elif op == JUMP:
+                pc = arg
+
+            elif op == INCREMENT:
+                name = arg.target.name
+                try:
+                    value = env[name]
+                except KeyError:
+                    value = None
+                if value.__class__ not in NUMBER_TYPES:
+                    # Undefined and non-numeric variables raise the usual errors
+                    self._eval_unary_op(arg)
+                else:
+                    env[name] = value + 1 if arg.op == '++' else value - 1
+
+            elif op == FOR_RANGE:
+                value = next(stack[-1], _DONE)
+                if value is _DONE:
+                    pop()
+                    env[arg[0]] = self._counter_after(pop())
+                    pc = arg[1]
+                else:
+                    env[arg[0]] = value
+
+            elif op == BINARY_SUB:
+                right = pop()
+                left = stack[-1]
+                if left.__class__ in NUMBER_TYPES and right.__class__ in NUMBER_TYPES:
+                    stack[-1] = left - right
+                else:
+                    stack[-1] = self._binary_op('-', left, right)
+
+            elif op == BINARY_MUL:
+                right = pop()
+                left = stack[-1]
+                if left.__class__ in NUMBER_TYPES and right.__class__ in NUMBER_TYPES:
+                    stack[-1] = left * right
+                else:
+                    stack[-1] = self._binary_op('*', left, right)
+
+            elif op == BINARY_SUBSCR:
+                index = pop()
+                target = stack[-1]
+                if target.__class__ in LIST_TYPES and index.__class__ is int and 0 <= index < len(target):
+                    stack[-1] = target[index]
+                else:
+                    stack[-1] = self._index_value(target, index)
+
+            elif op == SUBSCR_NAME:
+                try:
+                    index = env[arg.name]
+                except KeyError:
+                    index = self._eval_variable(arg)
+                target = stack[-1]
+                if target.__class__ in LIST_TYPES and index.__class__ is int and 0 <= index < len(target):
+                    stack[-1] = target[index]
+                else:
+                    stack[-1] = self._index_value(target, index)
+
+            elif op == SUBSCR_CONST:
+                target = stack[-1]
+                if target.__class__ in LIST_TYPES and arg.__class__ is int and 0 <= arg < len(target):
+                    stack[-1] = target[arg]
+                else:
+                    stack[-1] = self._index_value(target, arg)
+
+            elif op == LOAD_FUNCTION:
+                func_def = self.functions.get(arg.name)
+                if not func_def:
+                    raise RuntimeErrorKozak(f"Function '{arg.name}' is not defined.")
+                if len(arg.arguments) != len(func_def.parameters):
+                    raise RuntimeErrorKozak(f"Function '{arg.name}' expected {len(func_def.parameters)} arguments, but got {len(arg.arguments)}.")
+                push(func_def)
+
+            elif op == CALL_FUNCTION:
+                name, count = arg
+                if count:
+                    arguments = stack[-count:]
+                    del stack[-count:]
+                else:
+                    arguments = ()
+                func_def = pop()
+                push(self._execute_function_body(
+                    func_def.body, dict(zip(func_def.parameters, arguments)), name))
+
+            elif op == RETURN:
+                self._return_value = pop()
+                self._returning = True
+                return None
+
+            elif op == POP_TOP:
+                pop()
+
+            elif op == LOAD_ATTR:
+                stack[-1] = self._get_property(stack[-1], arg)
+
+            elif op == STORE_ATTR:
+                value = pop()
+                target = pop()
+                name = arg.property_name
+                if isinstance(target, dict):
+                    target[name] = value
+                elif isinstance(target, oop.Instance) and name.__class__ is str:
+                    self._set_field(target, name, value)
+                else:
+                    self._assign_property(arg, target, value)
+
+            elif op == STORE_PROPERTY:
+                value = pop()
+                self._assign_property(arg, pop(), value)
+
+            elif op == CALL_METHOD:
+                node, instance_name, method_name, count = arg
+                if count:
+                    arguments = stack[-count:]
+                    del stack[-count:]
+                else:
+                    arguments = []
+                push(self._call_method(node, instance_name, method_name, arguments))
+
+            elif op == JUMP_IF_STATIC_CALL:
+                name, target = arg
+                if name in self.modules or name in self.class_table.classes:
+                    pc = target
+
+            elif op == CALL_BUILTIN:
+                builtin, node = arg
+                push(builtin(node))
+
+            elif op == ECHO:
+                if arg:
+                    values = stack[-arg:]
+                    del stack[-arg:]
+                else:
+                    values = []
+                for i, value in enumerate(values):
+                    if isinstance(value, bool):
+                        values[i] = DialectMessages.get_boolean_string(value, self.parent_dialect)
+                print(*values)
+
+            elif op == BINARY_MOD:
+                right = pop()
+                stack[-1] = stack[-1] % right
+
+            elif op == BINARY_OP:
+                right = pop()
+                stack[-1] = self._binary_op(arg, stack[-1], right)
+
+            elif op == BUILD_LIST:
+                if arg:
+                    elements = stack[-arg:]
+                    del stack[-arg:]
+                else:
+                    elements = []
+                push(elements)
+
+            elif op == LOAD_CLASS:
+                class_def = self.class_table.get_class(arg)
+                if class_def is None:
+                    raise RuntimeErrorKozak(f"Class '{arg}' not defined")
+                push(class_def)
+
+            elif op == JUMP_IF_NO_CONSTRUCTOR:
+                class_def = stack[-1]
+                if not self._constructor_of(class_def):
+                    stack[-1] = oop.Instance(class_def)
+                    pc = arg
+
+            elif op == NEW:
+                if arg:
+                    arguments = stack[-arg:]
+                    del stack[-arg:]
+                else:
+                    arguments = []
+                class_def = pop()
+                push(self._construct(class_def, arguments))
+
+            elif op == CAST:
+                stack[-1] = self._cast_value(arg, stack[-1])
+
+            elif op == STORE_TYPED:
+                name, type_hint = arg
+                self._assign_variable(name, pop(), type_hint)
+
+            elif op == SETUP_RANGE:
+                values = self._counted_range(arg[0])
+                if values is None:
+                    pc = arg[1]
+                else:
+                    push(values)
+                    push(iter(values))
+
+            elif op == RETURN_IF_SET:
+                if self._returning:
+                    return None
+
+            elif op == EVAL:
+                handler, node = arg
+                push(handler(node))
+
+            elif op == HALT:
+                return pop() if stack else None
+
+            else:
+                raise RuntimeErrorKozak(f'Unknown opcode: {op}')
+
+    def _constructor_of(self, class_def):
+        constructor_def = class_def.constructor
+        if not constructor_def and class_def.parent_class:
+            constructor_def = class_def.parent_class.constructor
+        return constructor_def
+
+    def _construct(self, class_def, arguments):
+        """Create an instance and run its constructor with evaluated arguments."""
+        instance = oop.Instance(class_def)
+        constructor_def = self._constructor_of(class_def)
+
+        if len(arguments) != len(constructor_def.parameters):
+            raise RuntimeErrorKozak(f"Constructor for class '{class_def.name}' expected {len(constructor_def.parameters)} arguments, but got {len(arguments)}.")
+
+        local_env = {"this": instance}
+        for param, arg_val in zip(constructor_def.parameters, arguments):
+            local_env[param] = arg_val
+
+        self._execute_function_body(constructor_def.body, local_env, function_name='Tvir')
+        return instance
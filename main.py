@@ -7,12 +7,20 @@ import re
 import argparse
 import json
 import tempfile
-from core.lexer import lex
-from core.parser import Parser
 from core.interpreter import Interpreter
 from core.interpreter import RuntimeErrorKozak, ProgramExit
 from core.dialect_messages import DialectMessages
-from core.interpreter import DialectChecker
+from core.ast_cache import ParsedProgram, load_program, parse_program
+from core.compiler import ClosureInterpreter
+from core.vm import VirtualMachine
+
+
+# Execution engines selectable with --engine
+ENGINES = {
+    'tree': Interpreter,
+    'closure': ClosureInterpreter,
+    'vm': VirtualMachine,
+}
 
 
 
@@ -131,45 +139,54 @@ def print_with_hint(err: str):
             break
 
 
-def run_code(code, strict_dialect=False, data_dir=None):
-    """Execute KozakScript code"""
+def _failed_parse(error):
+    """Stand-in program for a source whose parse raised, keeping the dialect seen so far"""
+    return ParsedProgram(None, getattr(error, 'detected_dialect', None), [], [], [])
+
+
+def run_code(code, strict_dialect=False, data_dir=None, engine='tree', source_path=None, use_cache=True):
+    """Execute KozakScript code; source_path enables the on-disk AST cache"""
     
     exit_code = 0
+    program = None
+    interpreter = None
     
     original_dir = os.getcwd()
     if data_dir:
         os.chdir(data_dir)
     
     try:
-        tokens = list(lex(code))
-        kozak_parser = Parser(tokens, strict_dialect=strict_dialect)  
-        ast = kozak_parser.parse()
+        if source_path and use_cache:
+            program = load_program(source_path, code, strict_dialect=strict_dialect, check_dialect=True)
+        else:
+            program = parse_program(code, strict_dialect=strict_dialect, check_dialect=True)
+        ast = program.ast
         
         # ✅ Check for parser errors first
-        if kozak_parser.errors:
+        if program.errors:
             error_header = DialectMessages.get_message(
                 'ERROR_HEADERS', 
-                kozak_parser.detected_dialect or 'english'
+                program.detected_dialect or 'english'
             )
             print(error_header)
             
-            for e in kozak_parser.errors:
+            for e in program.errors:
                 err = str(e)
                 print_with_hint(err)
 
-            if strict_dialect and kozak_parser.dialect_violations:
-                print(f"\n🚫 Dialect Enforcement: Found {len(kozak_parser.dialect_violations)} violation(s)")
-                print(f"   Detected dialect: {kozak_parser.detected_dialect}")
+            if strict_dialect and program.dialect_violations:
+                print(f"\n🚫 Dialect Enforcement: Found {len(program.dialect_violations)} violation(s)")
+                print(f"   Detected dialect: {program.detected_dialect}")
                 
-                if kozak_parser.detected_dialect == 'ukrainian_latin':
+                if program.detected_dialect == 'ukrainian_latin':
                     print("   Govory odnieyu movoyu, kozache! Nichogo ne rozumiyu!")
-                elif kozak_parser.detected_dialect == 'ukrainian_cyrillic':
+                elif program.detected_dialect == 'ukrainian_cyrillic':
                     print("   Говори однією мовою, козаче! Нічого не розумію!")
-                elif kozak_parser.detected_dialect == 'russian_latin':
+                elif program.detected_dialect == 'russian_latin':
                     print("   Govori na odnom yazyke, tovarisch! Nichego ne ponimayu!")
-                elif kozak_parser.detected_dialect == 'russian_cyrillic':
+                elif program.detected_dialect == 'russian_cyrillic':
                     print("   Говори на одном языке, товарищ! Ничего не понимаю")
-                elif kozak_parser.detected_dialect == 'symbolic':
+                elif program.detected_dialect == 'symbolic':
                     print("   PROTOCOL_VIOLATION: Mixed dialect tokens detected")
                 else:
                     print("   Speak one language, pal! I don't understand!")
@@ -179,45 +196,43 @@ def run_code(code, strict_dialect=False, data_dir=None):
             return 1, None  # ✅ Return dialect info
         
         # No errors, continue
-        if strict_dialect and kozak_parser.detected_dialect:
+        if strict_dialect and program.detected_dialect:
             startup_msg = DialectMessages.get_message(
                 'STARTUP_MESSAGES',
-                kozak_parser.detected_dialect
+                program.detected_dialect
             )
             print(startup_msg)
 
-        interpreter = Interpreter(
+        interpreter = ENGINES[engine](
             strict_dialect=strict_dialect,
-            parent_dialect=kozak_parser.detected_dialect
+            parent_dialect=program.detected_dialect
         )
         
         interpreter.current_file_dir = data_dir if data_dir else os.getcwd()
+        interpreter.use_ast_cache = use_cache
         
-        if kozak_parser.detected_dialect:
-            checker = DialectChecker(kozak_parser.detected_dialect)
-            checker.check(ast)
-            if checker.errors:
-                error_header = DialectMessages.get_message(
-                    'ERROR_HEADERS',
-                    kozak_parser.detected_dialect
-                )
-                print(error_header)
-                for err in checker.errors:
-                    print_with_hint(err)
-                return 1, kozak_parser.detected_dialect
+        if program.dialect_errors:
+            error_header = DialectMessages.get_message(
+                'ERROR_HEADERS',
+                program.detected_dialect
+            )
+            print(error_header)
+            for err in program.dialect_errors:
+                print_with_hint(err)
+            return 1, program.detected_dialect
         try:
             interpreter.eval(ast)
             exit_code = interpreter.exit_code
             
             success_msg = DialectMessages.get_message(
                 'SUCCESS_MESSAGES',
-                kozak_parser.detected_dialect or 'english'
+                program.detected_dialect or 'english'
             )
             print(f"\n{success_msg}")
             
             exit_msg = DialectMessages.get_message(
                 'EXIT_MESSAGES',
-                kozak_parser.detected_dialect or 'english',
+                program.detected_dialect or 'english',
                 code=exit_code
             )
             print(exit_msg)
@@ -226,20 +241,22 @@ def run_code(code, strict_dialect=False, data_dir=None):
             exit_code = e.code
             exit_msg = DialectMessages.get_message(
                 'EXIT_MESSAGES',
-                kozak_parser.detected_dialect or 'english',
+                program.detected_dialect or 'english',
                 code=exit_code
             )
             print(f"\n{exit_msg}")
             
     except RuntimeErrorKozak as e:
+        program = program or _failed_parse(e)
         error_header = DialectMessages.get_message(
             'ERROR_HEADERS',
-            getattr(kozak_parser, 'detected_dialect', None) or 'english'
+            program.detected_dialect or 'english'
         )
         print(error_header)
         print_with_hint(str(e))
         exit_code = 1
     except Exception as e:
+        program = program or _failed_parse(e)
         if detected_dialect == 'ukrainian_latin':
             print("Neperedbachena bida, kozache! An unexpected error occurred:")
         elif detected_dialect == 'russian_latin':
@@ -255,11 +272,13 @@ def run_code(code, strict_dialect=False, data_dir=None):
         print_with_hint(str(e))
         exit_code = 1
     finally:
+        if interpreter is not None:
+            interpreter.close_files()
         if data_dir:
             os.chdir(original_dir)
     
     # ✅ Return both exit code and detected dialect
-    detected = getattr(kozak_parser, 'detected_dialect', None) if 'kozak_parser' in locals() else None
+    detected = program.detected_dialect if program else None
     return exit_code, detected
 
 
@@ -291,11 +310,18 @@ Examples:
   python main.py program.kozak                  # Run with dialect mixing allowed
   python main.py program.kozak --strict         # Enforce single dialect
   python main.py program.kozak -s               # Short form
+  python main.py program.kozak --engine=closure # Run on the closure compiler
+  python main.py program.kozak --engine=vm      # Run on the bytecode VM
+  python main.py program.kozak --no-cache       # Parse again, ignoring __kozakcache__
         '''
     )
     arg_parser.add_argument('file', help='KozakScript file to execute (.kozak extension)')
     arg_parser.add_argument('--skip-strict', '-s', action='store_true',
                        help='Skip strict dialect mode (allow mixing dialects)')
+    arg_parser.add_argument('--engine', choices=sorted(ENGINES), default='tree',
+                       help='Execution engine: tree-walking interpreter (default), closure compiler or bytecode VM')
+    arg_parser.add_argument('--no-cache', action='store_true',
+                       help='Do not read or write parsed programs in __kozakcache__')
     
     args = arg_parser.parse_args()
     exit_code = 0
@@ -336,7 +362,8 @@ Examples:
         with open(file_path, 'r', encoding="utf-8") as f:
             code = f.read()
 
-        exit_code, detected_dialect = run_code(code, strict_dialect=not args.skip_strict)
+        exit_code, detected_dialect = run_code(code, strict_dialect=not args.skip_strict, engine=args.engine,
+                                               source_path=file_path, use_cache=not args.no_cache)
             
     except FileNotFoundError as e:
         exit_code = 1